@@ -0,0 +1,376 @@
+"""
+Module providing the framework benchmark suite and its regression gate.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+import selenium
+from selenium.webdriver.common.by import By
+
+from benchmarks.fixture_site import FixtureSite
+from config import config
+from drivers.browser_factory import BrowserFactory
+from pages.base_page import BasePage
+from pages.home_page import HomePage
+from pages.search_page import SearchPage
+from pages.streamer_page import StreamerPage
+from utilities import utils
+from utilities.element_cache import ElementCache
+from utilities.logger import Logger
+from utilities.screenshot_writer import ScreenshotWriter
+
+LOGGING_CALLS = 10000
+
+
+class BenchmarkRunner:
+    """
+    Measures how fast the framework itself is, against the local fixture site so the
+    network and the application under test do not add noise.
+
+    Five groups of metrics are recorded, each as the median and p95 of several runs:
+    driver startup per browser and option set (`startup.<browser>.<option set>`),
+    BasePage primitives (`primitive.<browser>.<action>`), the search, select and
+    screenshot flow (`flow.<browser>.search_select_screenshot`), the same flow with
+    animations running and frozen (`freeze.<browser>.<mode>`) and the overhead of
+    `utilities.logger` (`logging.<case>`).
+
+    Attributes:
+        browsers (List[str]): The browser names to benchmark.
+        runs (int): The number of measured repetitions of each metric.
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, browsers: List[str], runs: int = config.BENCHMARK_RUNS) -> None:
+        self.browsers = browsers
+        self.runs = runs
+        self.metrics: Dict[str, Dict[str, Any]] = {}
+        self.browser_versions: Dict[str, str] = {}
+        self._site = None
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Runs every benchmark. The performance metrics the page objects collect on the
+        fixture site go to the results directory, not to `config.PERFORMANCE_HISTORY`.
+
+        Returns:
+            dict: The "environment" metadata and the "metrics" of the run.
+        """
+        history = config.PERFORMANCE_HISTORY
+        config.PERFORMANCE_HISTORY = f"{config.BENCHMARK_RESULTS_DIR}/performance.jsonl"
+        self._site = FixtureSite.start()
+        try:
+            for browser_name in self.browsers:
+                self.bench_startup(browser_name)
+                self.bench_primitives(browser_name)
+                self.bench_flow(browser_name)
+                self.bench_freeze(browser_name)
+            self.bench_logging()
+        finally:
+            self._site.stop()
+            config.PERFORMANCE_HISTORY = history
+        return {"environment": self.environment(), "metrics": self.metrics}
+
+    def bench_startup(self, browser_name: str) -> None:
+        """
+        Measures `get_driver()` of a browser class for each of its option sets in
+        `config.BENCHMARK_OPTION_SETS`.
+
+        Args:
+            browser_name (str): The browser to start.
+        """
+        for set_name, options in self._option_sets(browser_name).items():
+            def start_and_quit() -> float:
+                start = time.perf_counter()
+                driver = self._new_driver(browser_name, options)
+                elapsed = time.perf_counter() - start
+                self.browser_versions[browser_name] = driver.capabilities.get("browserVersion")
+                driver.quit()
+                return elapsed
+
+            self._record(f"startup.{browser_name}.{set_name}", "ms",
+                         [start_and_quit() * 1000 for _ in range(self.runs)])
+
+    def bench_primitives(self, browser_name: str) -> None:
+        """
+        Measures the BasePage primitives on the fixture home page. `find` resolves the
+        element each time, `find_cached` is served by the element cache.
+
+        Args:
+            browser_name (str): The browser to run the primitives with.
+        """
+        driver = self._new_driver(browser_name, self._primitive_options(browser_name))
+        try:
+            driver.get(self._site.url)
+            page = BasePage(driver)
+            message = (By.ID, "message")
+            noop = (By.ID, "noop")
+            search_input = (By.CSS_SELECTOR, "[aria-label='Search']")
+            screenshot_dir = tempfile.mkdtemp(prefix="wap-benchmark-")
+
+            def find() -> None:
+                ElementCache.mark_navigation(driver)
+                page.find_element(message)
+
+            actions: Dict[str, Callable[[], Any]] = {
+                "find": find,
+                "find_cached": lambda: page.find_element(message),
+                "click": lambda: page.click(noop),
+                "send_keys": lambda: page.send_keys(search_input, "StarCraft II"),
+                "get_text": lambda: page.get_text(message),
+                "scroll": page.scroll_down,
+                "screenshot": lambda: page.take_screenshot(
+                    f"{screenshot_dir}/primitive.png").result(),
+            }
+            for action_name, action in actions.items():
+                action()
+                self._record(f"primitive.{browser_name}.{action_name}", "ms",
+                             [self._time_ms(action) for _ in range(self.runs)])
+        finally:
+            driver.quit()
+
+    def bench_flow(self, browser_name: str) -> None:
+        """
+        Measures the search, select and screenshot flow of the test suite on the fixture
+        site, from loading the home page to the written screenshot.
+
+        Args:
+            browser_name (str): The browser to run the flow with.
+        """
+        driver = self._new_driver(browser_name, self._primitive_options(browser_name))
+        screenshot_path = f"{tempfile.mkdtemp(prefix='wap-benchmark-')}/streamer.png"
+        try:
+            self._record(f"flow.{browser_name}.search_select_screenshot", "ms",
+                         [self._time_ms(lambda: self._run_flow(driver, screenshot_path))
+                          for _ in range(self.runs)])
+        finally:
+            driver.quit()
+
+    def bench_freeze(self, browser_name: str) -> None:
+        """
+        Measures the wait time saved by the animation freeze mode: the flow with the
+        fixture site's fades and slides running and frozen.
+
+        Args:
+            browser_name (str): The browser to run the flow with.
+        """
+        screenshot_path = f"{tempfile.mkdtemp(prefix='wap-benchmark-')}/streamer.png"
+        samples = {}
+        for mode, freeze in (("animated", False), ("frozen", True)):
+            driver = self._new_driver(browser_name, self._primitive_options(browser_name),
+                                      freeze_animations=freeze)
+            try:
+                samples[mode] = [self._time_ms(lambda: self._run_flow(driver, screenshot_path))
+                                 for _ in range(self.runs)]
+                self._record(f"freeze.{browser_name}.{mode}_flow", "ms", samples[mode])
+            finally:
+                driver.quit()
+        # Logged rather than recorded: a larger saving must not count as a regression.
+        self.logger.info("Freeze mode saved a median of %.1fms per %s flow",
+                         statistics.median(samples["animated"]) -
+                         statistics.median(samples["frozen"]), browser_name)
+
+    def bench_logging(self) -> None:
+        """
+        Measures `utilities.logger`: the cost of an enabled and of a disabled call on
+        the caller's thread, and the time the writer thread needs to drain them to disk.
+        """
+        bench_logger = Logger("benchmarks.logging")
+
+        def calls(method: Callable[..., None]) -> float:
+            start = time.perf_counter()
+            for index in range(LOGGING_CALLS):
+                method("Benchmark record %s with locator %s", index, ("css selector", "#id"))
+            return (time.perf_counter() - start) / LOGGING_CALLS * 1e6
+
+        Logger.flush()
+        enabled, drained = [], []
+        for _ in range(self.runs):
+            enabled.append(calls(bench_logger.info))
+            drained.append(self._time_ms(Logger.flush))
+        self._record("logging.enabled_call", "us", enabled)
+        self._record("logging.flush_10k_records", "ms", drained)
+
+        bench_logger.logger.setLevel(logging.WARNING)
+        try:
+            self._record("logging.disabled_call", "us",
+                         [calls(bench_logger.debug) for _ in range(self.runs)])
+        finally:
+            bench_logger.logger.setLevel(config.LOG_LEVEL)
+
+    def environment(self) -> Dict[str, Any]:
+        """
+        Returns the metadata needed to tell whether two runs are comparable.
+
+        Returns:
+            dict: The time, commit, interpreter, platform and library and browser versions.
+        """
+        try:
+            commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                    cwd=utils.get_root_path(), capture_output=True,
+                                    text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "commit": commit,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "selenium": selenium.__version__,
+            "browsers": self.browser_versions,
+            "runs": self.runs,
+        }
+
+    def _new_driver(self, browser_name: str, options: List[str],
+                    freeze_animations: bool = None) -> Any:
+        """
+        Starts a driver without a profile template, so every run starts cold, with the
+        configured freeze mode unless `freeze_animations` is given.
+        """
+        browser = BrowserFactory.get_browser(browser_name, options)
+        browser.use_profile_template = False
+        if freeze_animations is not None:
+            browser.freeze_animations = freeze_animations
+        return browser.get_driver()
+
+    def _run_flow(self, driver: Any, screenshot_path: str) -> None:
+        """
+        Runs the search, select and screenshot flow of the test suite on the fixture site.
+        """
+        driver.get(self._site.url)
+        HomePage(driver).click_on_search()
+        search_page = SearchPage(driver)
+        search_page.search("StarCraft II")
+        search_page.click_on_menu("Channels")
+        search_page.load_more_streamers(max_scrolls=2)
+        search_page.select_streamer_randomly()
+        streamer_page = StreamerPage(driver)
+        streamer_page.is_loaded()
+        streamer_page.take_screenshot(screenshot_path).result()
+
+    @staticmethod
+    def _option_sets(browser_name: str) -> Dict[str, List[str]]:
+        """
+        Returns the option sets of a browser, or its configured options as the only set.
+        """
+        return config.BENCHMARK_OPTION_SETS.get(browser_name,
+                                                {"default": config.BROWSER_OPTIONS})
+
+    def _primitive_options(self, browser_name: str) -> List[str]:
+        """
+        Returns the first option set of a browser, used for the primitives and the flow.
+        """
+        return next(iter(self._option_sets(browser_name).values()))
+
+    @staticmethod
+    def _time_ms(action: Callable[[], Any]) -> float:
+        """
+        Returns the time, in milliseconds, a single call of the action took.
+        """
+        start = time.perf_counter()
+        action()
+        return (time.perf_counter() - start) * 1000
+
+    def _record(self, name: str, unit: str, samples: List[float]) -> None:
+        """
+        Stores the median and p95 of the samples of a metric.
+        """
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+        self.metrics[name] = {"median": statistics.median(ordered), "p95": p95,
+                              "unit": unit, "samples": len(ordered)}
+        self.logger.info("Benchmark %s: median %.3f%s, p95 %.3f%s",
+                         name, self.metrics[name]["median"], unit, p95, unit)
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any],
+            threshold: float = config.BENCHMARK_THRESHOLD) -> List[str]:
+    """
+    Compares the medians of a run with a baseline run.
+
+    Args:
+        results (dict): The run, as returned by `BenchmarkRunner.run`.
+        baseline (dict): The baseline run.
+        threshold (float): The slowdown, in percent, above which a metric regressed.
+
+    Returns:
+        List[str]: A description of every regressed metric. Metrics missing from
+        either run are not compared.
+    """
+    regressions = []
+    for name, metric in sorted(results["metrics"].items()):
+        base = baseline.get("metrics", {}).get(name)
+        if not base or not base["median"]:
+            continue
+        change = (metric["median"] / base["median"] - 1) * 100
+        if change > threshold:
+            regressions.append(f"{name}: {base['median']:.3f}{metric['unit']} -> "
+                               f"{metric['median']:.3f}{metric['unit']} (+{change:.1f}%)")
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Runs the benchmarks, writes the results and applies the regression gate.
+
+    Returns:
+        int: 1 if a metric regressed past the threshold, 2 if there is no baseline to
+        compare with (unless `--allow-missing-baseline`), otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the test framework.")
+    parser.add_argument("browsers", nargs="*", default=[config.BROWSER],
+                        help="Browser names (chrome, firefox, edge).")
+    parser.add_argument("--runs", type=int, default=config.BENCHMARK_RUNS,
+                        help="Measured repetitions of each metric.")
+    parser.add_argument("--threshold", type=float, default=config.BENCHMARK_THRESHOLD,
+                        help="Slowdown in percent that fails the run.")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Store this run as the new baseline instead of comparing.")
+    parser.add_argument("--allow-missing-baseline", action="store_true",
+                        help="Pass the gate when no baseline has been recorded yet.")
+    args = parser.parse_args(argv)
+
+    results = BenchmarkRunner(args.browsers, args.runs).run()
+    ScreenshotWriter.shutdown()
+
+    root = utils.get_root_path()
+    results_dir = f"{root}/{config.BENCHMARK_RESULTS_DIR}"
+    os.makedirs(results_dir, exist_ok=True)
+    results_file = f"{results_dir}/{time.strftime('%Y%m%d-%H%M%S')}.json"
+    with open(results_file, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+    print(f"Results written to {results_file}")
+
+    baseline_file = f"{root}/{config.BENCHMARK_BASELINE}"
+    if args.update_baseline:
+        with open(baseline_file, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+        print(f"Baseline updated: {baseline_file}")
+        return 0
+    try:
+        with open(baseline_file, encoding="utf-8") as file:
+            baseline = json.load(file)
+    except OSError:
+        print(f"No baseline at {baseline_file}, run with --update-baseline to create it.")
+        return 0 if args.allow_missing_baseline else 2
+
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print(f"No metric regressed more than {args.threshold:.0f}% against the baseline.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""
+Module providing the local static site the benchmarks run against.
+"""
+import functools
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from utilities.logger import Logger
+
+SITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "site")
+
+
+class QuietRequestHandler(SimpleHTTPRequestHandler):
+    """
+    Serves the fixture files without printing a line per request.
+    """
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+        pass
+
+
+class FixtureSite(ThreadingHTTPServer):
+    """
+    A static HTTP server for `benchmarks/site` on a free local port, running on a
+    daemon thread.
+
+    Usage:
+        site = FixtureSite.start()
+        driver.get(site.url)
+        site.stop()
+    """
+    logger = Logger(__name__)
+    daemon_threads = True
+
+    @classmethod
+    def start(cls) -> "FixtureSite":
+        """
+        Starts serving the fixture site.
+
+        Returns:
+            FixtureSite: The running server.
+        """
+        handler = functools.partial(QuietRequestHandler, directory=SITE_DIR)
+        site = cls(("127.0.0.1", 0), handler)
+        threading.Thread(target=site.serve_forever, daemon=True).start()
+        cls.logger.info("Fixture site serving %s at %s", SITE_DIR, site.url)
+        return site
+
+    @property
+    def url(self) -> str:
+        """
+        Returns the URL of the fixture's index page.
+        """
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/index.html"
+
+    def stop(self) -> None:
+        """
+        Stops the server and releases its port.
+        """
+        self.shutdown()
+        self.server_close()
@@ -2,7 +2,12 @@
 """
 A configuration class for setting up the browser and test environment.
 
-BROWSER (str): The browser to be used for running tests. Default is "chrome".
+These are the defaults. Every setting can be overridden by `config/settings.json` (or the
+file named by WAP_CONFIG_FILE), by a `WAP_<NAME>` environment variable and by the pytest
+option `--setting NAME=VALUE`, in that order (see config/loader.py).
+
+BROWSER (str): The browser to be used for running tests ("chrome", "chrome-contexts",
+                    "firefox", "edge" or "remote"). Default is "chrome".
 URL (str): The base URL of the application under test. Default is the Twitch mobile site.
 BROWSER_OPTIONS (list): A list of additional options for configuring Chrome browser behavior. 
                         Default is an empty list. (e.g. ["mobileEmulation", "--headless"])
@@ -13,8 +18,173 @@ IMPLICIT_WAIT (int): The time (in seconds) to wait for elements to be found impl
 EXPLICIT_WAIT (int): The time (in seconds) to wait for elements to be found explicitly 
                         using WebDriverWait. Default is 10 seconds.
 LOG_LEVEL (str): The level of logging to be used (e.g., DEBUG, INFO). Default is "DEBUG".
-LOG_NAME (str): The name of the log file.
+LOG_NAME (str): The name of the log file. Each worker writes `<name stem>.<worker>.jsonl`.
+LOG_FORMAT (str): "json" for one structured JSON record per line (time, worker, test,
+                    method, locator, duration, message), or "text" for human-formatted
+                    lines. Default is "json".
+LOG_MAX_BYTES (int): The size (in bytes) at which a log file is rotated. Default is 10 MB.
+LOG_BACKUP_COUNT (int): The number of gzip-compressed rotated parts kept per worker.
+                    Default is 5.
+MAX_SCROLLS (int): The maximum number of scrolls performed while loading more results of
+                    an infinite list. Default is 10.
+WAIT_BACKEND (str): How BasePage waits for element conditions. "polling" polls the driver
+                    with WebDriverWait, "script" evaluates the condition inside the browser
+                    with a single asynchronous script call. Default is "polling".
+ELEMENT_CACHE (bool): Whether page objects reuse resolved elements until the next
+                    navigation instead of resolving the same locator again. Default is True.
+PAGE_READY_TIMEOUT (int): The ceiling (in seconds) for waiting until the page is stable
+                    (no pending requests and no DOM changes). Default is 10 seconds.
+PAGE_QUIET_WINDOW (int): The time (in milliseconds) without network or DOM activity after
+                    which the page is considered stable. Default is 500 milliseconds.
+FREEZE_ANIMATIONS (bool): Whether every document starts with CSS animations, transitions,
+                    Web Animations and smooth scrolling disabled and reduced motion
+                    preferred, so waits do not sit out fades and spinners. Default is False.
+FREEZE_PAUSE_MEDIA (bool): Whether the freeze mode also keeps audio and video from
+                    autoplaying (e.g. the stream player). Default is False.
+COMMAND_TRACING (bool): Whether every WebDriver command is timed and a per-test latency
+                    report is written and attached to Allure. Default is True.
+TRACE_DIR (str): The directory, relative to the project root, where the per-test latency
+                    reports are written as JSON. Default is "logs/latency".
+DRIVER_CACHE (bool): Whether driver and browser binaries are resolved once per machine and
+                    passed to each session explicitly. Default is True.
+DRIVER_CACHE_DIR (str): The directory of the resolved binary paths cache.
+DRIVER_OFFLINE (bool): Whether discovery is never run, failing fast when no cached binary
+                    exists. Default is False.
+PROFILE_TEMPLATES (bool): Whether each browser session starts from a copy of a pre-warmed
+                    profile template that already visited URL. Default is False.
+PROFILE_TEMPLATE_DIR (str): The directory, relative to the project root, of the templates.
+PROFILE_TEMPLATE_MAX_AGE (int): The age (in hours) after which a template is rebuilt.
+                    Default is 24 hours.
+SCREENSHOT_WORKERS (int): The number of background threads writing screenshots. Default is 2.
+SCREENSHOT_QUEUE_SIZE (int): The maximum number of screenshots waiting to be written before
+                    taking a new one blocks. Default is 8.
+BLOCKING_PROFILE (str): The request blocking profile applied when a driver is created, one
+                    of the keys of BLOCKING_PROFILES. Default is "minimal".
+BLOCKING_PROFILES (dict): The URL patterns blocked by each profile. "minimal" blocks ads
+                    and analytics beacons, "no-media" also blocks video, "full" also blocks
+                    images.
+BLOCKING_STATS (bool): Whether Chrome and Edge record the performance log so the request
+                    blocker can count blocked requests, the bytes they saved (estimated)
+                    and transferred bytes per test. Without it only the transferred bytes
+                    of Resource Timing are reported.
+                    Default is False.
+NETWORK_MODE (str): "live" to use the real site, "record" to capture the HTTP traffic of
+                    the run into the archive, or "replay" to serve the archive from a local
+                    proxy without network access. Default is "live".
+ARCHIVE_PATH (str): The directory, relative to the project root, of the traffic archive.
+REPLAY_IGNORED_QUERY_PARAMS (list): Query parameters ignored when matching requests
+                    (e.g. cache busters).
+REPLAY_IGNORED_BODY_KEYS (list): JSON body keys ignored when matching requests
+                    (e.g. per-request ids of API calls).
+REPLAY_LOOSE_MATCH (bool): Whether a request without an exact match is answered with a
+                    recording of the same method, host and path. Default is True.
+SCHEDULE_BY_DURATION (bool): Whether pytest-xdist hands out tests longest-first from the
+                    duration history. Default is True.
+DURATION_HISTORY (str): The file, relative to the project root, storing the duration
+                    history per test and browser.
+SCHEDULE_STDEV_WEIGHT (float): The number of standard deviations of its recorded
+                    durations added to the mean duration of a test when ordering the
+                    tests, so erratic tests start early. Default is 1.
+POOL_SIZE (int): The maximum number of idle WebDriver sessions kept warm per pytest-xdist
+                    worker. Default is 1.
+POOL_RECYCLE_AFTER (int): The number of tests a pooled session serves before it is quit
+                    and replaced by a fresh one. Default is 20.
+POOL_RECYCLE_ON_FAILURE (bool): Whether a pooled session is discarded after a failed test.
+                    Default is True.
+POOL_HEALTH_CHECK (bool): Whether a pooled session is probed before it is handed out
+                    again. Default is True.
+GRID_URL (str): The Selenium Grid (or standalone node) used by the "remote" browser.
+GRID_BROWSER (str): The browser requested from the grid ("chrome", "firefox" or "edge").
+GRID_CAPABILITIES (dict): Extra capabilities of remote sessions (e.g. {"platformName":
+                    "linux", "se:recordVideo": True}).
+GRID_SESSION_REUSE (bool): Whether a remote session is kept in the worker's pool and reused
+                    by later tests on the same node instead of starting one per test.
+                    Default is True.
+GRID_RETRIES (int): The number of retries of a command after a connection error, or of a
+                    GET or DELETE command after a 502/503/504 answer of the grid.
+                    Default is 3.
+GRID_RETRY_BACKOFF (float): The backoff factor (in seconds) between retries. Default is 0.5.
+GRID_LATENCY_PROBES (int): The number of grid round trips timed when a remote session
+                    starts, to split command latency into remote and in-browser time.
+                    Default is 5.
+GOVERNOR_ENABLED (bool): Whether session launches wait for free machine resources and
+                    sessions using too much memory are recycled. Default is True.
+GOVERNOR_DIR (str): The directory of the machine-wide launch semaphore shared by workers.
+GOVERNOR_MAX_LAUNCHES (int): The maximum number of sessions starting at the same time on
+                    the machine. Default is 2.
+GOVERNOR_LAUNCH_INTERVAL (float): The minimum time (in seconds) between two launches on
+                    the machine. Default is 0.5 seconds.
+GOVERNOR_MIN_FREE_MEMORY (int): The available memory (in MB) required to launch a session.
+                    Default is 1024 MB.
+GOVERNOR_MAX_LOAD (float): The maximum 1-minute load average per core to launch a session.
+                    Default is 1.5.
+GOVERNOR_WAIT_TIMEOUT (int): The time (in seconds) after which a launch waiting for
+                    resources goes ahead anyway. Default is 120 seconds.
+GOVERNOR_MAX_SESSION_RSS (int): The resident memory (in MB) of a session's browser process
+                    tree above which it is recycled instead of reused. Default is 1536 MB.
+PERFORMANCE_METRICS (bool): Whether page objects collect web performance metrics
+                    (Navigation Timing, FCP, LCP, long tasks, layout shifts, transferred
+                    bytes) after loads and major actions. Default is True.
+PERFORMANCE_BUDGETS (bool): Whether a test fails when a metric exceeds the
+                    `performance_budget` of its page object, rather than the violation
+                    only being reported. Default is True.
+PERFORMANCE_HISTORY (str): The JSON-lines time series, relative to the project root, the
+                    metrics of every run are appended to.
+DIAGNOSTICS_ON_FAILURE (bool): Whether the last WebDriver commands are kept in memory
+                    and a compressed capture (DOM, screenshot, console, network, commands)
+                    is attached to Allure when a test fails. Default is True.
+DIAGNOSTICS_BUFFER_SIZE (int): The number of most recent commands, console messages and
+                    network events kept in a failure capture. Default is 50.
+TIMELINE_TRACING (str): When tests record a timeline of their DevTools trace and
+                    page-object spans: "marker" for tests marked with `trace`, "always" or
+                    "off". Default is "marker".
+TIMELINE_CATEGORIES (List[str]): The DevTools trace categories recorded by traced
+                    sessions. "blink.user_timing" is needed to align the framework spans
+                    with the browser clock.
+TIMELINE_BUFFER_REPORT_INTERVAL (int): How often (in ms) the browser reports the fill
+                    level of its trace buffer; a full buffer is logged as a warning.
+                    Default is 1000 ms.
+TIMELINE_MAX_EVENTS (int): The maximum number of browser trace events kept per test (the
+                    most recent ones). Default is 500000.
+TIMELINE_MAX_SPANS (int): The maximum number of page-object spans kept per test (the
+                    most recent ones). Default is 10000.
+BENCHMARK_RUNS (int): The number of measured repetitions of each benchmark metric.
+                    Default is 5.
+BENCHMARK_OPTION_SETS (dict): The named option sets, per browser, whose driver startup
+                    is benchmarked. The first set of a browser is used for its other
+                    benchmarks.
+BENCHMARK_THRESHOLD (float): The slowdown (in percent) of a median against the baseline
+                    that fails the benchmark run. Default is 20.
+BENCHMARK_BASELINE (str): The committed baseline results, relative to the project root.
+BENCHMARK_RESULTS_DIR (str): The directory, relative to the project root, where the
+                    results of each benchmark run are written as JSON.
+MATRIX_BROWSERS (list): The browsers of the matrix mode. Default is all local browsers.
+MATRIX_DEVICES (list): The devices of the matrix mode. "desktop" runs without emulation,
+                    any other name is emulated on the browsers in
+                    MATRIX_EMULATION_BROWSERS and skipped on the others.
+MATRIX_EMULATION_BROWSERS (list): The browsers supporting device emulation.
+MATRIX_MAX_PARALLEL (int): The maximum number of combinations running at once. Default is 4.
+MATRIX_BROWSER_CAPS (dict): The maximum number of combinations of each browser running at
+                    once (e.g. to respect licenses or memory). Browsers without a cap are
+                    only limited by MATRIX_MAX_PARALLEL.
+MATRIX_REPORT_DIR (str): The directory, relative to the project root, of the merged
+                    Allure results of a matrix run. Default is "reports".
+MATRIX_COMBINATION (str): The name of the combination this run belongs to, set by the
+                    matrix runner. Empty outside of the matrix mode.
+SWEEP_CATALOG (str): The catalog searched by the search sweep, relative to the project
+                    root: a CSV file with a header row or a JSON-lines file.
+SWEEP_QUERY_FIELD (str): The CSV column or JSON field holding the text to search for.
+                    Default is "title".
+SWEEP_SHARDS (int): The number of processes, each with one warm session, the catalog is
+                    split across. Default is 4.
+SWEEP_RESULTS_DIR (str): The directory, relative to the project root, of the per-shard
+                    result files and the summary. Default is "data/sweep".
+SWEEP_MENU_OPTION (str): The result tab opened after each search. Default is "Channels".
+SWEEP_TOP_CHANNELS (int): The number of first channels recorded per query. Default is 5.
 """
+import sys
+
+from config import loader
 
 BROWSER = "chrome"
 URL = "https://m.twitch.tv/"
@@ -22,5 +192,101 @@ BROWSER_OPTIONS = ["mobileEmulation"]
 DEVICE_NAME = "iPhone X"
 IMPLICIT_WAIT = 4
 EXPLICIT_WAIT = 10
+MAX_SCROLLS = 10
+WAIT_BACKEND = "polling"
 LOG_LEVEL = "DEBUG"
 LOG_NAME = "log_file.log"
+LOG_FORMAT = "json"
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+ELEMENT_CACHE = True
+PAGE_READY_TIMEOUT = 10
+PAGE_QUIET_WINDOW = 500
+FREEZE_ANIMATIONS = False
+FREEZE_PAUSE_MEDIA = False
+COMMAND_TRACING = True
+TRACE_DIR = "logs/latency"
+DRIVER_CACHE = True
+DRIVER_CACHE_DIR = "~/.cache/wap-testing"
+DRIVER_OFFLINE = False
+PROFILE_TEMPLATES = False
+PROFILE_TEMPLATE_DIR = "data/profiles"
+PROFILE_TEMPLATE_MAX_AGE = 24
+SCREENSHOT_WORKERS = 2
+SCREENSHOT_QUEUE_SIZE = 8
+BLOCKING_PROFILE = "minimal"
+_BLOCK_ADS = ["*spade.twitch.tv*", "*countess.twitch.tv*", "*google-analytics.com*",
+              "*googletagmanager.com*", "*doubleclick.net*", "*amazon-adsystem.com*",
+              "*scorecardresearch.com*", "*imasdk.googleapis.com*"]
+_BLOCK_MEDIA = ["*.ttvnw.net/*", "*.m3u8*", "*.ts", "*.mp4*"]
+_BLOCK_IMAGES = ["*static-cdn.jtvnw.net/*", "*.jpg*", "*.jpeg*", "*.png*", "*.webp*", "*.gif*"]
+BLOCKING_PROFILES = {
+    "none": [],
+    "minimal": _BLOCK_ADS,
+    "no-media": _BLOCK_ADS + _BLOCK_MEDIA,
+    "full": _BLOCK_ADS + _BLOCK_MEDIA + _BLOCK_IMAGES,
+}
+BLOCKING_STATS = False
+NETWORK_MODE = "live"
+ARCHIVE_PATH = "data/archives/m_twitch_tv"
+REPLAY_IGNORED_QUERY_PARAMS = ["_", "t", "timestamp", "nonce"]
+REPLAY_IGNORED_BODY_KEYS = ["extensions", "nonce", "request_id"]
+REPLAY_LOOSE_MATCH = True
+SCHEDULE_BY_DURATION = True
+DURATION_HISTORY = "data/durations.json"
+SCHEDULE_STDEV_WEIGHT = 1
+POOL_SIZE = 1
+POOL_RECYCLE_AFTER = 20
+POOL_RECYCLE_ON_FAILURE = True
+POOL_HEALTH_CHECK = True
+GRID_URL = "http://localhost:4444"
+GRID_BROWSER = "chrome"
+GRID_CAPABILITIES = {}
+GRID_SESSION_REUSE = True
+GRID_RETRIES = 3
+GRID_RETRY_BACKOFF = 0.5
+GRID_LATENCY_PROBES = 5
+GOVERNOR_ENABLED = True
+GOVERNOR_DIR = "~/.cache/wap-testing/governor"
+GOVERNOR_MAX_LAUNCHES = 2
+GOVERNOR_LAUNCH_INTERVAL = 0.5
+GOVERNOR_MIN_FREE_MEMORY = 1024
+GOVERNOR_MAX_LOAD = 1.5
+GOVERNOR_WAIT_TIMEOUT = 120
+GOVERNOR_MAX_SESSION_RSS = 1536
+PERFORMANCE_METRICS = True
+PERFORMANCE_BUDGETS = True
+PERFORMANCE_HISTORY = "data/performance/history.jsonl"
+DIAGNOSTICS_ON_FAILURE = True
+DIAGNOSTICS_BUFFER_SIZE = 50
+TIMELINE_TRACING = "marker"
+TIMELINE_CATEGORIES = ["devtools.timeline", "disabled-by-default-devtools.timeline",
+                       "blink.user_timing", "loading", "v8.execute", "toplevel"]
+TIMELINE_BUFFER_REPORT_INTERVAL = 1000
+TIMELINE_MAX_EVENTS = 500000
+TIMELINE_MAX_SPANS = 10000
+BENCHMARK_RUNS = 5
+BENCHMARK_OPTION_SETS = {
+    "chrome": {"headless": ["--headless"], "headless-mobile": ["--headless", "mobileEmulation"]},
+    "firefox": {"headless": ["--headless"]},
+    "edge": {"headless": ["--headless"]},
+}
+BENCHMARK_THRESHOLD = 20
+BENCHMARK_BASELINE = "benchmarks/baseline.json"
+BENCHMARK_RESULTS_DIR = "logs/benchmarks"
+MATRIX_BROWSERS = ["chrome", "firefox", "edge"]
+MATRIX_DEVICES = ["desktop", "iPhone X", "Pixel 7"]
+MATRIX_EMULATION_BROWSERS = ["chrome", "edge"]
+MATRIX_MAX_PARALLEL = 4
+MATRIX_BROWSER_CAPS = {"chrome": 2, "firefox": 1, "edge": 1}
+MATRIX_REPORT_DIR = "reports"
+MATRIX_COMBINATION = ""
+SWEEP_CATALOG = "data/catalog.csv"
+SWEEP_QUERY_FIELD = "title"
+SWEEP_SHARDS = 4
+SWEEP_RESULTS_DIR = "data/sweep"
+SWEEP_MENU_OPTION = "Channels"
+SWEEP_TOP_CHANNELS = 5
+
+# Applies the configuration file and the WAP_ environment variables.
+loader.load(sys.modules[__name__])
@@ -0,0 +1,133 @@
+"""
+Module layering configuration overrides on top of the defaults of config.py.
+
+The layers are applied in this order, each one overriding the previous:
+    1. The defaults defined in `config/config.py`.
+    2. A JSON file of setting names to values, `config/settings.json` or the file named
+       by the `WAP_CONFIG_FILE` environment variable.
+    3. Environment variables named after the settings with the `WAP_` prefix
+       (e.g. `WAP_BROWSER=firefox`, `WAP_BROWSER_OPTIONS='["--headless"]'`).
+    4. Command-line overrides of pytest (`--setting BROWSER=firefox`).
+
+Values of the environment and the command line are parsed as JSON, falling back to the
+raw string, so numbers, booleans, lists and dicts can be overridden too.
+"""
+import json
+import os
+from types import ModuleType
+from typing import Any, Dict, Iterable, Mapping, MutableMapping
+
+ENV_PREFIX = "WAP_"
+CONFIG_FILE_VARIABLE = "WAP_CONFIG_FILE"
+DEFAULT_CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "settings.json")
+
+
+def parse_value(text: str) -> Any:
+    """
+    Parses an override given as text.
+
+    Args:
+        text (str): The value as written in the environment or on the command line.
+
+    Returns:
+        The JSON value of the text, or the text itself if it is not valid JSON.
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def file_overrides(path: str) -> Dict[str, Any]:
+    """
+    Reads the overrides of a JSON configuration file.
+
+    Args:
+        path (str): The JSON file.
+
+    Returns:
+        dict: The settings of the file, or an empty dict if the file does not exist.
+    """
+    if not os.path.isfile(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def env_overrides(environ: Mapping[str, str]) -> Dict[str, Any]:
+    """
+    Collects the overrides of the `WAP_` environment variables.
+
+    Args:
+        environ (Mapping): The environment (e.g. `os.environ`).
+
+    Returns:
+        dict: The parsed value of each overridden setting.
+    """
+    return {name[len(ENV_PREFIX):]: parse_value(value) for name, value in environ.items()
+            if name.startswith(ENV_PREFIX) and name != CONFIG_FILE_VARIABLE}
+
+
+def cli_overrides(assignments: Iterable[str]) -> Dict[str, Any]:
+    """
+    Parses `NAME=VALUE` command-line overrides.
+
+    Args:
+        assignments (Iterable[str]): The overrides (e.g. ["BROWSER=firefox"]).
+
+    Returns:
+        dict: The parsed value of each overridden setting.
+
+    Raises:
+        ValueError: If an override is not of the form NAME=VALUE.
+    """
+    overrides = {}
+    for assignment in assignments:
+        name, separator, value = assignment.partition("=")
+        if not separator:
+            raise ValueError(f"Invalid setting override, expected NAME=VALUE: {assignment}")
+        overrides[name.strip().upper()] = parse_value(value)
+    return overrides
+
+
+def apply(settings: ModuleType, overrides: Dict[str, Any]) -> None:
+    """
+    Overrides settings of the configuration module.
+
+    Args:
+        settings (ModuleType): The configuration module.
+        overrides (dict): The new value of each setting.
+
+    Raises:
+        ValueError: If a setting does not exist, so typos fail fast.
+    """
+    for name, value in overrides.items():
+        if not name.isupper() or not hasattr(settings, name):
+            raise ValueError(f"Unknown setting: {name}")
+        setattr(settings, name, value)
+
+
+def export(overrides: Dict[str, Any], environ: MutableMapping[str, str]) -> None:
+    """
+    Writes overrides to the environment layer, so child processes inherit them.
+
+    Args:
+        overrides (dict): The new value of each setting.
+        environ (MutableMapping): The environment to update (e.g. `os.environ`).
+    """
+    for name, value in overrides.items():
+        environ[f"{ENV_PREFIX}{name}"] = json.dumps(value)
+
+
+def load(settings: ModuleType, environ: Mapping[str, str] = None) -> None:
+    """
+    Applies the file and environment layers to the configuration module. The
+    command-line layer is applied when pytest registers `plugins.layered_config`.
+
+    Args:
+        settings (ModuleType): The configuration module holding the defaults.
+        environ (Mapping): The environment. Default is `os.environ`.
+    """
+    environ = os.environ if environ is None else environ
+    apply(settings, file_overrides(environ.get(CONFIG_FILE_VARIABLE, DEFAULT_CONFIG_FILE)))
+    apply(settings, env_overrides(environ))
@@ -0,0 +1,7 @@
+"""
+Module registering the project's pytest plugins.
+
+The root conftest is imported with the project root on `sys.path`, so the plugins load
+however pytest is invoked, and before `tests/conftest.py` imports the framework.
+"""
+pytest_plugins = ["plugins.layered_config", "plugins.duration_scheduler"]
@@ -0,0 +1,148 @@
+"""
+Module providing the animation and transition freeze mode.
+"""
+import json
+from typing import Any, Dict, List
+
+from config import config
+from utilities.element_cache import NAVIGATION_COMMANDS
+from utilities.logger import Logger
+
+FREEZE_STYLE = """
+*, *::before, *::after {
+    animation-delay: 0s !important;
+    animation-duration: 0s !important;
+    animation-iteration-count: 1 !important;
+    transition: none !important;
+    scroll-behavior: auto !important;
+}
+"""
+
+# Runs before any script of the page. Style elements apply wherever they are in the
+# document, so the style is added to the root element as soon as one exists.
+FREEZE_FUNCTION = """
+function (style, pauseMedia) {
+    if (window.__wapFrozen) { return; }
+    window.__wapFrozen = true;
+    var install = function () {
+        var root = document.documentElement;
+        if (!root) { return false; }
+        var element = document.createElement('style');
+        element.id = 'wap-freeze';
+        element.textContent = style;
+        root.appendChild(element);
+        return true;
+    };
+    if (!install()) {
+        new MutationObserver(function (mutations, observer) {
+            if (install()) { observer.disconnect(); }
+        }).observe(document, {childList: true});
+    }
+    var animate = Element.prototype.animate;
+    if (animate) {
+        Element.prototype.animate = function () {
+            var animation = animate.apply(this, arguments);
+            try { animation.finish(); } catch (e) { animation.cancel(); }
+            return animation;
+        };
+    }
+    if (pauseMedia) {
+        var play = HTMLMediaElement.prototype.play;
+        HTMLMediaElement.prototype.play = function () {
+            if (navigator.userActivation && navigator.userActivation.isActive) {
+                return play.apply(this, arguments);
+            }
+            this.autoplay = false;
+            return Promise.resolve();
+        };
+    }
+}
+"""
+
+
+class AnimationFreezer:
+    """
+    Freezes CSS animations and transitions, Web Animations and smooth scrolling, makes
+    the browser prefer reduced motion and, with `config.FREEZE_PAUSE_MEDIA`, keeps media
+    from autoplaying. Waits for clickability or invisibility then resolve as soon as the
+    DOM is ready instead of waiting out fades, slides and spinners.
+
+    Chrome and Edge run the freeze script at the start of every new document through
+    DevTools `Page.addScriptToEvaluateOnNewDocument`. Firefox has no such hook over
+    WebDriver classic, so the script is run again after every navigation command and the
+    nearest preferences (reduced motion, no autoplay) are applied at startup.
+
+    Animations with a 0s duration still fire `animationend`; transitions are removed,
+    so pages waiting for `transitionend` must not be frozen.
+    """
+    logger = Logger(__name__)
+
+    @staticmethod
+    def chromium_arguments() -> List[str]:
+        """
+        Returns the Chrome and Edge command-line arguments of the freeze mode.
+
+        Returns:
+            list: The arguments to add to the browser options.
+        """
+        arguments = ["--force-prefers-reduced-motion"]
+        if config.FREEZE_PAUSE_MEDIA:
+            arguments.append("--autoplay-policy=user-gesture-required")
+        return arguments
+
+    @staticmethod
+    def firefox_preferences() -> Dict[str, Any]:
+        """
+        Returns the Firefox preferences of the freeze mode.
+
+        Returns:
+            dict: The preferences to set on the Firefox options.
+        """
+        preferences = {"ui.prefersReducedMotion": 1, "toolkit.cosmeticAnimations.enabled": False}
+        if config.FREEZE_PAUSE_MEDIA:
+            preferences["media.autoplay.default"] = 5
+        return preferences
+
+    @staticmethod
+    def freeze_document(driver: Any) -> None:
+        """
+        Freezes the current document of a driver.
+
+        Args:
+            driver (WebDriver): The driver whose document is frozen.
+        """
+        driver.execute_script(f"({FREEZE_FUNCTION})(arguments[0], arguments[1]);",
+                              FREEZE_STYLE, config.FREEZE_PAUSE_MEDIA)
+
+    @classmethod
+    def attach(cls, driver: Any) -> Any:
+        """
+        Registers the freeze script for every new document of a driver and applies it
+        to the current one.
+
+        Args:
+            driver (WebDriver): The driver to freeze.
+
+        Returns:
+            WebDriver: The same driver.
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            source = (f"({FREEZE_FUNCTION})"
+                      f"({json.dumps(FREEZE_STYLE)}, {json.dumps(config.FREEZE_PAUSE_MEDIA)});")
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+        else:
+            execute = driver.command_executor.execute
+
+            def execute_and_freeze(command: str, params: Dict = None) -> Any:
+                response = execute(command, params)
+                if command in NAVIGATION_COMMANDS:
+                    try:
+                        cls.freeze_document(driver)
+                    except Exception as e:
+                        cls.logger.debug("Could not freeze the new document: %s", e)
+                return response
+
+            driver.command_executor.execute = execute_and_freeze
+        cls.freeze_document(driver)
+        cls.logger.info("Animations frozen (media paused: %s)", config.FREEZE_PAUSE_MEDIA)
+        return driver
@@ -2,7 +2,16 @@
 Module Browser interface.
 """
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Dict, Optional
+
+from config import config
+from drivers.animation_freezer import AnimationFreezer
+from drivers.command_tracer import CommandTracer
+from drivers.diagnostics_recorder import DiagnosticsRecorder
+from drivers.profile_template import ProfileTemplate
+from drivers.request_blocker import RequestBlocker
+from utilities.element_cache import ElementCache
+from utilities.page_readiness import PageReadiness
 
 
 class Browser(ABC):
@@ -12,10 +21,27 @@ class Browser(ABC):
 
     Attributes:
         options: Optional settings or configurations for the browser.
+        device_name (str): The device emulated by the "mobileEmulation" option. Defaults to
+                           `config.DEVICE_NAME`.
+        profile_dir (str): Optional user-data directory the browser is started with.
+        use_profile_template (bool): Whether a copy of the pre-warmed profile template is
+                                     used when no `profile_dir` is given. Defaults to
+                                     `config.PROFILE_TEMPLATES`.
+        trace_categories (List[str]): Optional DevTools trace categories the driver records
+                                      into its performance log (Chromium browsers only).
+        freeze_animations (bool): Whether animations, transitions and smooth scrolling are
+                                  frozen in every document (see `AnimationFreezer`).
+                                  Defaults to `config.FREEZE_ANIMATIONS`.
     """
 
     def __init__(self, options=None) -> None:
         self.options = options
+        self.device_name = config.DEVICE_NAME
+        self.profile_dir = None
+        self.use_profile_template = config.PROFILE_TEMPLATES
+        self.trace_categories = None
+        self.freeze_animations = config.FREEZE_ANIMATIONS
+        self._cloned_profile = None
 
     @abstractmethod
     def get_driver(self) -> Any:
@@ -27,6 +53,63 @@ class Browser(ABC):
             A web driver instance configured with the browser's options.
         """
 
+    def get_profile_dir(self) -> Optional[str]:
+        """
+        Returns the user-data directory the next driver should be started with.
+
+        Returns:
+            str: `profile_dir` if set, otherwise a fresh copy of the profile template when
+            templates are enabled, otherwise None for a new empty profile.
+        """
+        if self.profile_dir:
+            return self.profile_dir
+        if self.use_profile_template:
+            self._cloned_profile = ProfileTemplate(self).clone()
+            return self._cloned_profile
+        return None
+
+    def logging_preferences(self) -> Dict[str, str]:
+        """
+        Returns the `loggingPrefs` of a Chromium browser: the console log when failure
+        diagnostics read it, and the performance log only when the request blocker counts
+        requests or a DevTools trace is recorded, since the driver buffers every DevTools
+        event of the session for it.
+
+        Returns:
+            dict: The log types to record and their level.
+        """
+        preferences = {}
+        if config.DIAGNOSTICS_ON_FAILURE:
+            preferences["browser"] = "ALL"
+        if config.BLOCKING_STATS or self.trace_categories:
+            preferences["performance"] = "ALL"
+        return preferences
+
+    def instrument(self, driver: Any) -> Any:
+        """
+        Applies the framework instrumentation enabled in the configuration to a
+        freshly created web driver.
+
+        Args:
+            driver: The web driver instance created by `get_driver`.
+
+        Returns:
+            The same web driver instance, instrumented.
+        """
+        if config.COMMAND_TRACING:
+            CommandTracer.attach(driver)
+        if config.DIAGNOSTICS_ON_FAILURE:
+            DiagnosticsRecorder.attach(driver)
+        RequestBlocker.attach(driver)
+        PageReadiness.attach(driver)
+        if self.freeze_animations:
+            AnimationFreezer.attach(driver)
+        ElementCache.track_navigation(driver)
+        if self._cloned_profile:
+            ProfileTemplate.remove_on_quit(driver, self._cloned_profile)
+            self._cloned_profile = None
+        return driver
+
     def set_options(self, options: Any) -> None:
         """
         Sets the options for the browser.
@@ -3,8 +3,10 @@ Module providing a function to get type of browser.
 """
 from typing import List
 from drivers.chrome_browser import ChromeBrowser
+from drivers.chrome_context_browser import ChromeContextBrowser
 from drivers.firefox_browser import FirefoxBrowser
 from drivers.edge_browser import EdgeBrowser
+from drivers.remote_browser import RemoteBrowser
 from drivers.browser import Browser
 from utilities.logger import Logger
 
@@ -13,25 +15,38 @@ class BrowserFactory:
     """
     A factory class to initialize web browser drivers based on the given browser name.
 
-    The class supports Chrome, Firefox, and Edge browsers. It provides a static method 
+    The class supports Chrome, Firefox, and Edge browsers, "chrome-contexts", which
+    runs every session as an isolated browser context of one shared Chrome, and
+    "remote", which runs the sessions on a Selenium Grid. It provides a static method 
     to return an instance of the selected browser's driver.
 
     Usage:
         browser_instance = BrowserFactory.get_browser("chrome", options)
     """
     logger = Logger(__name__)
+    browsers = {
+        "chrome": ChromeBrowser,
+        "chrome-contexts": ChromeContextBrowser,
+        "firefox": FirefoxBrowser,
+        "edge": EdgeBrowser,
+        "remote": RemoteBrowser
+    }
 
     @staticmethod
-    def get_browser(browser_name: str, options: List[str] = None) -> Browser:
+    def get_browser(browser_name: str, options: List[str] = None,
+                    device_name: str = None) -> Browser:
         """
         Returns an instance of a browser driver based on the provided browser name.
 
         Args:
             browser_name (str): The name of the browser to initialize. Accepted values 
-                                are "chrome", "firefox", or "edge".
+                                are "chrome", "chrome-contexts", "firefox", "edge",
+                                or "remote".
             options (List[str]): Optional browser-specific settings or options to 
                                 pass when initializing the browser driver.
                                 (e.g. ['--headless','--disable-gpu', '--window-size=1200x800'])
+            device_name (str): Optional device emulated by the "mobileEmulation" option.
+                                Defaults to `config.DEVICE_NAME`.
 
         Returns:
             object: An instance of the browser driver corresponding to the given browser name.
@@ -45,20 +60,18 @@ class BrowserFactory:
             firefox_driver = BrowserFactory.get_browser("firefox")
         """
         BrowserFactory.logger.info(
-            f"Attempting to initialize browser: {browser_name} with options: {options}")
-        browsers = {
-            "chrome": ChromeBrowser,
-            "firefox": FirefoxBrowser,
-            "edge": EdgeBrowser
-        }
-        if browser_name.lower() not in browsers:
+            "Attempting to initialize browser: %s with options: %s", browser_name, options)
+        if browser_name.lower() not in BrowserFactory.browsers:
             BrowserFactory.logger.error(
-                f"Invalid browser name: {browser_name}")
+                "Invalid browser name: %s", browser_name)
             raise ValueError(f"Invalid browser name: {browser_name}")
 
         BrowserFactory.logger.info(
-            f"Successfully initialized {browser_name} browser.")
-        return browsers[browser_name.lower()](options)
+            "Successfully initialized %s browser.", browser_name)
+        browser = BrowserFactory.browsers[browser_name.lower()](options)
+        if device_name:
+            browser.device_name = device_name
+        return browser
 
     @staticmethod
     def is_valid_browser(browser_name: str) -> bool:
@@ -71,13 +84,12 @@ class BrowserFactory:
         Returns:
             bool: True if the browser name is valid, False otherwise.
         """
-        BrowserFactory.logger.debug(f"Validating browser name: {browser_name}")
-        valid_browsers = ["chrome", "firefox", "edge"]
-        is_valid = browser_name.lower() in valid_browsers
+        BrowserFactory.logger.debug("Validating browser name: %s", browser_name)
+        is_valid = browser_name.lower() in BrowserFactory.browsers
         if is_valid:
             BrowserFactory.logger.info(
-                f"Browser name '{browser_name}' is valid.")
+                "Browser name '%s' is valid.", browser_name)
         else:
             BrowserFactory.logger.warning(
-                f"Browser name '{browser_name}' is invalid.")
+                "Browser name '%s' is invalid.", browser_name)
         return is_valid
@@ -3,61 +3,33 @@ Module Chrome configurations.
 """
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from drivers.browser import Browser
+from selenium.webdriver.chrome.service import Service
+from drivers.chromium_browser import ChromiumBrowser
 from utilities.logger import Logger
-from config import config
 
 
-class ChromeBrowser(Browser):
+class ChromeBrowser(ChromiumBrowser):
     """
     A class to manage the Chrome browser for Selenium WebDriver with custom options.
 
-    This class inherits from the `Browser` class and is used to create a Selenium WebDriver
-    instance for Chrome with specific options.
+    This class inherits from the `ChromiumBrowser` class and is used to create a Selenium
+    WebDriver instance for Chrome with specific options.
     """
     logger = Logger(__name__)
+    name = "Chrome"
+    options_class = Options
+    service_class = Service
+    logging_capability = "goog:loggingPrefs"
 
-    def get_driver(self) -> webdriver.Chrome:
+    def _create_driver(self, options: Options, service: Service) -> webdriver.Chrome:
         """
-        Initializes and returns a Chrome WebDriver instance with the provided options.
-
-        Returns:
-            webdriver.Chrome: A WebDriver instance for Chrome with the applied options.
-        """
-        try:
-            self.logger.info("Initializing Chrome WebDriver")
-            chrome_options = Options()
-            self._add_options(chrome_options)
-            self.logger.info("Chrome WebDriver successfully initialized")
-            return webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            self.logger.error(
-                f"Failed to initialize Chrome WebDriver: {str(e)}")
-            raise
-
-    def _add_options(self, chrome_options: Options) -> None:
-        """
-        Adds custom options to the Chrome WebDriver instance based on the `self.options` attribute.
+        Starts the Chrome WebDriver instance.
 
         Args:
-            chrome_options (Options): An instance of Chrome options to which arguments 
-            will be added. (selenium.webdriver.chrome.options.Options)
+            options (Options): The Chrome options.
+            service (Service): The Chrome driver service.
+
+        Returns:
+            webdriver.Chrome: A WebDriver instance for Chrome.
         """
-        try:
-            if self.options:
-                self.logger.info("Adding Chrome options")
-                for option in self.options:
-                    self.logger.debug(f"Added option: {option}")
-                    if option == "mobileEmulation":
-                        self.logger.debug(
-                            f"Added mobile emulation for device name: {config.DEVICE_NAME}")
-                        chrome_options.add_experimental_option(
-                            option, {"deviceName": config.DEVICE_NAME})
-                    else:
-                        chrome_options.add_argument(option)
-                self.logger.info("All Chrome options added successfully")
-            else:
-                self.logger.warning("No options provided for Chrome WebDriver")
-        except Exception as e:
-            self.logger.error(f"Error while adding Chrome options: {str(e)}")
-            raise
+        return webdriver.Chrome(options=options, service=service)
@@ -0,0 +1,171 @@
+"""
+Module Chrome browser contexts configurations.
+"""
+import atexit
+from typing import Any, List
+
+from config import config
+from drivers.animation_freezer import AnimationFreezer
+from drivers.browser import Browser
+from drivers.chrome_browser import ChromeBrowser
+from drivers.diagnostics_recorder import DiagnosticsRecorder
+from drivers.request_blocker import RequestBlocker
+from utilities.logger import Logger
+from utilities.page_readiness import PageReadiness
+
+
+class ContextDriver:
+    """
+    A WebDriver-compatible view of one isolated browser context of a shared Chrome.
+
+    Every attribute is read from the shared driver after making the context's window
+    the current one, so page objects use it exactly like a regular driver. Switching
+    only happens when another context was used last, so it costs no extra round-trip
+    while a single test drives the browser. Attributes set on the view (e.g. its
+    `request_blocker`) stay on the view, so contexts never see each other's state,
+    except the instrumentation of the shared session in `SHARED_ATTRIBUTES`, which is
+    written through to it: the command executor of the shared driver bumps its
+    `navigation_epoch`, so an epoch of the view would hide real navigations from the
+    element caches. `quit` disposes the context, not the browser.
+
+    Attributes:
+        context_id (str): The DevTools id of the browser context.
+        handle (str): The window handle of the context's page.
+    """
+    SHARED_ATTRIBUTES = frozenset({"navigation_epoch", "command_tracer", "diagnostics",
+                                   "script_timeout"})
+    _active_handle = None
+
+    def __init__(self, driver: Any, context_id: str, handle: str) -> None:
+        object.__setattr__(self, "_driver", driver)
+        object.__setattr__(self, "context_id", context_id)
+        object.__setattr__(self, "handle", handle)
+
+    def _activate(self) -> None:
+        if ContextDriver._active_handle != self.handle:
+            self._driver.switch_to.window(self.handle)
+            ContextDriver._active_handle = self.handle
+
+    def __getattr__(self, name: str) -> Any:
+        self._activate()
+        return getattr(self._driver, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self.SHARED_ATTRIBUTES:
+            setattr(self._driver, name, value)
+        else:
+            object.__setattr__(self, name, value)
+
+    @property
+    def window_handles(self) -> List[str]:
+        """
+        Returns the window handles of this context only, its first page first. ChromeDriver
+        uses the DevTools target ids as window handles.
+        """
+        targets = self._driver.execute_cdp_cmd("Target.getTargets", {})["targetInfos"]
+        return [self.handle] + [target["targetId"] for target in targets
+                                if target.get("browserContextId") == self.context_id
+                                and target["type"] == "page"
+                                and target["targetId"] != self.handle]
+
+    def quit(self) -> None:
+        """
+        Disposes the browser context with all its windows, cookies and storage.
+        """
+        ChromeContextBrowser.dispose_context(self)
+
+
+class ChromeContextBrowser(Browser):
+    """
+    A class running many isolated browser contexts in one Chrome process per worker.
+
+    The first `get_driver` of a process starts a regular Chrome through `ChromeBrowser`.
+    Every call then creates a new browser context over DevTools (separate cookies, cache
+    and storage) with its own page, and returns a `ContextDriver` bound to it, so each
+    test gets a clean browser without paying for a new process. The driver pool recycles
+    contexts after every test, so no state of any origin outlives its test.
+
+    Contexts of a worker are used one at a time. They share one WebDriver session,
+    whose commands ChromeDriver runs one after the other on the current window, so
+    driving several contexts at once from threads or an event loop would only
+    interleave window switches without running anything in parallel. Parallelism comes
+    from the pytest-xdist workers, each with its own shared Chrome, so this mode runs no
+    more sessions at once than the pooled "chrome" mode. What it changes is isolation:
+    every test gets a fresh context instead of a reset session, without launching a
+    new browser.
+    """
+    logger = Logger(__name__)
+    _shared_driver = None
+    _home_handle = None
+
+    def get_driver(self) -> ContextDriver:
+        """
+        Creates a new isolated browser context in the shared Chrome and returns a driver
+        bound to it.
+
+        Returns:
+            ContextDriver: A WebDriver-compatible driver for the new context.
+        """
+        try:
+            driver = self._get_shared_driver()
+            context_id = driver.execute_cdp_cmd(
+                "Target.createBrowserContext", {"disposeOnDetach": False})["browserContextId"]
+            target_id = driver.execute_cdp_cmd(
+                "Target.createTarget",
+                {"url": "about:blank", "browserContextId": context_id})["targetId"]
+            self.logger.info("Created browser context: %s", context_id)
+            # Blocked URLs and new-document scripts are set per page target, so every
+            # context gets its own.
+            context = RequestBlocker.attach(ContextDriver(driver, context_id, target_id))
+            PageReadiness.attach(context)
+            if config.DIAGNOSTICS_ON_FAILURE:
+                DiagnosticsRecorder.record_network(context)
+            if self.freeze_animations:
+                AnimationFreezer.attach(context)
+            return context
+        except Exception as e:
+            self.logger.error("Failed to create browser context: %s", e)
+            raise
+
+    def _get_shared_driver(self) -> Any:
+        """
+        Returns the Chrome shared by every context of the process, starting it on first use.
+        """
+        if ChromeContextBrowser._shared_driver is None:
+            self.logger.info("Starting shared Chrome for browser contexts")
+            chrome = ChromeBrowser(self.options)
+            chrome.device_name = self.device_name
+            chrome.profile_dir = self.profile_dir
+            chrome.use_profile_template = self.use_profile_template
+            chrome.freeze_animations = self.freeze_animations
+            driver = chrome.get_driver()
+            ChromeContextBrowser._shared_driver = driver
+            ChromeContextBrowser._home_handle = driver.current_window_handle
+            atexit.register(ChromeContextBrowser.close_shared_driver)
+        return ChromeContextBrowser._shared_driver
+
+    @classmethod
+    def dispose_context(cls, context: ContextDriver) -> None:
+        """
+        Makes the shared browser's own window current again and disposes a context
+        with all its windows.
+
+        Args:
+            context (ContextDriver): The context to dispose.
+        """
+        driver = cls._shared_driver
+        driver.switch_to.window(cls._home_handle)
+        ContextDriver._active_handle = None
+        driver.execute_cdp_cmd("Target.disposeBrowserContext",
+                               {"browserContextId": context.context_id})
+        cls.logger.info("Disposed browser context: %s", context.context_id)
+
+    @classmethod
+    def close_shared_driver(cls) -> None:
+        """
+        Quits the shared Chrome process.
+        """
+        if cls._shared_driver is not None:
+            cls._shared_driver.quit()
+            cls._shared_driver = None
+            cls.logger.info("Shared Chrome closed.")
@@ -0,0 +1,189 @@
+"""
+Module Chromium configurations shared by Chrome and Edge.
+"""
+from abc import abstractmethod
+from typing import Any
+
+from selenium.webdriver.chromium.options import ChromiumOptions
+from selenium.webdriver.chromium.service import ChromiumService
+
+from drivers.animation_freezer import AnimationFreezer
+from drivers.driver_resolver import DriverResolver
+from drivers.local_browser import LocalBrowser
+from utilities.logger import Logger
+from utilities.replay_proxy import ReplayProxy
+from config import config
+
+
+class ChromiumBrowser(LocalBrowser):
+    """
+    A base class for the Chromium browsers, which take the same arguments, experimental
+    options and driver service and only differ in their Selenium classes, set by the
+    subclasses together with `_create_driver`.
+
+    Attributes:
+        name (str): The browser name used in log messages.
+        options_class: The Selenium options class of the browser.
+        service_class: The Selenium driver service class of the browser.
+        logging_capability (str): The capability holding the `loggingPrefs` of the browser.
+    """
+    logger = Logger(__name__)
+    name = "Chromium"
+    options_class = ChromiumOptions
+    service_class = ChromiumService
+    logging_capability = "goog:loggingPrefs"
+
+    def build_options(self) -> Any:
+        """
+        Builds the options of the browser that do not depend on this machine, i.e.
+        without the replay proxy and the profile, so they also configure the matching
+        browser of a Selenium Grid.
+
+        Returns:
+            Options: The Selenium options of the browser.
+        """
+        options = self.options_class()
+        self._add_options(options)
+        self._add_tracing(options)
+        self._add_freeze(options)
+        options.set_capability(self.logging_capability, self.logging_preferences())
+        return options
+
+    def get_driver(self) -> Any:
+        """
+        Initializes and returns a WebDriver instance with the provided options.
+
+        Returns:
+            WebDriver: A WebDriver instance for the browser with the applied options.
+        """
+        try:
+            self.logger.info("Initializing %s WebDriver", self.name)
+            options = self.build_options()
+            self._add_proxy(options)
+            self._add_profile(options)
+            self.logger.info("%s WebDriver successfully initialized", self.name)
+            driver = self.start_session(
+                lambda service: self._create_driver(options, service), options)
+            return self.instrument(driver)
+        except Exception as e:
+            self.logger.error("Failed to initialize %s WebDriver: %s", self.name, e)
+            raise
+
+    @abstractmethod
+    def _create_driver(self, options: Any, service: Any) -> Any:
+        """
+        Abstract method to start the WebDriver instance of the browser.
+
+        Args:
+            options (Options): The Selenium options of the browser.
+            service (Service): The driver service of the browser.
+
+        Returns:
+            WebDriver: The WebDriver instance.
+        """
+
+    def _add_options(self, options: Any) -> None:
+        """
+        Adds custom options to the WebDriver instance based on the `self.options` attribute.
+
+        Args:
+            options (Options): The Options instance to which the arguments should be added.
+        """
+        try:
+            if self.options:
+                self.logger.info("Adding %s options", self.name)
+                for option in self.options:
+                    self.logger.debug("Added option: %s", option)
+                    if option == "mobileEmulation":
+                        self.logger.debug(
+                            "Added mobile emulation for device name: %s", self.device_name)
+                        options.add_experimental_option(
+                            option, {"deviceName": self.device_name})
+                    else:
+                        options.add_argument(option)
+                self.logger.info("All %s options added successfully", self.name)
+            else:
+                self.logger.warning("No options provided for %s WebDriver", self.name)
+        except Exception as e:
+            self.logger.error("Error while adding %s options: %s", self.name, e)
+            raise
+
+    def _add_proxy(self, options: Any) -> None:
+        """
+        Points the WebDriver instance at the record/replay proxy when one is running.
+
+        Args:
+            options (Options): The Options instance to which the proxy settings are added.
+        """
+        if ReplayProxy.active:
+            self.logger.info("Routing %s traffic through proxy: %s",
+                             self.name, ReplayProxy.active.address)
+            options.add_argument(f"--proxy-server=http://{ReplayProxy.active.address}")
+            options.add_argument("--proxy-bypass-list=<-loopback>")
+            options.add_argument("--ignore-certificate-errors")
+            options.accept_insecure_certs = True
+
+    def _add_profile(self, options: Any) -> None:
+        """
+        Starts the WebDriver instance with the user-data directory returned by
+        `get_profile_dir`, if any.
+
+        Args:
+            options (Options): The Options instance to which the profile is added.
+        """
+        profile_dir = self.get_profile_dir()
+        if profile_dir:
+            self.logger.info("Using %s profile: %s", self.name, profile_dir)
+            options.add_argument(f"--user-data-dir={profile_dir}")
+
+    def _add_freeze(self, options: Any) -> None:
+        """
+        Makes the WebDriver instance prefer reduced motion and, if configured, block
+        media autoplay when `freeze_animations` is set. The freeze script itself is
+        registered once the driver runs (see `Browser.instrument`).
+
+        Args:
+            options (Options): The Options instance to which the arguments are added.
+        """
+        if self.freeze_animations:
+            for argument in AnimationFreezer.chromium_arguments():
+                self.logger.debug("Added freeze argument: %s", argument)
+                options.add_argument(argument)
+
+    def _add_tracing(self, options: Any) -> None:
+        """
+        Makes the WebDriver instance record the `trace_categories` DevTools trace into
+        its performance log, if any.
+
+        Args:
+            options (Options): The Options instance to which the tracing preferences
+            are added.
+        """
+        if self.trace_categories:
+            self.logger.info("Recording %s trace categories: %s",
+                             self.name, self.trace_categories)
+            options.add_experimental_option("perfLoggingPrefs", {
+                "enableNetwork": True,
+                "enablePage": False,
+                "traceCategories": ",".join(self.trace_categories),
+                "bufferUsageReportingInterval": config.TIMELINE_BUFFER_REPORT_INTERVAL,
+            })
+
+    def _create_service(self, options: Any) -> Any:
+        """
+        Creates a Service with an explicit driver path from the DriverResolver cache, so
+        the WebDriver instance skips driver and browser discovery.
+
+        Args:
+            options (Options): The Options instance whose browser binary is set from the
+            cache.
+
+        Returns:
+            Service: The driver service, or a default one if the cache is disabled.
+        """
+        if not config.DRIVER_CACHE:
+            return self.service_class()
+        paths = DriverResolver.resolve(options)
+        if paths["browser_path"] and not options.binary_location:
+            options.binary_location = paths["browser_path"]
+        return self.service_class(executable_path=paths["driver_path"])
@@ -0,0 +1,185 @@
+"""
+Module providing a per-command WebDriver latency tracer.
+"""
+import bisect
+import json
+import os
+import time
+from typing import Any, Dict, List
+
+from config import config
+from utilities import utils
+from utilities.logger import Logger
+from utilities.timeline import Timeline
+
+HISTOGRAM_BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+class CommandTracer:
+    """
+    Records every WebDriver command sent by a driver with its name, the page-object
+    method that issued it, its duration and its request payload size.
+
+    The tracer wraps `driver.command_executor.execute`, so it sees exactly the HTTP
+    commands sent to the driver. Recording only appends a tuple per command with the
+    page action in progress (see `Timeline.current_action`) and a reference to the
+    parameters, whose size is computed when the summary is built, keeping the overhead
+    low enough to leave on in CI.
+
+    Usage:
+        tracer = CommandTracer.attach(driver)
+        ...
+        tracer.write_report("tests/test_search_page.py::test_x")
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, driver: Any) -> None:
+        self.driver = driver
+        self.records: List[tuple] = []
+        self._execute = driver.command_executor.execute
+
+    @classmethod
+    def attach(cls, driver: Any) -> Any:
+        """
+        Wraps the command executor of the driver with a tracer, exposed as
+        `driver.command_tracer`.
+
+        Args:
+            driver (WebDriver): The driver to instrument.
+
+        Returns:
+            WebDriver: The same driver, instrumented.
+        """
+        tracer = cls(driver)
+        driver.command_executor.execute = tracer.execute
+        driver.command_tracer = tracer
+        cls.logger.debug("Command tracer attached to driver.")
+        return driver
+
+    def execute(self, command: str, params: Dict = None) -> Any:
+        """
+        Executes a WebDriver command through the original executor and records it.
+
+        Args:
+            command (str): The WebDriver command name.
+            params (dict): The command parameters.
+
+        Returns:
+            The response of the original executor.
+        """
+        start = time.perf_counter()
+        try:
+            return self._execute(command, params)
+        finally:
+            self.records.append((command, Timeline.current_action() or "-",
+                                 time.perf_counter() - start, params))
+
+    @staticmethod
+    def _size(params: Dict) -> int:
+        """
+        Returns the size in bytes of the JSON payload of a command.
+        """
+        return len(json.dumps(params, default=str)) if params else 0
+
+    def reset(self) -> None:
+        """
+        Discards the recorded commands, e.g. at the start of a test.
+        """
+        self.records = []
+
+    def summary(self, slowest: int = 10) -> Dict[str, Any]:
+        """
+        Builds latency histograms per command and a slowest-calls table.
+
+        Args:
+            slowest (int): The number of slowest calls to include. Default is 10.
+
+        Returns:
+            dict: A JSON-serializable summary of the recorded commands.
+        """
+        labels = [f"<={bucket}ms" for bucket in HISTOGRAM_BUCKETS_MS] + [
+            f">{HISTOGRAM_BUCKETS_MS[-1]}ms"]
+        commands: Dict[str, Dict[str, Any]] = {}
+        for command, _, duration, params in self.records:
+            stats = commands.setdefault(
+                command, {"count": 0, "total_ms": 0.0, "bytes": 0, "histogram": [0] * len(labels)})
+            duration_ms = duration * 1000
+            stats["count"] += 1
+            stats["total_ms"] += duration_ms
+            stats["bytes"] += self._size(params)
+            stats["histogram"][bisect.bisect_left(HISTOGRAM_BUCKETS_MS, duration_ms)] += 1
+        for stats in commands.values():
+            stats["histogram"] = dict(zip(labels, stats["histogram"]))
+
+        # Remote drivers know the grid round-trip time, which each command pays on top
+        # of the time spent in the browser.
+        overhead_ms = getattr(self.driver, "remote_overhead_ms", None)
+        if overhead_ms is not None:
+            for stats in commands.values():
+                stats["remote_ms"] = min(stats["total_ms"], stats["count"] * overhead_ms)
+                stats["browser_ms"] = stats["total_ms"] - stats["remote_ms"]
+
+        slowest_calls = sorted(self.records, key=lambda record: record[2], reverse=True)[:slowest]
+        summary = {
+            "total_commands": len(self.records),
+            "total_ms": sum(record[2] for record in self.records) * 1000,
+            "commands": commands,
+            "slowest": [
+                {"command": command, "caller": caller, "ms": duration * 1000,
+                 "bytes": self._size(params)}
+                for command, caller, duration, params in slowest_calls
+            ],
+        }
+        if overhead_ms is not None:
+            summary["remote_overhead_ms"] = overhead_ms
+            summary["remote_ms"] = sum(stats["remote_ms"] for stats in commands.values())
+            summary["browser_ms"] = summary["total_ms"] - summary["remote_ms"]
+        return summary
+
+    @staticmethod
+    def format_table(summary: Dict[str, Any]) -> str:
+        """
+        Formats the slowest-calls table and per-command totals as plain text.
+
+        Args:
+            summary (dict): A summary returned by `summary`.
+
+        Returns:
+            str: The human readable report.
+        """
+        lines = [f"{summary['total_commands']} commands, {summary['total_ms']:.1f} ms total"]
+        if "remote_ms" in summary:
+            lines.append(f"{summary['remote_ms']:.1f} ms remote overhead "
+                         f"({summary['remote_overhead_ms']:.1f} ms per command), "
+                         f"{summary['browser_ms']:.1f} ms in the browser")
+        lines += ["", f"{'command':<32}{'count':>8}{'total ms':>12}{'bytes':>10}"]
+        for command, stats in sorted(summary["commands"].items(),
+                                     key=lambda item: item[1]["total_ms"], reverse=True):
+            lines.append(f"{command:<32}{stats['count']:>8}{stats['total_ms']:>12.1f}"
+                         f"{stats['bytes']:>10}")
+        lines += ["", "Slowest calls:", f"{'ms':>10}  {'command':<32}caller"]
+        for call in summary["slowest"]:
+            lines.append(f"{call['ms']:>10.1f}  {call['command']:<32}{call['caller']}")
+        return "\n".join(lines)
+
+    def write_report(self, test_id: str) -> str:
+        """
+        Writes the summary of the recorded commands as JSON under `config.TRACE_DIR`.
+
+        Args:
+            test_id (str): The pytest node id of the test the commands belong to.
+
+        Returns:
+            str: The path of the written JSON file.
+        """
+        summary = self.summary()
+        summary["test"] = test_id
+        trace_dir = f"{utils.get_root_path()}/{config.TRACE_DIR}"
+        os.makedirs(trace_dir, exist_ok=True)
+        file_name = "".join(char if char.isalnum() else "_" for char in test_id)
+        worker = utils.get_worker_id()
+        file_path = f"{trace_dir}/{worker}-{file_name}.json"
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(summary, file, indent=2)
+        self.logger.info("Command latency report written to: %s", file_path)
+        return file_path
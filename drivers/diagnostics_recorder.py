@@ -0,0 +1,187 @@
+"""
+Module providing failure-only diagnostic capture.
+"""
+import collections
+import json
+import os
+import time
+import zipfile
+from typing import Any, Dict, List
+
+from config import config
+from utilities import utils
+from utilities.logger import Logger
+
+# Installed at the start of every document of a Chromium driver (see
+# `DiagnosticsRecorder.record_network`). Keeps the most recent resource timing entries in
+# a bounded ring, since the browser's own buffer stops recording after 250 entries.
+NETWORK_RING_SCRIPT = """
+if (!window.__wapNetwork && window.PerformanceObserver) {
+    var ring = window.__wapNetwork = [];
+    new PerformanceObserver(function (list) {
+        list.getEntries().forEach(function (e) {
+            ring.push(e);
+            if (ring.length > %d) { ring.shift(); }
+        });
+    }).observe({type: 'resource', buffered: true});
+}
+"""
+
+# Reads the most recent network events from the ring, or from the browser's resource
+# timing buffer on drivers without it, so network activity costs nothing until a test fails.
+NETWORK_EVENTS_SCRIPT = """
+var entries = window.__wapNetwork || performance.getEntriesByType('resource');
+return entries.slice(-arguments[0]).map(function (e) {
+    return {url: e.name, initiator: e.initiatorType, start_ms: e.startTime,
+            duration_ms: e.duration, transfer_size: e.transferSize,
+            status: e.responseStatus};
+});
+"""
+
+
+class DiagnosticsRecorder:
+    """
+    Keeps the last `config.DIAGNOSTICS_BUFFER_SIZE` WebDriver commands of a driver in
+    a ring buffer and, only when a test fails, materializes a full capture: DOM snapshot,
+    screenshot, console messages, recent network events and the command buffer, written
+    as one compressed archive.
+
+    While a test passes, the only cost is appending a tuple per command. Console
+    messages are buffered by the driver itself (the "browser" log) and network events
+    in-page, and both are read only on failure. Chromium drivers keep the network events
+    in a bounded ring installed at document start (see `record_network`); other drivers
+    read the browser's resource timing buffer, which stops recording after 250 entries.
+
+    Usage:
+        recorder = DiagnosticsRecorder.attach(driver).diagnostics
+        ...
+        archive = recorder.capture("tests/test_search_page.py::test_x")
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, driver: Any, size: int = config.DIAGNOSTICS_BUFFER_SIZE) -> None:
+        self.driver = driver
+        self.size = size
+        self.commands: collections.deque = collections.deque(maxlen=size)
+        self.started = time.time()
+        self._execute = driver.command_executor.execute
+
+    @classmethod
+    def attach(cls, driver: Any) -> Any:
+        """
+        Wraps the command executor of the driver with a recorder, exposed as
+        `driver.diagnostics`.
+
+        Args:
+            driver (WebDriver): The driver to instrument.
+
+        Returns:
+            WebDriver: The same driver, instrumented.
+        """
+        recorder = cls(driver)
+        driver.command_executor.execute = recorder.execute
+        driver.diagnostics = recorder
+        cls.record_network(driver, recorder.size)
+        cls.logger.debug("Diagnostics recorder attached to driver.")
+        return driver
+
+    @staticmethod
+    def record_network(driver: Any, size: int = config.DIAGNOSTICS_BUFFER_SIZE) -> Any:
+        """
+        Installs the bounded network event ring at the start of every new document of a
+        Chromium driver. Other drivers are left to the resource timing buffer.
+
+        Args:
+            driver (WebDriver): The driver to instrument.
+            size (int): The number of most recent network events kept.
+
+        Returns:
+            WebDriver: The same driver.
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                                   {"source": NETWORK_RING_SCRIPT % size})
+        return driver
+
+    def execute(self, command: str, params: Dict = None) -> Any:
+        """
+        Executes a WebDriver command through the original executor and keeps it in
+        the ring buffer. The parameters are only serialized if a capture is made.
+
+        Args:
+            command (str): The WebDriver command name.
+            params (dict): The command parameters.
+
+        Returns:
+            The response of the original executor.
+        """
+        start = time.time()
+        error = None
+        try:
+            return self._execute(command, params)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.commands.append((start, command, params, time.time() - start, error))
+
+    def reset(self) -> None:
+        """
+        Discards the buffered commands and ignores older console messages, e.g. at the
+        start of a test.
+        """
+        self.commands.clear()
+        self.started = time.time()
+
+    def capture(self, test_id: str) -> str:
+        """
+        Captures the state of the browser after a failure into a zip archive under
+        `data/diagnostics`. Every part is captured independently, so a dead session
+        still yields the command buffer.
+
+        Args:
+            test_id (str): The pytest node id of the failed test.
+
+        Returns:
+            str: The path of the written archive.
+        """
+        parts = {"commands.json": json.dumps(self._command_records(), indent=2, default=repr)}
+        captures = {
+            "page.html": lambda: self.driver.page_source,
+            "screenshot.png": self.driver.get_screenshot_as_png,
+            "console.json": lambda: json.dumps(self._console_messages(), indent=2),
+            "network.json": lambda: json.dumps(
+                self.driver.execute_script(NETWORK_EVENTS_SCRIPT, self.size), indent=2),
+            "meta.json": lambda: json.dumps({"test": test_id, "url": self.driver.current_url,
+                                             "title": self.driver.title,
+                                             "worker": utils.get_worker_id()}, indent=2),
+        }
+        for name, capture in captures.items():
+            try:
+                parts[name] = capture()
+            except Exception as e:
+                self.logger.warning("Could not capture %s: %s", name, e)
+
+        file_path = utils.get_artifact_path("diagnostics", "diagnostics.zip")
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with zipfile.ZipFile(file_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, content in parts.items():
+                archive.writestr(name, content)
+        self.logger.info("Failure diagnostics written to: %s", file_path)
+        return file_path
+
+    def _console_messages(self) -> List[Dict[str, Any]]:
+        """
+        Reads the console messages logged since the last reset, at most the buffer size.
+        """
+        messages = [entry for entry in self.driver.get_log("browser")
+                    if entry["timestamp"] / 1000 >= self.started]
+        return messages[-self.size:]
+
+    def _command_records(self) -> List[Dict[str, Any]]:
+        """
+        Serializes the buffered commands, oldest first.
+        """
+        return [{"time": start, "command": command, "params": params,
+                 "ms": duration * 1000, "error": repr(error) if error else None}
+                for start, command, params, duration, error in self.commands]
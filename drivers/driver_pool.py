@@ -0,0 +1,250 @@
+"""
+Module providing a pool of warm WebDriver sessions.
+"""
+from typing import Any, Dict, List
+from urllib.parse import urlsplit
+
+from drivers.browser_factory import BrowserFactory
+from drivers.session_governor import SessionGovernor
+from config import config
+from utilities import utils
+from utilities.logger import Logger
+
+
+class PooledDriver:
+    """
+    A WebDriver session owned by the pool together with its usage bookkeeping.
+
+    Attributes:
+        driver: The Selenium WebDriver instance.
+        uses (int): The number of tests this session has served.
+    """
+
+    def __init__(self, driver: Any) -> None:
+        self.driver = driver
+        self.uses = 0
+
+
+class DriverPool:
+    """
+    A pool of warm WebDriver sessions for a single pytest-xdist worker.
+
+    Instead of launching a new browser for every test, sessions are handed out
+    with `acquire`, reset to a clean state and given back with `release`. A session
+    is recycled after `config.POOL_RECYCLE_AFTER` tests, when its browser uses more
+    memory than `config.GOVERNOR_MAX_SESSION_RSS` or, when
+    `config.POOL_RECYCLE_ON_FAILURE` is set, after a failed test.
+
+    Traced tests get sessions from a separate pool per worker, whose browsers record
+    `config.TIMELINE_CATEGORIES`, so untraced tests never pay for tracing.
+
+    Usage:
+        pool = DriverPool.for_worker()
+        driver = pool.acquire()
+        ...
+        pool.release(driver, failed=False)
+    """
+    logger = Logger(__name__)
+    _pools: Dict[str, "DriverPool"] = {}
+
+    def __init__(self, browser_name: str, options: List[str] = None,
+                 size: int = config.POOL_SIZE,
+                 recycle_after: int = config.POOL_RECYCLE_AFTER,
+                 device_name: str = None, trace_categories: List[str] = None) -> None:
+        self.browser_name = browser_name
+        self.options = options
+        self.device_name = device_name
+        self.trace_categories = trace_categories
+        self.size = size
+        self.recycle_after = recycle_after
+        self._idle: List[PooledDriver] = []
+        self._in_use: Dict[int, PooledDriver] = {}
+
+    @staticmethod
+    def worker_id() -> str:
+        """
+        Returns the pytest-xdist worker id of the current process.
+
+        Returns:
+            str: The worker id (e.g. "gw0"), or "master" when xdist is not used.
+        """
+        return utils.get_worker_id()
+
+    @classmethod
+    def for_worker(cls, traced: bool = False) -> "DriverPool":
+        """
+        Returns the pool of the current pytest-xdist worker, creating it on first use.
+        Remote sessions are only reused when `config.GRID_SESSION_REUSE` is set, and
+        browser contexts are never reused.
+
+        Args:
+            traced (bool): Whether to return the pool of sessions recording a DevTools trace.
+
+        Returns:
+            DriverPool: The pool bound to the current worker.
+        """
+        worker = cls.worker_id()
+        key = f"{worker}-traced" if traced else worker
+        if key not in cls._pools:
+            cls.logger.info("Creating driver pool: %s", key)
+            recycle_after = config.POOL_RECYCLE_AFTER
+            if config.BROWSER == "remote" and not config.GRID_SESSION_REUSE:
+                recycle_after = 1
+            # A new browser context is cheap and isolates every origin, unlike a reset.
+            if config.BROWSER == "chrome-contexts":
+                recycle_after = 1
+            cls._pools[key] = cls(config.BROWSER, config.BROWSER_OPTIONS,
+                                  recycle_after=recycle_after,
+                                  device_name=config.DEVICE_NAME,
+                                  trace_categories=config.TIMELINE_CATEGORIES if traced else None)
+        return cls._pools[key]
+
+    def acquire(self) -> Any:
+        """
+        Hands out a warm WebDriver session, launching a new one if none is idle.
+
+        Returns:
+            WebDriver: A session positioned on `config.URL` with a clean state.
+        """
+        while self._idle:
+            pooled = self._idle.pop()
+            if self._is_healthy(pooled):
+                self.logger.info("Reusing pooled session (uses: %s)", pooled.uses)
+                break
+            self._quit(pooled)
+        else:
+            pooled = PooledDriver(self._launch())
+
+        pooled.uses += 1
+        self._in_use[id(pooled.driver)] = pooled
+        pooled.driver.get(config.URL)
+        return pooled.driver
+
+    def release(self, driver: Any, failed: bool = False) -> None:
+        """
+        Gives a session back to the pool, resetting or recycling it.
+
+        Args:
+            driver (WebDriver): The session previously returned by `acquire`.
+            failed (bool): Whether the test that used the session failed.
+        """
+        pooled = self._in_use.pop(id(driver), None)
+        if pooled is None:
+            self.logger.warning("Released a driver that does not belong to the pool")
+            return
+
+        if failed and config.POOL_RECYCLE_ON_FAILURE:
+            self.logger.info("Recycling session after a failed test")
+            self._quit(pooled)
+        elif SessionGovernor.should_recycle(pooled.driver):
+            self.logger.info("Recycling session using too much memory")
+            self._quit(pooled)
+        elif pooled.uses >= self.recycle_after:
+            self.logger.info("Recycling session after %s tests", pooled.uses)
+            self._quit(pooled)
+        elif len(self._idle) >= self.size:
+            self.logger.info("Pool is full, closing session")
+            self._quit(pooled)
+        else:
+            try:
+                self._reset(pooled.driver)
+                self._idle.append(pooled)
+            except Exception as e:
+                self.logger.warning("Could not reset session, recycling it: %s", e)
+                self._quit(pooled)
+
+    def close(self) -> None:
+        """
+        Quits every session owned by the pool.
+        """
+        self.logger.info("Closing driver pool.")
+        for pooled in self._idle + list(self._in_use.values()):
+            self._quit(pooled)
+        self._idle.clear()
+        self._in_use.clear()
+
+    @classmethod
+    def close_all(cls) -> None:
+        """
+        Closes the pools of every worker known to this process.
+        """
+        for pool in cls._pools.values():
+            pool.close()
+        cls._pools.clear()
+
+    def _launch(self) -> Any:
+        """
+        Launches a new WebDriver session through the BrowserFactory, once the
+        SessionGovernor allows it.
+
+        Returns:
+            WebDriver: A freshly started session.
+        """
+        self.logger.info("Launching new %s session for the pool", self.browser_name)
+        browser = BrowserFactory.get_browser(self.browser_name, self.options, self.device_name)
+        browser.trace_categories = self.trace_categories
+        return SessionGovernor.launch(browser)
+
+    def _reset(self, driver: Any) -> None:
+        """
+        Resets a session between tests by closing extra windows and clearing
+        cookies and web storage.
+
+        Chrome and Edge clear the cookies of every domain through DevTools, and the
+        storage (local storage, IndexedDB, caches, service workers) of the current origin
+        and of `config.URL`. WebDriver alone, e.g. on Firefox, can only clear the
+        cookies and storage of the current origin, so state of other origins visited
+        during a test survives until the session is recycled (`config.POOL_RECYCLE_AFTER`).
+
+        Args:
+            driver (WebDriver): The session to reset.
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            origins = {driver.execute_script("return window.location.origin;"),
+                       "{0.scheme}://{0.netloc}".format(urlsplit(config.URL))}
+            for origin in origins - {None, "null"}:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                       {"origin": origin, "storageTypes": "all"})
+        else:
+            driver.delete_all_cookies()
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+        self.logger.debug("Pooled session state reset.")
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        """
+        Checks that a pooled session still answers commands.
+
+        Args:
+            pooled (PooledDriver): The session to probe.
+
+        Returns:
+            bool: True if the session is usable, otherwise False.
+        """
+        if not config.POOL_HEALTH_CHECK:
+            return True
+        try:
+            pooled.driver.execute_script("return 1;")
+            return True
+        except Exception as e:
+            self.logger.warning("Pooled session failed health check: %s", e)
+            return False
+
+    def _quit(self, pooled: PooledDriver) -> None:
+        """
+        Quits a pooled session, ignoring errors from already dead sessions.
+
+        Args:
+            pooled (PooledDriver): The session to quit.
+        """
+        try:
+            pooled.driver.quit()
+            self.logger.info("Pooled browser instance closed.")
+        except Exception as e:
+            self.logger.warning("Error while quitting pooled session: %s", e)
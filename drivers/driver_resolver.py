@@ -0,0 +1,160 @@
+"""
+Module providing cached driver and browser binary resolution.
+"""
+import json
+import os
+import platform
+import time
+from typing import Any, Dict, Optional
+
+import selenium
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+
+from config import config
+from utilities.file_lock import FileLock
+from utilities.logger import Logger
+
+CACHE_FORMAT_VERSION = 2
+
+
+class DriverResolver:
+    """
+    Resolves the driver (chromedriver, geckodriver, msedgedriver) and browser binaries
+    once per machine and caches the paths, so later sessions and other pytest-xdist
+    workers skip Selenium Manager discovery entirely.
+
+    The cache is a JSON file in `config.DRIVER_CACHE_DIR`, keyed by browser and
+    invalidated when the cache format, the Selenium version or the platform changes,
+    when a cached binary no longer exists, or when the browser binary changed since
+    discovery (its size and modification time, so a browser update to a new major
+    version gets a matching driver). Browsers also call `invalidate` and retry when a
+    session cannot be created with the cached driver. Discovery runs under a file lock so
+    workers never race on it. With `config.DRIVER_OFFLINE` discovery never runs and a
+    missing cache entry fails fast.
+    """
+    logger = Logger(__name__)
+    _memory_cache: Dict[str, Dict[str, str]] = {}
+
+    @classmethod
+    def resolve(cls, options: Any) -> Dict[str, str]:
+        """
+        Returns the driver and browser binary paths for the browser of the options.
+
+        Args:
+            options: The Selenium options of the browser (e.g. ChromeOptions).
+
+        Returns:
+            dict: The "driver_path" and "browser_path" of the browser.
+
+        Raises:
+            FileNotFoundError: In offline mode, if no valid cached binary exists.
+        """
+        browser_name = options.capabilities["browserName"]
+        if browser_name in cls._memory_cache:
+            return cls._memory_cache[browser_name]
+
+        cache_file = os.path.join(os.path.expanduser(config.DRIVER_CACHE_DIR), "drivers.json")
+        paths = cls._read_cache(cache_file).get(browser_name)
+        if not cls._is_valid(paths):
+            if config.DRIVER_OFFLINE:
+                raise FileNotFoundError(
+                    f"No cached driver for {browser_name} in {cache_file} (offline mode)")
+            with FileLock(f"{cache_file}.lock"):
+                cache = cls._read_cache(cache_file)
+                paths = cache.get(browser_name)
+                if not cls._is_valid(paths):
+                    paths = cls._discover(browser_name)
+                    cache[browser_name] = paths
+                    cls._write_cache(cache_file, cache)
+        cls.logger.debug("Resolved %s binaries: %s", browser_name, paths)
+        cls._memory_cache[browser_name] = paths
+        return paths
+
+    @classmethod
+    def _discover(cls, browser_name: str) -> Dict[str, str]:
+        """
+        Runs Selenium Manager to find or download the binaries of a browser.
+        """
+        cls.logger.info("Discovering %s binaries with Selenium Manager", browser_name)
+        start = time.perf_counter()
+        output = SeleniumManager().binary_paths(["--browser", browser_name])
+        cls.logger.info("Discovered %s binaries in %.2fs", browser_name,
+                        time.perf_counter() - start)
+        return {"driver_path": output["driver_path"], "browser_path": output["browser_path"],
+                "browser_stamp": cls._stamp(output["browser_path"])}
+
+    @classmethod
+    def invalidate(cls, options: Any) -> Optional[Dict[str, str]]:
+        """
+        Drops the cached paths of the browser of the options, so the next `resolve`
+        discovers them again.
+
+        Args:
+            options: The Selenium options of the browser (e.g. ChromeOptions).
+
+        Returns:
+            dict: The paths that were cached, or None if none were.
+        """
+        browser_name = options.capabilities["browserName"]
+        stale = cls._memory_cache.pop(browser_name, None)
+        cache_file = os.path.join(os.path.expanduser(config.DRIVER_CACHE_DIR), "drivers.json")
+        with FileLock(f"{cache_file}.lock"):
+            cache = cls._read_cache(cache_file)
+            if cache.pop(browser_name, None) is not None:
+                cls._write_cache(cache_file, cache)
+        cls.logger.warning("Dropped the cached %s binaries: %s", browser_name, stale)
+        return stale
+
+    @staticmethod
+    def _stamp(path: str) -> Optional[str]:
+        """
+        Returns the size and modification time of a binary, which change when it is updated.
+        """
+        try:
+            info = os.stat(path)
+        except (OSError, TypeError):
+            return None
+        return f"{info.st_size}-{info.st_mtime_ns}"
+
+    @classmethod
+    def _is_valid(cls, paths: Dict[str, str]) -> bool:
+        """
+        Checks that a cache entry exists, its driver binary is still on disk and its
+        browser binary was not updated since discovery.
+        """
+        return bool(paths) and os.path.isfile(paths["driver_path"]) and (
+            not paths["browser_path"]
+            or cls._stamp(paths["browser_path"]) == paths.get("browser_stamp"))
+
+    @staticmethod
+    def _cache_key() -> str:
+        """
+        Returns the version stamp a cache file must match to be used.
+        """
+        return (f"{CACHE_FORMAT_VERSION}-{selenium.__version__}"
+                f"-{platform.system()}-{platform.machine()}")
+
+    @classmethod
+    def _read_cache(cls, cache_file: str) -> Dict[str, Dict[str, str]]:
+        """
+        Reads the cached paths, ignoring caches written for another version stamp.
+        """
+        try:
+            with open(cache_file, encoding="utf-8") as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("version") != cls._cache_key():
+            return {}
+        return cache.get("browsers", {})
+
+    @classmethod
+    def _write_cache(cls, cache_file: str, browsers: Dict[str, Dict[str, str]]) -> None:
+        """
+        Atomically writes the cached paths with the current version stamp.
+        """
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}"
+        with open(tmp_file, "w", encoding="utf-8") as file:
+            json.dump({"version": cls._cache_key(), "browsers": browsers}, file, indent=2)
+        os.replace(tmp_file, cache_file)
@@ -2,16 +2,22 @@
 Module FireFox configurations.
 """
 from selenium.webdriver.firefox.options import Options
+from selenium.webdriver.firefox.service import Service
 from selenium import webdriver
-from drivers.browser import Browser
+from drivers.animation_freezer import AnimationFreezer
+from drivers.local_browser import LocalBrowser
+from drivers.driver_resolver import DriverResolver
+from drivers.request_blocker import RequestBlocker
 from utilities.logger import Logger
+from utilities.replay_proxy import ReplayProxy
+from config import config
 
 
-class FirefoxBrowser(Browser):
+class FirefoxBrowser(LocalBrowser):
     """
     A class to manage the FireFox browser for Selenium WebDriver with custom options.
 
-    This class inherits from the `Browser` class and is used to create a Selenium WebDriver
+    This class inherits from the `LocalBrowser` class and is used to create a Selenium WebDriver
     instance for FireFox with specific options.
     """
     logger = Logger(__name__)
@@ -25,14 +31,36 @@ class FirefoxBrowser(Browser):
         """
         try:
             self.logger.info("Initializing FireFox WebDriver")
-            firefox_options = Options()
-            self._add_options(firefox_options)
+            firefox_options = self.build_options()
+            self._add_proxy(firefox_options)
+            self._add_profile(firefox_options)
+            self._add_blocking(firefox_options)
             self.logger.info("FireFox WebDriver successfully initialized")
-            return webdriver.Firefox(options=firefox_options)
+            driver = self.start_session(
+                lambda service: webdriver.Firefox(options=firefox_options, service=service),
+                firefox_options)
+            return self.instrument(driver)
         except Exception as e:
-            self.logger.error(f"Failed to initialize FireFox WebDriver: {str(e)}")
+            self.logger.error("Failed to initialize FireFox WebDriver: %s", e)
             raise
 
+    def build_options(self) -> Options:
+        """
+        Builds the options of the browser that do not depend on this machine, i.e.
+        without the replay proxy and the profile, so they also configure the Firefox of
+        a Selenium Grid.
+
+        Returns:
+            Options: The Selenium options of the browser.
+        """
+        firefox_options = Options()
+        self._add_options(firefox_options)
+        self._add_freeze(firefox_options)
+        if self.trace_categories:
+            self.logger.warning(
+                "FireFox records no DevTools trace, timelines only hold page-object spans")
+        return firefox_options
+
     def _add_options(self, firefox_options: Options) -> None:
         """
         Adds custom options to the Firefox WebDriver instance based on the `self.options` attribute.
@@ -46,10 +74,88 @@ class FirefoxBrowser(Browser):
                 self.logger.info("Adding FireFox options")
                 for option in self.options:
                     firefox_options.add_argument(option)
-                    self.logger.debug(f"Added option: {option}")
+                    self.logger.debug("Added option: %s", option)
                 self.logger.info("All FireFox options added successfully")
             else:
                 self.logger.warning("No options provided for FireFox WebDriver")
         except Exception as e:
-            self.logger.error(f"Error while adding FireFox options: {str(e)}")
+            self.logger.error("Error while adding FireFox options: %s", e)
             raise
+
+    def _add_proxy(self, firefox_options: Options) -> None:
+        """
+        Points the FireFox WebDriver instance at the record/replay proxy when one is running.
+
+        Args:
+            firefox_options (Options): The Options instance to which the proxy
+            preferences are added.
+        """
+        if ReplayProxy.active:
+            self.logger.info("Routing FireFox traffic through proxy: %s",
+                             ReplayProxy.active.address)
+            host, port = ReplayProxy.active.server_address[:2]
+            firefox_options.set_preference("network.proxy.type", 1)
+            firefox_options.set_preference("network.proxy.http", host)
+            firefox_options.set_preference("network.proxy.http_port", port)
+            firefox_options.set_preference("network.proxy.ssl", host)
+            firefox_options.set_preference("network.proxy.ssl_port", port)
+            firefox_options.accept_insecure_certs = True
+
+    def _add_blocking(self, firefox_options: Options) -> None:
+        """
+        Applies the preferences equivalent to the configured request blocking profile.
+
+        Args:
+            firefox_options (Options): The Options instance to which the preferences
+            are added.
+        """
+        for name, value in RequestBlocker.firefox_preferences().items():
+            self.logger.debug("Set FireFox preference %s=%s", name, value)
+            firefox_options.set_preference(name, value)
+
+    def _add_freeze(self, firefox_options: Options) -> None:
+        """
+        Applies the reduced motion and autoplay preferences of the freeze mode when
+        `freeze_animations` is set.
+
+        Args:
+            firefox_options (Options): The Options instance to which the preferences
+            are added.
+        """
+        if self.freeze_animations:
+            for name, value in AnimationFreezer.firefox_preferences().items():
+                self.logger.debug("Set FireFox preference %s=%s", name, value)
+                firefox_options.set_preference(name, value)
+
+    def _add_profile(self, firefox_options: Options) -> None:
+        """
+        Starts the FireFox WebDriver instance with the user-data directory returned by
+        `get_profile_dir`, if any.
+
+        Args:
+            firefox_options (Options): The Options instance to which the profile is added.
+        """
+        profile_dir = self.get_profile_dir()
+        if profile_dir:
+            self.logger.info("Using FireFox profile: %s", profile_dir)
+            firefox_options.add_argument("-profile")
+            firefox_options.add_argument(profile_dir)
+
+    def _create_service(self, options: Options) -> Service:
+        """
+        Creates a Service with an explicit driver path from the DriverResolver cache, so
+        the FireFox WebDriver instance skips driver and browser discovery.
+
+        Args:
+            options (Options): The Options instance whose browser binary is set from the
+            cache.
+
+        Returns:
+            Service: The FireFox driver service, or a default one if the cache is disabled.
+        """
+        if not config.DRIVER_CACHE:
+            return Service()
+        paths = DriverResolver.resolve(options)
+        if paths["browser_path"] and not options.binary_location:
+            options.binary_location = paths["browser_path"]
+        return Service(executable_path=paths["driver_path"])
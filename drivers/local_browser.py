@@ -0,0 +1,56 @@
+"""
+Module local browser interface.
+"""
+from abc import abstractmethod
+from typing import Any, Callable
+
+from selenium.common.exceptions import SessionNotCreatedException
+
+from config import config
+from drivers.browser import Browser
+from drivers.driver_resolver import DriverResolver
+
+
+class LocalBrowser(Browser):
+    """
+    An abstract base class for a browser started on this machine through a driver
+    service, as opposed to remote sessions and browser contexts, which never start a
+    driver themselves.
+    """
+
+    def start_session(self, create: Callable[[Any], Any], options: Any) -> Any:
+        """
+        Starts a web driver with the service of `_create_service`. When the cached
+        driver cannot create a session (e.g. the browser was updated to a major version
+        it does not support), the cached binaries are dropped and the session is started
+        once more with freshly resolved ones.
+
+        Args:
+            create (Callable): Creates the web driver from a driver service.
+            options: The Selenium options of the browser.
+
+        Returns:
+            The web driver instance.
+        """
+        try:
+            return create(self._create_service(options))
+        except SessionNotCreatedException:
+            if not config.DRIVER_CACHE or config.DRIVER_OFFLINE:
+                raise
+            stale = DriverResolver.invalidate(options)
+            if stale and options.binary_location == stale["browser_path"]:
+                options.binary_location = ""
+            return create(self._create_service(options))
+
+    @abstractmethod
+    def _create_service(self, options: Any) -> Any:
+        """
+        Abstract method to create the driver service of the browser, resolving the
+        driver and browser binaries into `options` when the driver cache is enabled.
+
+        Args:
+            options: The Selenium options of the browser.
+
+        Returns:
+            The Selenium driver service of the browser.
+        """
@@ -0,0 +1,216 @@
+"""
+Module providing pre-warmed browser profile templates.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Type
+
+from config import config
+from utilities import utils
+from utilities.file_lock import FileLock
+from utilities.logger import Logger
+from utilities.page_readiness import PageReadiness
+
+LOCK_FILE_PATTERNS = ("Singleton*", "lock", ".parentlock", "parent.lock")
+
+
+class ProfileTemplate:
+    """
+    A browser user-data directory that has already visited `config.URL`, so its HTTP
+    cache and service worker are warm.
+
+    The template is built once per machine and browser class, rebuilt when it is older
+    than `config.PROFILE_TEMPLATE_MAX_AGE` hours or was built for another URL, and each
+    session gets a cheap copy of it (reflink where the filesystem supports it).
+
+    Attributes:
+        browser: The Browser instance the template is built for.
+        path (str): The directory of the template.
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, browser: Any) -> None:
+        self.browser = browser
+        name = type(browser).__name__.lower()
+        self.path = f"{utils.get_root_path()}/{config.PROFILE_TEMPLATE_DIR}/{name}"
+
+    def is_stale(self) -> bool:
+        """
+        Checks whether the template is missing or must be rebuilt.
+
+        Returns:
+            bool: True if the template must be (re)built, otherwise False.
+        """
+        metadata = self._read_metadata()
+        if metadata is None:
+            return True
+        age_hours = (time.time() - metadata["built_at"]) / 3600
+        return metadata["url"] != config.URL or age_hours > config.PROFILE_TEMPLATE_MAX_AGE
+
+    def ensure(self) -> None:
+        """
+        Builds the template if it is stale. Only one process builds it at a time.
+        """
+        if not self.is_stale():
+            return
+        with FileLock(f"{self.path}.lock"):
+            if self.is_stale():
+                self.build()
+
+    def build(self) -> None:
+        """
+        Builds the template by visiting `config.URL` once with a fresh profile.
+        """
+        self.logger.info("Building profile template: %s", self.path)
+        shutil.rmtree(self.path, ignore_errors=True)
+        os.makedirs(self.path)
+        builder = type(self.browser)(self.browser.options)
+        builder.device_name = self.browser.device_name
+        builder.profile_dir = self.path
+        builder.use_profile_template = False
+        driver = builder.get_driver()
+        try:
+            driver.get(config.URL)
+            PageReadiness(driver).wait_until_stable()
+        finally:
+            driver.quit()
+        with open(f"{self.path}/template.json", "w", encoding="utf-8") as file:
+            json.dump({"url": config.URL, "built_at": time.time()}, file)
+        self.logger.info("Profile template built: %s", self.path)
+
+    def clone(self) -> str:
+        """
+        Makes a private copy of the template for one session, building it first if needed.
+
+        Returns:
+            str: The directory of the copy. It is removed when the driver quits.
+        """
+        self.ensure()
+        clone_dir = f"{tempfile.mkdtemp(prefix='wap-profile-')}/profile"
+        try:
+            subprocess.run(["cp", "-a", "--reflink=auto", self.path, clone_dir],
+                           check=True, capture_output=True)
+        except (OSError, subprocess.CalledProcessError):
+            shutil.copytree(self.path, clone_dir,
+                            ignore=shutil.ignore_patterns(*LOCK_FILE_PATTERNS))
+        for root, _, files in os.walk(clone_dir):
+            for file_name in files:
+                if any(fnmatch.fnmatch(file_name, p) for p in LOCK_FILE_PATTERNS):
+                    os.remove(os.path.join(root, file_name))
+        self.logger.debug("Profile template cloned to: %s", clone_dir)
+        return clone_dir
+
+    @staticmethod
+    def remove_on_quit(driver: Any, profile_dir: str) -> None:
+        """
+        Makes `driver.quit` also remove the cloned profile directory.
+
+        Args:
+            driver (WebDriver): The driver using the cloned profile.
+            profile_dir (str): The cloned profile directory.
+        """
+        quit_driver = driver.quit
+
+        def quit_and_remove() -> None:
+            try:
+                quit_driver()
+            finally:
+                shutil.rmtree(os.path.dirname(profile_dir), ignore_errors=True)
+
+        driver.quit = quit_and_remove
+
+    def _read_metadata(self) -> Dict[str, Any]:
+        """
+        Reads the build metadata of the template.
+
+        Returns:
+            dict: The metadata, or None if the template was never built.
+        """
+        try:
+            with open(f"{self.path}/template.json", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+
+def benchmark(browser_class: Type[Any], runs: int) -> Dict[str, float]:
+    """
+    Compares cold and templated startup of a browser class. Each run measures
+    `get_driver()` plus loading `config.URL` until the page is stable.
+
+    Args:
+        browser_class (Type[Browser]): The browser class, e.g. ChromeBrowser.
+        runs (int): The number of sessions started in each mode.
+
+    Returns:
+        dict: The mean startup time, in seconds, of each mode.
+    """
+    results = {}
+    for mode in ("cold", "templated"):
+        timings = []
+        for _ in range(runs):
+            browser = browser_class(config.BROWSER_OPTIONS)
+            browser.use_profile_template = mode == "templated"
+            if mode == "templated":
+                ProfileTemplate(browser).ensure()
+            start = time.perf_counter()
+            driver = browser.get_driver()
+            try:
+                driver.get(config.URL)
+                PageReadiness(driver).wait_until_stable()
+                timings.append(time.perf_counter() - start)
+            finally:
+                driver.quit()
+        results[mode] = sum(timings) / len(timings)
+    return results
+
+
+def main(browser_classes: Dict[str, Type[Any]], argv: List[str] = None) -> int:
+    """
+    Builds or benchmarks the profile templates of the browsers named on the command line.
+
+    Args:
+        browser_classes (dict): The browser classes by browser name, e.g.
+                                `BrowserFactory.browsers`.
+        argv (List[str]): The command-line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit code.
+    """
+    parser = argparse.ArgumentParser(description="Build or benchmark browser profile templates.")
+    parser.add_argument("browsers", nargs="*", default=[config.BROWSER],
+                        help="Browser names (chrome, firefox, edge).")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the templates.")
+    parser.add_argument("--benchmark", type=int, metavar="RUNS",
+                        help="Compare cold and templated startup over RUNS sessions.")
+    args = parser.parse_args(argv)
+    unknown = [browser_name for browser_name in args.browsers
+               if browser_name.lower() not in browser_classes]
+    if unknown:
+        parser.error(f"invalid browser name: {', '.join(unknown)}")
+
+    for browser_name in args.browsers:
+        browser_class = browser_classes[browser_name.lower()]
+        template = ProfileTemplate(browser_class(config.BROWSER_OPTIONS))
+        if args.rebuild:
+            with FileLock(f"{template.path}.lock"):
+                template.build()
+        if args.benchmark:
+            results = benchmark(browser_class, args.benchmark)
+            print(f"{browser_name}: cold {results['cold']:.2f}s, "
+                  f"templated {results['templated']:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    # The browser classes import this module, so they are only loaded when it runs as a
+    # script and then handed to main().
+    from drivers.browser_factory import BrowserFactory
+    sys.exit(main(BrowserFactory.browsers))
@@ -0,0 +1,139 @@
+"""
+Module Remote (Selenium Grid) configurations.
+"""
+import statistics
+import time
+
+import urllib3
+from selenium import webdriver
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from config import config
+from drivers.browser import Browser
+from drivers.chrome_browser import ChromeBrowser
+from drivers.edge_browser import EdgeBrowser
+from drivers.firefox_browser import FirefoxBrowser
+from utilities.logger import Logger
+from utilities.replay_proxy import ReplayProxy
+
+
+class KeepAliveConnection(RemoteConnection):
+    """
+    A RemoteConnection whose keep-alive connection pool is shared by every session of
+    the process (i.e. of the pytest-xdist worker), so sessions after the first one skip
+    the TCP and TLS handshakes with the grid. Each session still gets its own
+    connection object, so the instrumentation wrapping its `execute` (see
+    `Browser.instrument`) never sees the commands of other sessions and is freed with
+    the session.
+
+    Connection errors are retried with exponential backoff for every command, since the
+    request never reached the grid; 502/503/504 answers only for GET and DELETE
+    commands, which are safe to repeat. Read errors are not retried, because the node
+    may already have run the command. The retry policy is handed to the pool manager
+    through the public `init_args_for_pool_manager` argument of RemoteConnection.
+    """
+    _pool_manager: urllib3.PoolManager = None
+
+    @classmethod
+    def for_session(cls) -> "KeepAliveConnection":
+        """
+        Returns a new connection to `config.GRID_URL` for one session.
+
+        Returns:
+            KeepAliveConnection: The connection, using the pool of the process.
+        """
+        retries = urllib3.Retry(
+            total=config.GRID_RETRIES, connect=config.GRID_RETRIES, read=0,
+            status=config.GRID_RETRIES, status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "DELETE"}),
+            backoff_factor=config.GRID_RETRY_BACKOFF, raise_on_status=False)
+        # RemoteConnection reads the pool manager arguments from this nested key.
+        return cls(config.GRID_URL, keep_alive=True, init_args_for_pool_manager={
+            "init_args_for_pool_manager": {"retries": retries}})
+
+    def _get_connection_manager(self) -> urllib3.PoolManager:
+        """
+        Returns the pool manager of the process, created by the first connection.
+        """
+        if KeepAliveConnection._pool_manager is None:
+            KeepAliveConnection._pool_manager = super()._get_connection_manager()
+        return KeepAliveConnection._pool_manager
+
+    def close(self) -> None:
+        """
+        Keeps the shared pool open when a session quits.
+        """
+
+    @staticmethod
+    def probe(samples: int = config.GRID_LATENCY_PROBES) -> float:
+        """
+        Measures the round-trip time of the grid's status endpoint, which never reaches
+        a browser, over a warm keep-alive connection.
+
+        Args:
+            samples (int): The number of requests to time.
+
+        Returns:
+            float: The median round-trip time in milliseconds.
+        """
+        url = f"{config.GRID_URL.rstrip('/')}/status"
+        with urllib3.PoolManager(maxsize=1) as http:
+            http.request("GET", url)
+            timings = []
+            for _ in range(samples):
+                start = time.perf_counter()
+                http.request("GET", url)
+                timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+
+class RemoteBrowser(Browser):
+    """
+    A class to manage browsers of a Selenium Grid (or a standalone node) through
+    `config.GRID_URL`.
+
+    The browser of the node is chosen with `config.GRID_BROWSER` and configured with the
+    options built by `build_options` of the matching local browser class, plus
+    `config.GRID_CAPABILITIES`. After the session starts, the grid round-trip time is
+    probed and stored as `driver.remote_overhead_ms`, so the command latency report can
+    split each command into remote overhead and in-browser time.
+    """
+    logger = Logger(__name__)
+    browsers = {
+        "chrome": ChromeBrowser,
+        "firefox": FirefoxBrowser,
+        "edge": EdgeBrowser,
+    }
+
+    def get_driver(self) -> webdriver.Remote:
+        """
+        Starts a new session on the grid and returns a Remote WebDriver instance for it.
+
+        Returns:
+            webdriver.Remote: A WebDriver instance for the remote session.
+        """
+        try:
+            self.logger.info("Initializing Remote WebDriver on %s (%s)",
+                             config.GRID_URL, config.GRID_BROWSER)
+            node_browser = self.browsers[config.GRID_BROWSER](self.options)
+            node_browser.device_name = self.device_name
+            node_browser.trace_categories = self.trace_categories
+            node_browser.freeze_animations = self.freeze_animations
+            options = node_browser.build_options()
+            for name, value in config.GRID_CAPABILITIES.items():
+                options.set_capability(name, value)
+
+            if ReplayProxy.active:
+                self.logger.warning("Remote sessions are not routed through the replay proxy")
+
+            start = time.perf_counter()
+            driver = webdriver.Remote(command_executor=KeepAliveConnection.for_session(),
+                                      options=options)
+            self.logger.info("Remote session %s started in %.2fs", driver.session_id,
+                             time.perf_counter() - start)
+            driver.remote_overhead_ms = KeepAliveConnection.probe()
+            self.logger.info("Grid round-trip time: %.1fms", driver.remote_overhead_ms)
+            return self.instrument(driver)
+        except Exception as e:
+            self.logger.error("Failed to initialize Remote WebDriver: %s", e)
+            raise
@@ -0,0 +1,238 @@
+"""
+Module providing a resource-aware governor for browser session launches.
+"""
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from config import config
+from utilities import utils
+from utilities.file_lock import FileLock
+from utilities.logger import Logger
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class SessionGovernor:
+    """
+    Decides when a browser session may start and when a running one must be recycled,
+    from the resources of the machine shared by every pytest-xdist worker.
+
+    A launch waits until:
+        - one of the `config.GOVERNOR_MAX_LAUNCHES` machine-wide launch slots is free
+          (a semaphore made of file locks, so it spans worker processes),
+        - `config.GOVERNOR_LAUNCH_INTERVAL` seconds passed since the previous launch on
+          the machine, which spreads out startup bursts,
+        - the available memory is above `config.GOVERNOR_MIN_FREE_MEMORY` MB and the
+          1-minute load per core is below `config.GOVERNOR_MAX_LOAD`.
+    The resource wait gives up after `config.GOVERNOR_WAIT_TIMEOUT` seconds and launches
+    anyway, so a busy machine slows the run down instead of failing it.
+
+    Memory and process information is read from /proc; without it (e.g. on Windows or
+    macOS) only the semaphore and the throttling apply. Every decision is kept in
+    `decisions` so the `browser` fixture can attach it to the test report.
+    """
+    logger = Logger(__name__)
+    decisions: List[Dict[str, Any]] = []
+
+    @classmethod
+    def launch(cls, browser: Any) -> Any:
+        """
+        Starts a session of a browser once the governor allows it.
+
+        Args:
+            browser (Browser): The browser whose `get_driver` is called.
+
+        Returns:
+            WebDriver: The started session.
+        """
+        if not config.GOVERNOR_ENABLED:
+            return browser.get_driver()
+        lock_dir = os.path.expanduser(config.GOVERNOR_DIR)
+        start = time.perf_counter()
+        slot = cls._acquire_slot(lock_dir)
+        try:
+            cls._throttle(lock_dir)
+            cls._wait_for_resources()
+            waited = time.perf_counter() - start
+            driver = browser.get_driver()
+            cls._record("launch", waited_s=round(waited, 3),
+                        launch_s=round(time.perf_counter() - start - waited, 3),
+                        rss_mb=cls.session_rss(driver))
+            return driver
+        finally:
+            slot.release()
+
+    @classmethod
+    def should_recycle(cls, driver: Any) -> bool:
+        """
+        Checks whether the browser process tree of a session grew past
+        `config.GOVERNOR_MAX_SESSION_RSS` MB.
+
+        Args:
+            driver (WebDriver): The session to check.
+
+        Returns:
+            bool: True if the session should be quit instead of reused.
+        """
+        if not config.GOVERNOR_ENABLED:
+            return False
+        rss = cls.session_rss(driver)
+        if rss is not None and rss > config.GOVERNOR_MAX_SESSION_RSS:
+            cls._record("recycle", rss_mb=rss, limit_mb=config.GOVERNOR_MAX_SESSION_RSS)
+            return True
+        return False
+
+    @classmethod
+    def take_decisions(cls) -> List[Dict[str, Any]]:
+        """
+        Returns the decisions made since the last call and forgets them.
+
+        Returns:
+            list: The decisions, oldest first.
+        """
+        decisions, cls.decisions = cls.decisions, []
+        return decisions
+
+    @classmethod
+    def session_rss(cls, driver: Any) -> Optional[float]:
+        """
+        Sums the resident memory of the driver process and all its descendants
+        (the browser and its renderer, GPU and utility processes).
+
+        Args:
+            driver (WebDriver): The session to measure.
+
+        Returns:
+            float: The resident memory in MB, or None for remote sessions or without /proc.
+        """
+        process = getattr(getattr(driver, "service", None), "process", None)
+        if process is None or not os.path.isdir("/proc"):
+            return None
+        children: Dict[int, List[int]] = {}
+        for entry in os.listdir("/proc"):
+            if entry.isdigit():
+                parent = cls._parent_pid(int(entry))
+                if parent is not None:
+                    children.setdefault(parent, []).append(int(entry))
+        total_pages = 0
+        pending = [process.pid]
+        while pending:
+            pid = pending.pop()
+            total_pages += cls._rss_pages(pid)
+            pending.extend(children.get(pid, []))
+        return round(total_pages * PAGE_SIZE / 2 ** 20, 1)
+
+    @classmethod
+    def _acquire_slot(cls, lock_dir: str) -> FileLock:
+        """
+        Takes one of the machine-wide launch slots, waiting until one is free.
+        """
+        waited = False
+        while True:
+            for index in range(config.GOVERNOR_MAX_LAUNCHES):
+                slot = FileLock(f"{lock_dir}/slot-{index}.lock", timeout=0)
+                try:
+                    slot.acquire()
+                    if waited:
+                        cls._record("slot-wait-over", slot=index)
+                    return slot
+                except TimeoutError:
+                    continue
+            if not waited:
+                cls._record("slot-wait", max_launches=config.GOVERNOR_MAX_LAUNCHES)
+                waited = True
+            time.sleep(0.2)
+
+    @classmethod
+    def _throttle(cls, lock_dir: str) -> None:
+        """
+        Waits until the minimum interval since the last launch of the machine passed.
+        """
+        stamp_file = f"{lock_dir}/last-launch"
+        with FileLock(f"{stamp_file}.lock"):
+            try:
+                with open(stamp_file, encoding="utf-8") as file:
+                    last_launch = float(file.read() or 0)
+            except (OSError, ValueError):
+                last_launch = 0.0
+            delay = last_launch + config.GOVERNOR_LAUNCH_INTERVAL - time.time()
+            if delay > 0:
+                cls._record("throttle", delay_s=round(delay, 3))
+                time.sleep(delay)
+            with open(stamp_file, "w", encoding="utf-8") as file:
+                file.write(str(time.time()))
+
+    @classmethod
+    def _wait_for_resources(cls) -> None:
+        """
+        Waits until there is enough free memory and the load is low enough.
+        """
+        deadline = time.monotonic() + config.GOVERNOR_WAIT_TIMEOUT
+        waited = False
+        while True:
+            free_mb = cls._available_memory()
+            load = os.getloadavg()[0] / (os.cpu_count() or 1) if hasattr(os, "getloadavg") else 0.0
+            low_memory = free_mb is not None and free_mb < config.GOVERNOR_MIN_FREE_MEMORY
+            high_load = load > config.GOVERNOR_MAX_LOAD
+            if not low_memory and not high_load:
+                if waited:
+                    cls._record("resources-ok", free_mb=free_mb, load_per_core=round(load, 2))
+                return
+            if time.monotonic() >= deadline:
+                cls._record("resources-timeout", free_mb=free_mb, load_per_core=round(load, 2))
+                cls.logger.warning("Launching despite low resources: %s MB free, load %.2f",
+                                   free_mb, load)
+                return
+            if not waited:
+                cls._record("resources-wait", free_mb=free_mb, load_per_core=round(load, 2))
+                waited = True
+            time.sleep(1)
+
+    @staticmethod
+    def _available_memory() -> Optional[float]:
+        """
+        Returns MemAvailable from /proc/meminfo in MB, or None without /proc.
+        """
+        try:
+            with open("/proc/meminfo", encoding="utf-8") as file:
+                for line in file:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) / 1024
+        except OSError:
+            pass
+        return None
+
+    @staticmethod
+    def _parent_pid(pid: int) -> Optional[int]:
+        """
+        Reads the parent pid of a process, or None if it exited.
+        """
+        try:
+            with open(f"/proc/{pid}/stat", encoding="utf-8") as file:
+                stat = file.read()
+        except OSError:
+            return None
+        # The command name is in parentheses and may contain spaces.
+        return int(stat[stat.rfind(")") + 2:].split()[1])
+
+    @staticmethod
+    def _rss_pages(pid: int) -> int:
+        """
+        Reads the resident pages of a process, or 0 if it exited.
+        """
+        try:
+            with open(f"/proc/{pid}/statm", encoding="utf-8") as file:
+                return int(file.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            return 0
+
+    @classmethod
+    def _record(cls, action: str, **details: Any) -> None:
+        """
+        Keeps a decision for the test report and logs it.
+        """
+        decision = {"time": time.time(), "worker": utils.get_worker_id(), "action": action,
+                    **details}
+        cls.decisions.append(decision)
+        cls.logger.info("Governor %s: %s", action, details)
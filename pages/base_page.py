@@ -2,14 +2,54 @@
 Module providing basic actions of a page.
 """
 import os
-import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
 
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.remote.webdriver import WebElement
 from drivers.browser import Browser
 from config import config
+from utilities.element_cache import ElementCache
 from utilities.logger import Logger
+from utilities.page_readiness import PageReadiness
+from utilities.screenshot_writer import ScreenshotWriter
+from utilities.script_wait import ScriptWait
+from utilities.timeline import Timeline
+from utilities.web_vitals import WebVitals
+
+# Collects the requested fields of every element matching a selector in one round-trip.
+READ_ELEMENTS_SCRIPT = """
+var kind = arguments[0], selector = arguments[1], fields = arguments[2], names = arguments[3],
+    start = arguments[4];
+var nodes = [];
+if (kind === 'css') {
+    nodes = Array.prototype.slice.call(document.querySelectorAll(selector));
+} else {
+    var found = document.evaluate(selector, document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < found.snapshotLength; i++) { nodes.push(found.snapshotItem(i)); }
+}
+return nodes.slice(start).map(function (el, offset) {
+    var record = {index: start + offset, element: el};
+    var rect = el.getBoundingClientRect();
+    if (fields.indexOf('text') >= 0) { record.text = (el.innerText || '').trim(); }
+    if (fields.indexOf('rect') >= 0) {
+        record.rect = {x: rect.x, y: rect.y, width: rect.width, height: rect.height};
+    }
+    if (fields.indexOf('visible') >= 0) {
+        var style = window.getComputedStyle(el);
+        record.visible = style.display !== 'none' && style.visibility !== 'hidden'
+            && style.opacity !== '0' && rect.width > 0 && rect.height > 0;
+    }
+    if (names.length) {
+        record.attributes = {};
+        names.forEach(function (name) { record.attributes[name] = el.getAttribute(name); });
+    }
+    return record;
+});
+"""
 
 
 class BasePage:
@@ -19,12 +59,55 @@ class BasePage:
     Attributes:
         driver: An instance of the Selenium WebDriver.
         wait: An instance of WebDriverWait for managing wait conditions.
+        wait_backend (str): "polling" to wait with WebDriverWait or "script" to evaluate
+                            conditions inside the browser. Defaults to `config.WAIT_BACKEND`.
+        performance_budget (dict): The maximum value of each web performance metric of
+                                   the page (see `collect_performance`). Empty by default.
+
+    The public methods of this class and of every page object are recorded as spans of
+    the test timeline while tracing (see `Timeline`).
     """
     logger = Logger(__name__)
+    wait_backend = config.WAIT_BACKEND
+    polling_conditions = {
+        "present": EC.presence_of_element_located,
+        "visible": EC.visibility_of_element_located,
+        "all_visible": EC.visibility_of_all_elements_located,
+        "clickable": EC.element_to_be_clickable,
+        "invisible": EC.invisibility_of_element_located,
+    }
+    performance_budget: Dict[str, float] = {}
 
     def __init__(self, driver: Browser) -> None:
         self.driver = driver
         self.wait = WebDriverWait(self.driver, config.EXPLICIT_WAIT)
+        self.script_wait = ScriptWait(self.driver)
+        self.readiness = PageReadiness(self.driver)
+        self.element_cache = ElementCache(self.driver, type(self).__name__)
+        self.web_vitals = WebVitals(self.driver)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        Timeline.trace_methods(cls)
+
+    def wait_until(self, condition: str, locator: tuple) -> Any:
+        """
+        Wait until a condition holds for the element(s) located by the provided locator,
+        using the page's wait backend.
+
+        Args:
+            condition (str): One of "present", "visible", "all_visible", "clickable"
+            or "invisible".
+            locator (tuple): A tuple representing the locator strategy and value
+            (e.g., (By.ID, 'element_id')).
+
+        Returns:
+            The WebElement (or list of WebElements) satisfying the condition, or
+            True for the "invisible" condition.
+        """
+        if self.wait_backend == "script" and self.script_wait.supports(locator):
+            return self.script_wait.until(condition, locator)
+        return self.wait.until(self.polling_conditions[condition](locator))
 
     def find_element(self, locator: tuple) -> WebElement:
         """
@@ -36,16 +119,37 @@ class BasePage:
 
         Returns:
             WebElement: The WebElement that is visible and located by the provided locator.
+            The element is served from the page's element cache when it was already
+            resolved since the last navigation.
         """
-        self.logger.info(f"Attempting to find element with locator: {locator}")
+        self.logger.info("Attempting to find element with locator: %s", locator)
         try:
-            element = self.wait.until(EC.visibility_of_element_located(locator))
-            self.logger.info(f"Element found with locator: {locator}")
+            element = self.element_cache.get(locator, lambda: self.wait_until("visible", locator))
+            self.logger.info("Element found with locator: %s", locator)
             return element
         except Exception as e:
-            self.logger.error(f"Error finding element with locator {locator}: {e}")
+            self.logger.error("Error finding element with locator %s: %s", locator, e)
             raise
 
+    def _on_element(self, locator: tuple, action: Callable[[WebElement], Any]) -> Any:
+        """
+        Run an action on the element located by the provided locator, re-resolving the
+        element and retrying once if the cached element went stale.
+
+        Args:
+            locator (tuple): A tuple representing the locator strategy and value
+            (e.g., (By.ID, 'element_id')).
+            action (Callable): The action to run with the WebElement.
+
+        Returns:
+            The result of the action.
+        """
+        try:
+            return action(self.find_element(locator))
+        except StaleElementReferenceException:
+            self.element_cache.invalidate(locator)
+            return action(self.find_element(locator))
+
     def find_elements(self, locator: tuple) -> WebElement:
         """
         Find multiple elements on the page by their locator.
@@ -57,13 +161,13 @@ class BasePage:
         Returns:
             list: A list of WebElements that are visible and located by the provided locator.
         """
-        self.logger.info(f"Attempting to find elements with locator: {locator}")
+        self.logger.info("Attempting to find elements with locator: %s", locator)
         try:
-            elements = self.wait.until(EC.visibility_of_all_elements_located(locator))
-            self.logger.info(f"Elements found with locator: {locator}")
+            elements = self.wait_until("all_visible", locator)
+            self.logger.info("Elements found with locator: %s", locator)
             return elements
         except Exception as e:
-            self.logger.error(f"Error finding elements with locator {locator}: {e}")
+            self.logger.error("Error finding elements with locator %s: %s", locator, e)
             raise
 
     def click(self, locator: tuple) -> None:
@@ -74,13 +178,14 @@ class BasePage:
             locator (tuple): A tuple representing the locator strategy and value 
             (e.g., (By.ID, 'element_id')).
         """
-        self.logger.info(f"Attempting to click element with locator: {locator}")
+        self.logger.info("Attempting to click element with locator: %s", locator)
         try:
-            element = self.wait.until(EC.element_to_be_clickable(locator))
+            element = self.wait_until("clickable", locator)
             element.click()
-            self.logger.info(f"Clicked element with locator: {locator}")
+            ElementCache.mark_navigation(self.driver)
+            self.logger.info("Clicked element with locator: %s", locator)
         except Exception as e:
-            self.logger.error(f"Error clicking element with locator {locator}: {e}")
+            self.logger.error("Error clicking element with locator %s: %s", locator, e)
             raise
 
     def send_keys(self, locator: tuple, text: str, key=None) -> None:
@@ -94,16 +199,19 @@ class BasePage:
             key (Keys): Optional selenium common keys value (e.g., Keys.ENTER, Keys.TAB). 
             If provided, this key will be pressed after sending the text.
         """
-        self.logger.info(f"Attempting to send keys to element with locator: {locator}")
+        self.logger.info("Attempting to send keys to element with locator: %s", locator)
         try:
-            element = self.find_element(locator)
-            element.clear()
-            element.send_keys(text)
-            self.logger.info(f"Sent text '{text}' to element with locator: {locator}")
+            def type_text(element: WebElement) -> None:
+                element.clear()
+                element.send_keys(text)
+
+            self._on_element(locator, type_text)
+            self.logger.info("Sent text '%s' to element with locator: %s", text, locator)
             if key:
-                element.send_keys(key)
+                self._on_element(locator, lambda element: element.send_keys(key))
+                ElementCache.mark_navigation(self.driver)
         except Exception as e:
-            self.logger.error(f"Error sending keys to element with locator {locator}: {e}")
+            self.logger.error("Error sending keys to element with locator %s: %s", locator, e)
             raise
 
     def get_text(self, locator: tuple) -> str:
@@ -117,13 +225,48 @@ class BasePage:
         Returns:
             str: The text content of the WebElement.
         """
-        self.logger.info(f"Attempting to get text from element with locator: {locator}")
+        self.logger.info("Attempting to get text from element with locator: %s", locator)
         try:
-            text = self.find_element(locator).text
-            self.logger.info(f"Text '{text}' retrieved from element with locator: {locator}")
+            text = self._on_element(locator, lambda element: element.text)
+            self.logger.info("Text '%s' retrieved from element with locator: %s", text, locator)
             return text
         except Exception as e:
-            self.logger.error(f"Error getting text from element with locator {locator}: {e}")
+            self.logger.error("Error getting text from element with locator %s: %s", locator, e)
+            raise
+
+    def read_elements(self, locator: tuple, fields: List[str] = None,
+                      attributes: List[str] = None, start: int = 0) -> List[Dict[str, Any]]:
+        """
+        Read fields of every element located by the provided locator with a single
+        script call, instead of one WebDriver call per element and field.
+
+        Args:
+            locator (tuple): A tuple representing the locator strategy and value
+            (e.g., (By.CSS_SELECTOR, '.item')). Must be expressible as CSS or XPath.
+            fields (List[str]): The fields to read: "text", "rect" and/or "visible".
+            Default is ["text"].
+            attributes (List[str]): Optional attribute names to read (e.g. ["href"]).
+            start (int): The index of the first element to read, to skip elements
+            already read. Default is 0.
+
+        Returns:
+            list: One dict per element with the keys "index", "element" (the WebElement)
+            and the requested fields; attributes are returned under "attributes".
+        """
+        fields = fields if fields is not None else ["text"]
+        attributes = attributes or []
+        self.logger.info("Attempting to read %s of elements with locator: %s", fields, locator)
+        try:
+            selector = ScriptWait.to_selector(locator)
+            if selector is None:
+                raise ValueError(f"Locator cannot be read in bulk: {locator}")
+            kind, expression = selector
+            records = self.driver.execute_script(
+                READ_ELEMENTS_SCRIPT, kind, expression, fields, attributes, start)
+            self.logger.info("Read %s elements with locator: %s", len(records), locator)
+            return records
+        except Exception as e:
+            self.logger.error("Error reading elements with locator %s: %s", locator, e)
             raise
 
     def scroll_down(self) -> None:
@@ -135,45 +278,76 @@ class BasePage:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             self.logger.info("Scrolled to the bottom of the page.")
         except Exception as e:
-            self.logger.error(f"Error scrolling down the page: {e}")
+            self.logger.error("Error scrolling down the page: %s", e)
             raise
 
-    def wait_for_page_to_load(self) -> None:
+    def wait_for_page_to_load(self) -> float:
         """
         Wait for the page to fully load and be ready for interaction.
 
-        The method waits until the document.readyState is 'complete' and applies an implicit wait.
+        The method waits until the document.readyState is 'complete', there are no
+        pending fetch/XHR requests and the DOM has been quiet for
+        `config.PAGE_QUIET_WINDOW` milliseconds, up to `config.PAGE_READY_TIMEOUT` seconds.
+
+        Returns:
+            float: The time, in seconds, the wait actually took.
         """
         self.logger.info("Waiting for the page to fully load.")
         try:
-            self.wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
             self.driver.implicitly_wait(config.IMPLICIT_WAIT)
-            time.sleep(config.IMPLICIT_WAIT)
-            self.logger.info("Page fully loaded.")
+            elapsed = self.readiness.wait_until_stable()
+            self.logger.info("Page fully loaded in %.3fs.", elapsed)
+            return elapsed
         except Exception as e:
-            self.logger.error(f"Error waiting for page to load: {e}")
+            self.logger.error("Error waiting for page to load: %s", e)
             raise
 
-    def take_screenshot(self, file_path: str) -> bool:
+    def collect_performance(self, action: str) -> Optional[Dict[str, Any]]:
+        """
+        Collect the web performance metrics of the current document after an action and
+        check them against the page's `performance_budget`.
+
+        Args:
+            action (str): The action the metrics follow (e.g. "load", "results").
+
+        Returns:
+            dict: The Navigation Timing, FCP, LCP, long task, layout shift and transferred
+            bytes metrics, or None when `config.PERFORMANCE_METRICS` is disabled.
+        """
+        if not config.PERFORMANCE_METRICS:
+            return None
+        self.logger.info("Collecting performance metrics after: %s", action)
+        try:
+            return self.web_vitals.collect(type(self).__name__, action, self.performance_budget)
+        except Exception as e:
+            self.logger.error("Error collecting performance metrics: %s", e)
+            raise
+
+    def take_screenshot(self, file_path: str, image_format: str = "png",
+                        quality: Optional[int] = None,
+                        clip: Optional[Dict[str, float]] = None) -> Future:
         """
         Take a screenshot of the current page and save it to the specified file path.
 
+        The screenshot is grabbed in memory and written by a background thread; call
+        `result()` on the returned handle before asserting on the file.
+
         Args:
             file_path (str): The path where the screenshot will be saved.
+            image_format (str): "png", "jpeg" or "webp" (Chrome and Edge only).
+            Default is "png".
+            quality (int): Optional compression quality (0-100) for "jpeg" and "webp".
+            clip (dict): Optional region with the keys "x", "y", "width" and "height".
 
         Returns:
-            bool: True if the screenshot was successfully saved, otherwise False.
+            Future: Resolves to True if the screenshot was successfully saved,
+            otherwise False.
         """
-        self.logger.info(f"Attempting to take a screenshot and save to: {file_path}")
+        self.logger.info("Attempting to take a screenshot and save to: %s", file_path)
         try:
-            success = self.driver.save_screenshot(file_path)
-            if success:
-                self.logger.info(f"Screenshot saved to: {file_path}")
-            else:
-                self.logger.warning(f"Failed to save screenshot to: {file_path}")
-            return success
+            return ScreenshotWriter.capture(self.driver, file_path, image_format, quality, clip)
         except Exception as e:
-            self.logger.error(f"Error taking screenshot: {e}")
+            self.logger.error("Error taking screenshot: %s", e)
             raise
 
     def is_file_present(self, file_path: str) -> bool:
@@ -186,14 +360,17 @@ class BasePage:
         Returns:
             bool: True if the file exists, otherwise False.
         """
-        self.logger.info(f"Checking if file exists at: {file_path}")
+        self.logger.info("Checking if file exists at: %s", file_path)
         try:
             file_exists = os.path.exists(file_path)
             if file_exists:
-                self.logger.info(f"File exists at: {file_path}")
+                self.logger.info("File exists at: %s", file_path)
             else:
-                self.logger.warning(f"File not found at: {file_path}")
+                self.logger.warning("File not found at: %s", file_path)
             return file_exists
         except Exception as e:
-            self.logger.error(f"Error checking file presence at {file_path}: {e}")
+            self.logger.error("Error checking file presence at %s: %s", file_path, e)
             raise
+
+
+Timeline.trace_methods(BasePage)
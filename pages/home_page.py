@@ -14,6 +14,7 @@ class HomePage(BasePage):
     such as interacting with the search input element.
     """
     logger = Logger(__name__)
+    performance_budget = {"fcp_ms": 3000, "lcp_ms": 4000, "cls": 0.1, "long_task_ms": 2000}
 
     def __init__(self, driver: Browser) -> None:
         super().__init__(driver)
@@ -26,9 +27,10 @@ class HomePage(BasePage):
         This method uses the locator for the search input field and triggers a click event on it.
         """
         try:
+            self.collect_performance("load")
             self.logger.info("Attempting to click on the search input")
             self.click(self.search_input)
             self.logger.info("Successfully clicked on the search input")
         except Exception as e:
-            self.logger.error(f"Failed to click on the search input: {e}")
+            self.logger.error("Failed to click on the search input: %s", e)
             raise
@@ -2,13 +2,14 @@
 Module providing basic actions on Search Page.
 """
 import random
+from typing import Any, Dict, Iterator, List, Optional
 
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
 from drivers.browser import Browser
 from utilities.logger import Logger
+from config import config
 
 
 class SearchPage(BasePage):
@@ -20,6 +21,7 @@ class SearchPage(BasePage):
     click on menu options, select streamers randomly, and load more streamer results.
     """
     logger = Logger(__name__)
+    performance_budget = {"cls": 0.25, "long_task_ms": 4000}
 
     def __init__(self, driver: Browser) -> None:
         super().__init__(driver)
@@ -35,12 +37,12 @@ class SearchPage(BasePage):
         Args:
             text (str): The text to search for.
         """
-        self.logger.info(f"Starting search for: {text}")
+        self.logger.info("Starting search for: %s", text)
         try:
             self.send_keys(self.input_search, text, Keys.ENTER)
-            self.logger.info(f"Search submitted for: {text}")
+            self.logger.info("Search submitted for: %s", text)
         except Exception as e:
-            self.logger.error(f"Error occurred during search: {e}")
+            self.logger.error("Error occurred during search: %s", e)
             raise
 
     def click_on_menu(self, option: str) -> None:
@@ -51,59 +53,99 @@ class SearchPage(BasePage):
             option (str): The menu option text to click on.
         """
         locator = f"//div[contains(text(), '{option}')]"
-        self.logger.info(f"Attempting to click on menu option: {option}")
+        self.logger.info("Attempting to click on menu option: %s", option)
         try:
             self.click((By.XPATH, locator))
-            self.logger.info(f"Menu option clicked: {option}")
+            self.logger.info("Menu option clicked: %s", option)
         except Exception as e:
             self.logger.error(
-                f"Error occurred while clicking menu option '{option}': {e}")
+                "Error occurred while clicking menu option '%s': %s", option, e)
             raise
 
     def select_streamer_randomly(self) -> None:
         """
         Selects a streamer randomly from the list of streamers displayed on the page.
 
-        Waits for the list of streamers to be present and then randomly selects
-        one that is clickable.
+        Waits for the list of streamers to be visible, reads the visibility of every
+        streamer in a single call and then randomly selects one that is clickable.
         """
         self.logger.info("Selecting a streamer randomly.")
         try:
-            streamers = self.wait.until(
-                EC.visibility_of_all_elements_located(self.streamers))
+            self.wait_until("visible", self.streamers)
+            streamers = [record for record in self.read_elements(self.streamers, ["visible"])
+                         if record["visible"]]
             num_streamers = len(streamers)
             if num_streamers == 0:
                 self.logger.warning("No streamers found to select.")
                 return
             random_index = random.randint(0, num_streamers - 1)
-            element = self.wait.until(
-                EC.element_to_be_clickable(streamers[random_index]))
-            self.click(element)
-            self.logger.info(f"Streamer at index {random_index} selected.")
+            self.click(streamers[random_index]["element"])
+            self.logger.info("Streamer at index %s selected.", random_index)
         except Exception as e:
             self.logger.error(
-                f"Error occurred while selecting a streamer: {e}")
+                "Error occurred while selecting a streamer: %s", e)
             raise
 
-    def load_more_streamers(self, max_scrolls: int = 1, current_scroll: int = 0) -> None:
+    def stream_streamers(self, target: Optional[int] = None,
+                         max_scrolls: int = config.MAX_SCROLLS,
+                         fields: List[str] = None) -> Iterator[Dict[str, Any]]:
         """
-        Scrolls down the page to load more streamers. This method performs
-        recursive scrolling until the maximum number of scrolls is reached.
+        Yields the streamers of the result list as they load, scrolling only while
+        the list keeps growing.
+
+        The streamers already on the page are yielded first. Then the page is scrolled
+        to the bottom and only the newly loaded streamers are read and yielded, until
+        `target` streamers were yielded, a scroll loads nothing new or `max_scrolls`
+        is reached. Callers can stop iterating as soon as they have enough.
 
         Args:
-            max_scrolls (int): The maximum number of scrolls to perform. Default is 2.
-            current_scroll (int): The current scroll count during the recursion. Default is 0.
-        """
-        if current_scroll >= max_scrolls:
-            self.logger.info("Maximum scroll limit reached.")
-            return
+            target (int): Optional number of streamers after which scrolling stops.
+            max_scrolls (int): The maximum number of scrolls to perform.
+            Default is `config.MAX_SCROLLS`.
+            fields (List[str]): The fields read for each streamer (see `read_elements`).
+            Default is ["text", "visible"].
 
-        self.logger.info(
-            f"Scrolling down. Current scroll count: {current_scroll}")
+        Yields:
+            dict: One record per newly loaded streamer.
+        """
+        fields = fields if fields is not None else ["text", "visible"]
+        loaded = 0
+        scrolls = 0
         try:
-            self.wait_for_page_to_load()
-            self.scroll_down()
-            self.load_more_streamers(max_scrolls, current_scroll + 1)
+            while True:
+                new_streamers = self.read_elements(self.streamers, fields, start=loaded)
+                loaded += len(new_streamers)
+                yield from new_streamers
+                if scrolls > 0 and not new_streamers:
+                    self.logger.info("No new streamers after scroll %s, stopping.", scrolls)
+                    return
+                if target is not None and loaded >= target:
+                    self.logger.info("Target of %s streamers reached.", target)
+                    return
+                if scrolls >= max_scrolls:
+                    self.logger.info("Maximum scroll limit reached.")
+                    return
+                scrolls += 1
+                self.logger.info("Scrolling down. Current scroll count: %s", scrolls)
+                self.scroll_down()
+                self.wait_for_page_to_load()
         except Exception as e:
-            self.logger.error(f"Error occurred while scrolling down: {e}")
+            self.logger.error("Error occurred while streaming streamers: %s", e)
             raise
+
+    def load_more_streamers(self, max_scrolls: int = 1) -> int:
+        """
+        Scrolls down the page to load more streamers, stopping early when a scroll
+        loads no new streamer.
+
+        Args:
+            max_scrolls (int): The maximum number of scrolls to perform. Default is 1.
+
+        Returns:
+            int: The number of streamers loaded on the page.
+        """
+        self.wait_for_page_to_load()
+        loaded = sum(1 for _ in self.stream_streamers(max_scrolls=max_scrolls, fields=[]))
+        self.logger.info("%s streamers loaded.", loaded)
+        self.collect_performance("results")
+        return loaded
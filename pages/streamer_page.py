@@ -2,7 +2,6 @@
 Module providing basic actions on Streamer Page.
 """
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
 from drivers.browser import Browser
 from utilities.logger import Logger
@@ -15,6 +14,7 @@ class StreamerPage(BasePage):
     the channel's loading status.
     """
     logger = Logger(__name__)
+    performance_budget = {"cls": 0.25, "long_task_ms": 6000}
 
     def __init__(self, driver: Browser) -> None:
         super().__init__(driver)
@@ -32,15 +32,14 @@ class StreamerPage(BasePage):
         try:
             self.logger.debug(
                 "Waiting for the channel status element to be present.")
-            self.wait.until(
-                EC.presence_of_element_located(self.channel_status))
+            self.wait_until("present", self.channel_status)
 
             self.logger.debug("Waiting for the loading spinner to disappear.")
-            self.wait.until(
-                EC.invisibility_of_element_located(self.loading_spinner))
+            self.wait_until("invisible", self.loading_spinner)
 
             self.logger.info("StreamerPage has been successfully loaded.")
+            self.collect_performance("load")
         except Exception as e:
             self.logger.error(
-                f"An error occurred while checking if the StreamerPage is loaded: {e}")
+                "An error occurred while checking if the StreamerPage is loaded: %s", e)
             raise
@@ -0,0 +1,210 @@
+"""
+Module providing a duration-aware pytest-xdist scheduling plugin.
+"""
+import json
+import math
+import os
+from typing import Any, Dict, List
+
+import pytest
+
+from config import config as settings
+from utilities import utils
+from utilities.file_lock import FileLock
+from utilities.logger import Logger
+
+logger = Logger(__name__)
+
+
+class DurationHistory:
+    """
+    A local store of test durations per node id and browser.
+
+    Each entry keeps a running count, mean and variance (Welford's algorithm), so the
+    file stays small however many runs are recorded. Writes merge into the file under a
+    file lock and replace it atomically, so concurrent runs never corrupt it.
+
+    Attributes:
+        path (str): The JSON file of the history.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries = self._read()
+
+    def _read(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Reads the history file, returning an empty history if it does not exist.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def estimate(self, node_id: str, browser: str = None, stdev_weight: float = None) -> float:
+        """
+        Returns the expected duration of a test: its mean duration plus `stdev_weight`
+        standard deviations, so tests with erratic durations are planned pessimistically.
+
+        Args:
+            node_id (str): The pytest node id of the test.
+            browser (str): The browser the test runs with. Default is `config.BROWSER`.
+            stdev_weight (float): The number of standard deviations added to the mean.
+                                  Default is `config.SCHEDULE_STDEV_WEIGHT`.
+
+        Returns:
+            float: The expected duration in seconds, or None if never recorded.
+        """
+        stats = self.entries.get(node_id, {}).get(browser or settings.BROWSER)
+        if not stats:
+            return None
+        if stdev_weight is None:
+            stdev_weight = settings.SCHEDULE_STDEV_WEIGHT
+        return stats["mean"] + stdev_weight * stats.get("stdev", 0.0)
+
+    def record(self, durations: Dict[str, float], browser: str = None) -> None:
+        """
+        Merges the durations of a run into the history file.
+
+        Args:
+            durations (dict): The duration in seconds of each test node id.
+            browser (str): The browser the tests ran with. Default is `config.BROWSER`.
+        """
+        browser = browser or settings.BROWSER
+        with FileLock(f"{self.path}.lock"):
+            self.entries = self._read()
+            for node_id, duration in durations.items():
+                stats = self.entries.setdefault(node_id, {}).setdefault(
+                    browser, {"count": 0, "mean": 0.0, "m2": 0.0})
+                stats.setdefault("m2", 0.0)
+                stats["count"] += 1
+                delta = duration - stats["mean"]
+                stats["mean"] += delta / stats["count"]
+                stats["m2"] += delta * (duration - stats["mean"])
+                stats["stdev"] = math.sqrt(stats["m2"] / stats["count"])
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(self.entries, file, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+
+def _history_path() -> str:
+    """
+    Returns the absolute path of the duration history file.
+    """
+    return f"{utils.get_root_path()}/{settings.DURATION_HISTORY}"
+
+
+def _make_scheduler_class() -> Any:
+    """
+    Builds the scheduler class lazily, so this plugin loads without pytest-xdist.
+    """
+    from xdist.scheduler import LoadScheduling  # pylint: disable=import-outside-toplevel
+
+    class DurationScheduling(LoadScheduling):
+        """
+        The xdist "load" scheduler, handing out the pending tests longest-first according
+        to the duration history (mean plus `config.SCHEDULE_STDEV_WEIGHT` standard
+        deviations). Tests without history are treated as the longest ones.
+
+        The initial batches are dealt round-robin from the sorted tests, so each worker
+        starts with one of the longest tests instead of the first worker getting the
+        whole longest block. Afterwards workers pull the longest remaining tests as they
+        finish, which fills the end of the run with short ones.
+        """
+
+        def __init__(self, config: pytest.Config, log: Any = None) -> None:
+            super().__init__(config, log)
+            self.history = DurationHistory(_history_path())
+            self._sorted = False
+            self._dealt: Dict[Any, List[int]] = {}
+
+        def _send_tests(self, node: Any, num: int) -> None:
+            if not self._sorted:
+                estimates = [self.history.estimate(node_id) for node_id in self.collection]
+                unknown = max((e for e in estimates if e is not None), default=0.0) + 1
+                self.pending.sort(
+                    key=lambda index: unknown if estimates[index] is None else estimates[index],
+                    reverse=True)
+                self._sorted = True
+                # xdist primes every node with the same batch size; deal those batches.
+                first_batch = self.pending[:num * len(self.nodes)]
+                self._dealt = {worker: first_batch[position::len(self.nodes)]
+                               for position, worker in enumerate(self.nodes)}
+            dealt = self._dealt.pop(node, None)
+            if dealt:
+                dealt_set = set(dealt)
+                self.pending[:] = dealt + [i for i in self.pending if i not in dealt_set]
+                num = len(dealt)
+            super()._send_tests(node, num)
+
+    return DurationScheduling
+
+
+class DurationReporter:
+    """
+    Collects the duration of each test and the busy time of each worker, stores the
+    durations in the history and reports the makespan of the run.
+
+    On the xdist controller `pytest_runtest_logreport` receives the reports of every
+    worker, so only the controller (or a run without xdist) writes the history.
+    """
+
+    def __init__(self, config: pytest.Config) -> None:
+        self.config = config
+        self.durations: Dict[str, float] = {}
+        self.busy: Dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """
+        Accumulates the setup, call and teardown time of each test and of each worker.
+        """
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+        node = getattr(report, "node", None)
+        worker = node.gateway.id if node is not None else utils.get_worker_id()
+        self.busy[worker] = self.busy.get(worker, 0.0) + report.duration
+
+    def pytest_sessionfinish(self) -> None:
+        """
+        Stores the durations of the run in the history.
+        """
+        if hasattr(self.config, "workerinput") or not self.durations:
+            return
+        DurationHistory(_history_path()).record(self.durations)
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        """
+        Reports how far the makespan of the run was from the ideal one, i.e. the larger
+        of the total work split evenly across workers and the longest single test.
+        """
+        if len(self.busy) < 2:
+            return
+        makespan = max(self.busy.values())
+        ideal = max(sum(self.busy.values()) / len(self.busy), max(self.durations.values()))
+        terminalreporter.write_sep("-", "duration-aware scheduling")
+        for worker, seconds in sorted(self.busy.items()):
+            terminalreporter.write_line(f"{worker}: {seconds:.1f}s busy")
+        over = (makespan / ideal - 1) * 100 if ideal else 0.0
+        terminalreporter.write_line(
+            f"makespan {makespan:.1f}s, ideal {ideal:.1f}s, {over:.1f}% over ideal")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Registers the duration reporter when duration-aware scheduling is enabled.
+    """
+    if settings.SCHEDULE_BY_DURATION:
+        config.pluginmanager.register(DurationReporter(config), "duration-reporter")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config: pytest.Config, log: Any) -> Any:
+    """
+    Replaces the default "load" distribution with the duration-aware scheduler.
+    """
+    if not settings.SCHEDULE_BY_DURATION or config.getoption("dist") != "load":
+        return None
+    logger.info("Scheduling tests longest-first from: %s", _history_path())
+    return _make_scheduler_class()(config, log)
@@ -0,0 +1,52 @@
+"""
+Module providing the command-line layer of the configuration.
+"""
+import argparse
+import os
+import shlex
+from typing import List, Sequence
+
+import pytest
+
+from config import config as settings
+from config import loader
+from utilities.logger import Logger
+
+
+def command_line_settings(args: Sequence[str]) -> List[str]:
+    """
+    Extracts the `--setting` overrides of a pytest command line.
+
+    Args:
+        args (Sequence[str]): The command-line arguments of pytest.
+
+    Returns:
+        list: The NAME=VALUE overrides, in the order they were given.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--setting", action="append", default=[])
+    return parser.parse_known_args(list(args))[0].setting
+
+
+def pytest_addoption(parser: pytest.Parser, pluginmanager: pytest.PytestPluginManager) -> None:
+    """
+    Adds the `--setting NAME=VALUE` option, which overrides a setting of config.py after
+    the configuration file and the environment variables, and applies the overrides.
+
+    The overrides are applied as soon as the plugin is registered, before the other
+    plugins and the conftest files import the framework, so loggers, page objects and
+    the driver pool are created with the final configuration, and Loggers created earlier
+    are reconfigured (see `Logger.reconfigure`). They are also exported as
+    `WAP_` environment variables, so pytest-xdist workers and the subprocesses of the
+    matrix runner and the search sweep inherit them.
+    """
+    parser.addoption("--setting", action="append", default=[], dest="settings",
+                     metavar="NAME=VALUE",
+                     help="Override a setting of config/config.py (repeatable).")
+    invocation = pluginmanager.get_plugin("pytestconfig").invocation_params
+    args = shlex.split(os.environ.get("PYTEST_ADDOPTS", "")) + list(invocation.args)
+    overrides = loader.cli_overrides(command_line_settings(args))
+    loader.apply(settings, overrides)
+    loader.export(overrides, os.environ)
+    if overrides:
+        Logger.reconfigure()
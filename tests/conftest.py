@@ -1,40 +1,258 @@
 """
 Module tear down.
 """
+import json
+import zipfile
 from typing import Any
+import allure
 import pytest
 
-from drivers.browser_factory import BrowserFactory
+from drivers.driver_pool import DriverPool
+from drivers.session_governor import SessionGovernor
 from config import config
+from utilities.element_cache import ElementCache
 from utilities.logger import Logger
+from utilities.replay_proxy import ReplayProxy
+from utilities.screenshot_writer import ScreenshotWriter
+from utilities.timeline import Timeline
+from utilities.web_vitals import WebVitals
 
 logger = Logger(__name__)
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Stores the report of each test phase on the item so fixtures can know
+    whether the test failed, reports exceeded performance budgets (failing the test
+    when they are enforced), and captures the browser diagnostics of a failed test
+    before its session is released.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if report.when == "call":
+        _apply_performance_budgets(report)
+    setattr(item, f"rep_{report.when}", report)
+    if report.when == "call" and report.failed:
+        _attach_failure_diagnostics(item)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Writes the pending screenshots and flushes the queued log records to disk when
+    the test session ends.
+    """
+    ScreenshotWriter.shutdown()
+    logger.info("Element cache: %s", ElementCache.summary())
+    Logger.flush()
+
+
+def pytest_internalerror(excrepr, excinfo):
+    """
+    Flushes the queued log records to disk when the worker crashes.
+    """
+    Logger.flush()
+
+
+def pytest_keyboard_interrupt(excinfo):
+    """
+    Flushes the queued log records to disk when the run is interrupted.
+    """
+    Logger.flush()
+
+
+@pytest.fixture(scope="session")
+def network_proxy() -> Any:
+    """
+    Fixture starting the record/replay proxy of the worker when `config.NETWORK_MODE`
+    is "record" or "replay". Browsers created afterwards are routed through it.
+
+    Returns:
+        ReplayProxy: The running proxy, or None in "live" mode.
+    """
+    if config.NETWORK_MODE == "live":
+        yield None
+        return
+    proxy = ReplayProxy.start(config.NETWORK_MODE)
+    yield proxy
+    proxy.stop()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(network_proxy) -> Any:
+    """
+    Fixture providing the WebDriver pool of the current pytest-xdist worker.
+
+    The pool, and the pool of traced sessions if one was used, is closed, quitting
+    every pooled browser, when the session ends.
+
+    Returns:
+        DriverPool: The pool bound to the current worker.
+    """
+    pool = DriverPool.for_worker()
+    yield pool
+    DriverPool.close_all()
+
+
 @pytest.fixture(scope="function")
-def browser() -> Any:
+def browser(request, driver_pool) -> Any:
     """
     Fixture to set up and tear down a web browser instance for tests.
 
-    This fixture initializes a web browser instance using the BrowserFactory
-    and navigates to the URL specified in the configuration. After the test
-    completes, the browser instance is closed.
+    This fixture takes a warm browser instance from the worker's DriverPool,
+    already navigated to the URL specified in the configuration. After the test
+    completes, the browser instance is given back to the pool, which resets it
+    or recycles it if the test failed.
+
+    Tests marked with `trace` (or every test when `config.TIMELINE_TRACING` is "always")
+    get a tracing session instead, and their timeline is attached to the report.
 
     Returns:
         WebDriver: An instance of the web browser driver.
     """
     logger.info("Setting up the web browser instance.")
+    if config.MATRIX_COMBINATION:
+        allure.dynamic.parameter("combination", config.MATRIX_COMBINATION)
 
+    SessionGovernor.take_decisions()
+    traced = Timeline.is_requested(request.node)
+    pool = DriverPool.for_worker(traced=True) if traced else driver_pool
     try:
-        driver = BrowserFactory.get_browser(
-            config.BROWSER, config.BROWSER_OPTIONS).get_driver()
-        logger.info(f"Browser initialized with URL: {config.URL}")
-        driver.get(config.URL)
+        driver = pool.acquire()
+        logger.info("Browser acquired from the pool.")
+        tracer = getattr(driver, "command_tracer", None)
+        if tracer:
+            tracer.reset()
+        blocker = getattr(driver, "request_blocker", None)
+        if blocker:
+            blocker.reset()
+        diagnostics = getattr(driver, "diagnostics", None)
+        if diagnostics:
+            diagnostics.reset()
+        if traced:
+            Timeline.start()
         yield driver
     except Exception as e:
-        logger.error(f"An error occurred while setting up the browser: {e}")
+        logger.error("An error occurred while setting up the browser: %s", e)
         raise
     finally:
         if 'driver' in locals():
-            driver.quit()
-            logger.info("Browser instance closed.")
+            if traced:
+                _attach_timeline(driver)
+            if tracer:
+                _attach_command_latency(tracer, request.node.nodeid)
+            if blocker:
+                _attach_blocking_stats(blocker)
+            report = getattr(request.node, "rep_call", None)
+            failed = report is None or report.failed
+            pool.release(driver, failed=failed)
+            logger.info("Browser instance released to the pool.")
+        _attach_governor_decisions()
+
+
+def _attach_command_latency(tracer: Any, test_id: str) -> None:
+    """
+    Writes the WebDriver command latency report of a test and attaches it to Allure.
+
+    Args:
+        tracer (CommandTracer): The tracer of the driver used by the test.
+        test_id (str): The pytest node id of the test.
+    """
+    try:
+        file_path = tracer.write_report(test_id)
+        allure.attach(tracer.format_table(tracer.summary()),
+                      name="WebDriver command latency",
+                      attachment_type=allure.attachment_type.TEXT)
+        allure.attach.file(file_path, name="WebDriver command latency (JSON)",
+                           attachment_type=allure.attachment_type.JSON)
+    except Exception as e:
+        logger.warning("Could not write the command latency report: %s", e)
+
+
+def _attach_timeline(driver: Any) -> None:
+    """
+    Writes the timeline of a traced test and attaches it to Allure.
+
+    Args:
+        driver (WebDriver): The traced driver used by the test.
+    """
+    try:
+        file_path = Timeline.stop(driver)
+        allure.attach.file(file_path, name="Timeline (trace viewer)", extension="json.gz")
+    except Exception as e:
+        logger.warning("Could not write the timeline: %s", e)
+
+
+def _attach_blocking_stats(blocker: Any) -> None:
+    """
+    Attaches the blocked request, saved and transferred byte counters of a test to Allure.
+
+    Args:
+        blocker (RequestBlocker): The request blocker of the driver used by the test.
+    """
+    try:
+        stats = blocker.collect()
+        if stats["blocked_requests"] is None:
+            logger.info("Transferred %s bytes with profile '%s' (blocked requests not counted)",
+                        stats["transferred_bytes"], stats["profile"])
+        else:
+            logger.info("Blocked %s requests with profile '%s', saving about %s bytes, "
+                        "transferred %s bytes", stats["blocked_requests"], stats["profile"],
+                        stats["saved_bytes_estimate"], stats["transferred_bytes"])
+        allure.attach(json.dumps(stats, indent=2), name="Request blocking",
+                      attachment_type=allure.attachment_type.JSON)
+    except Exception as e:
+        logger.warning("Could not collect the request blocking counters: %s", e)
+
+
+def _attach_failure_diagnostics(item: Any) -> None:
+    """
+    Captures the diagnostics of the browser used by a failed test and attaches the
+    compressed archive and the screenshot to Allure.
+
+    Args:
+        item (pytest.Item): The failed test.
+    """
+    driver = item.funcargs.get("browser") if hasattr(item, "funcargs") else None
+    diagnostics = getattr(driver, "diagnostics", None)
+    if diagnostics is None:
+        return
+    try:
+        file_path = diagnostics.capture(item.nodeid)
+        allure.attach.file(file_path, name="Failure diagnostics", extension="zip")
+        with zipfile.ZipFile(file_path) as archive:
+            if "screenshot.png" in archive.namelist():
+                allure.attach(archive.read("screenshot.png"), name="Failure screenshot",
+                              attachment_type=allure.attachment_type.PNG)
+    except Exception as e:
+        logger.warning("Could not capture the failure diagnostics: %s", e)
+
+
+def _attach_governor_decisions() -> None:
+    """
+    Attaches the session governor decisions taken while setting up and releasing the
+    browser of a test (waits, throttling, launches and recycling) to Allure.
+    """
+    decisions = SessionGovernor.take_decisions()
+    if decisions:
+        allure.attach(json.dumps(decisions, indent=2), name="Session governor",
+                      attachment_type=allure.attachment_type.JSON)
+
+
+def _apply_performance_budgets(report: pytest.TestReport) -> None:
+    """
+    Reports the performance budgets exceeded by the pages of a test, and turns a passed
+    test into a failure when `config.PERFORMANCE_BUDGETS` is enabled.
+
+    Args:
+        report (pytest.TestReport): The report of the call phase of the test.
+    """
+    violations = WebVitals.take_violations()
+    if not violations:
+        return
+    text = "Performance budgets exceeded:\n" + "\n".join(violations)
+    if config.PERFORMANCE_BUDGETS and report.passed:
+        report.outcome = "failed"
+        report.longrepr = text
+    else:
+        report.sections.append(("Performance budgets", text))
@@ -55,7 +55,7 @@ class TestSearchPage:
             AssertionError: If the screenshot file does not exist.
         """
         self.logger.info("Starting test: test_take_screenshot_to_streamer")
-        screenshot_path = f"{utils.get_root_path()}/data/screenshots/streamer.png"
+        screenshot_path = utils.get_artifact_path("screenshots", "streamer.png")
 
         self.home_page.click_on_search()
         self.search_page.search("StarCraft II")
@@ -63,7 +63,7 @@ class TestSearchPage:
         self.search_page.load_more_streamers(max_scrolls=2)
         self.search_page.select_streamer_randomly()
         self.streamer_page.is_loaded()
-        self.streamer_page.take_screenshot(screenshot_path)
+        self.streamer_page.take_screenshot(screenshot_path).result()
 
         assert self.streamer_page.is_file_present(
             screenshot_path), "Screenshot file does not exist."
@@ -0,0 +1,83 @@
+"""
+Module test the benchmark regression gate.
+"""
+import json
+
+import pytest
+
+from benchmarks import benchmark_runner
+from benchmarks.benchmark_runner import BenchmarkRunner, compare
+from utilities import utils
+
+
+def run_results(**medians: float) -> dict:
+    """
+    Builds the results of a benchmark run from the medians of its metrics.
+    """
+    return {"environment": {},
+            "metrics": {name: {"median": median, "p95": median, "unit": "ms", "samples": 5}
+                        for name, median in medians.items()}}
+
+
+class TestCompare:
+    """
+    Test class for comparing a benchmark run with its baseline.
+    """
+
+    def test_regression_above_threshold(self):
+        """
+        A median slower than the baseline by more than the threshold is reported.
+        """
+        regressions = compare(run_results(flow=130.0, startup=100.0),
+                              run_results(flow=100.0, startup=100.0), threshold=20)
+
+        assert regressions == ["flow: 100.000ms -> 130.000ms (+30.0%)"]
+
+    def test_no_regression_within_threshold(self):
+        """
+        Slowdowns up to the threshold, and speedups, pass the gate.
+        """
+        assert compare(run_results(flow=119.0, startup=50.0),
+                       run_results(flow=100.0, startup=100.0), threshold=20) == []
+
+    def test_missing_and_zero_baseline_metrics_are_skipped(self):
+        """
+        Metrics absent from the baseline, or with a zero median, are not compared.
+        """
+        baseline = run_results(zero=0.0)
+
+        assert compare(run_results(new=500.0, zero=10.0), baseline, threshold=20) == []
+        assert compare(run_results(flow=500.0), {}, threshold=20) == []
+
+
+class TestMain:
+    """
+    Test class for the exit status of the benchmark command.
+    """
+
+    @pytest.fixture
+    def root(self, tmp_path, monkeypatch):
+        """
+        Fixture running the command in a temporary project root without measuring anything.
+        """
+        monkeypatch.setattr(utils, "get_root_path", lambda: str(tmp_path))
+        monkeypatch.setattr(BenchmarkRunner, "run", lambda self: run_results(flow=150.0))
+        monkeypatch.setattr(benchmark_runner.config, "BENCHMARK_BASELINE", "baseline.json")
+        return tmp_path
+
+    def test_missing_baseline_fails_unless_allowed(self, root):
+        """
+        Without a baseline the gate fails, unless a missing baseline is explicitly allowed.
+        """
+        assert benchmark_runner.main([]) == 2
+        assert benchmark_runner.main(["--allow-missing-baseline"]) == 0
+
+    def test_regression_fails(self, root):
+        """
+        A regression against the stored baseline fails the gate.
+        """
+        (root / "baseline.json").write_text(json.dumps(run_results(flow=100.0)),
+                                            encoding="utf-8")
+
+        assert benchmark_runner.main(["--threshold", "20"]) == 1
+        assert benchmark_runner.main(["--threshold", "60"]) == 0
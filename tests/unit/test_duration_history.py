@@ -0,0 +1,81 @@
+"""
+Module test the test duration history.
+"""
+import json
+import math
+
+import pytest
+
+from plugins.duration_scheduler import DurationHistory
+
+
+class TestDurationHistory:
+    """
+    Test class for recording and estimating test durations per browser.
+    """
+
+    def test_estimate_adds_weighted_stdev_to_mean(self, tmp_path):
+        """
+        Every recorded run updates the mean and standard deviation of the test, and the
+        estimate adds the weighted standard deviation to the mean.
+        """
+        history = DurationHistory(str(tmp_path / "durations.json"))
+
+        for duration in (1.0, 2.0, 6.0):
+            history.record({"tests/test_a.py::test_a": duration}, browser="chrome")
+
+        stats = history.entries["tests/test_a.py::test_a"]["chrome"]
+        assert stats["stdev"] == pytest.approx(math.sqrt(14 / 3))
+        assert history.estimate("tests/test_a.py::test_a", "chrome", stdev_weight=0) == 3.0
+        assert history.estimate("tests/test_a.py::test_a", "chrome", stdev_weight=2) == \
+            pytest.approx(3.0 + 2 * math.sqrt(14 / 3))
+
+    def test_entries_without_variance_are_upgraded(self, tmp_path):
+        """
+        Entries recorded with only a count and a mean get a variance from the next run on.
+        """
+        path = tmp_path / "durations.json"
+        path.write_text(json.dumps({"tests/test_a.py::test_a": {
+            "chrome": {"count": 1, "mean": 2.0}}}))
+        history = DurationHistory(str(path))
+        assert history.estimate("tests/test_a.py::test_a", "chrome", stdev_weight=1) == 2.0
+
+        history.record({"tests/test_a.py::test_a": 4.0}, browser="chrome")
+
+        assert history.estimate("tests/test_a.py::test_a", "chrome", stdev_weight=1) == 4.0
+
+    def test_unknown_tests_and_browsers_have_no_estimate(self, tmp_path):
+        """
+        Tests never recorded, or recorded with another browser, have no estimate.
+        """
+        history = DurationHistory(str(tmp_path / "durations.json"))
+        history.record({"tests/test_a.py::test_a": 1.0}, browser="chrome")
+
+        assert history.estimate("tests/test_b.py::test_b", "chrome") is None
+        assert history.estimate("tests/test_a.py::test_a", "firefox") is None
+
+    def test_records_merge_with_other_runs(self, tmp_path):
+        """
+        A run merges its durations into what other runs wrote since it read the file.
+        """
+        path = str(tmp_path / "durations.json")
+        first, second = DurationHistory(path), DurationHistory(path)
+
+        first.record({"tests/test_a.py::test_a": 1.0}, browser="chrome")
+        second.record({"tests/test_b.py::test_b": 2.0}, browser="chrome")
+
+        merged = DurationHistory(path)
+        assert merged.estimate("tests/test_a.py::test_a", "chrome") == 1.0
+        assert merged.estimate("tests/test_b.py::test_b", "chrome") == 2.0
+
+    def test_corrupt_file_starts_an_empty_history(self, tmp_path):
+        """
+        An unreadable history file is treated as an empty history and replaced.
+        """
+        path = tmp_path / "durations.json"
+        path.write_text("{not json")
+
+        history = DurationHistory(str(path))
+        history.record({"tests/test_a.py::test_a": 1.5}, browser="chrome")
+
+        assert json.loads(path.read_text())["tests/test_a.py::test_a"]["chrome"]["count"] == 1
@@ -0,0 +1,146 @@
+"""
+Module test the navigation-aware element cache.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from config import config
+from drivers.chrome_context_browser import ContextDriver
+from utilities.element_cache import ElementCache
+
+LOCATOR = ("css selector", "input")
+
+
+class FakeDriver:
+    """
+    A driver stand-in whose command executor records the executed commands.
+    """
+
+    def __init__(self) -> None:
+        self.commands = []
+        self.command_executor = SimpleNamespace(
+            execute=lambda command, params=None: self.commands.append(command))
+
+
+@pytest.fixture(autouse=True)
+def element_cache(monkeypatch):
+    """
+    Fixture enabling the cache and isolating its counters.
+    """
+    monkeypatch.setattr(config, "ELEMENT_CACHE", True)
+    monkeypatch.setattr(ElementCache, "stats", {})
+
+
+class Resolver:
+    """
+    Counts the element lookups and returns a new element on each one.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> object:
+        self.calls += 1
+        return object()
+
+
+class TestElementCache:
+    """
+    Test class for the hits, misses and invalidation of the element cache.
+    """
+
+    def test_hit_after_miss(self):
+        """
+        A locator is resolved once and then served from the cache.
+        """
+        cache = ElementCache(ElementCache.track_navigation(FakeDriver()), "SearchPage")
+        resolve = Resolver()
+
+        first = cache.get(LOCATOR, resolve)
+
+        assert cache.get(LOCATOR, resolve) is first
+        assert resolve.calls == 1
+        assert ElementCache.stats["SearchPage"] == {"hits": 1, "misses": 1, "stale": 0}
+
+    def test_marked_navigation_clears_cache(self):
+        """
+        An action that may change the URL invalidates the cached elements.
+        """
+        driver = ElementCache.track_navigation(FakeDriver())
+        cache = ElementCache(driver, "SearchPage")
+        resolve = Resolver()
+        first = cache.get(LOCATOR, resolve)
+
+        ElementCache.mark_navigation(driver)
+
+        assert cache.get(LOCATOR, resolve) is not first
+        assert resolve.calls == 2
+
+    @pytest.mark.parametrize("command,cleared", [("get", True), ("refresh", True),
+                                                 ("switchToFrame", True),
+                                                 ("findElement", False)])
+    def test_tracked_commands(self, command, cleared):
+        """
+        Only navigation commands sent through the executor invalidate the cache.
+        """
+        driver = ElementCache.track_navigation(FakeDriver())
+        cache = ElementCache(driver, "SearchPage")
+        resolve = Resolver()
+        cache.get(LOCATOR, resolve)
+
+        driver.command_executor.execute(command, {})
+        cache.get(LOCATOR, resolve)
+
+        assert driver.commands == [command]
+        assert resolve.calls == (2 if cleared else 1)
+
+    def test_invalidate_drops_stale_locator(self):
+        """
+        A stale locator is resolved again and counted as stale.
+        """
+        cache = ElementCache(ElementCache.track_navigation(FakeDriver()), "SearchPage")
+        resolve = Resolver()
+        cache.get(LOCATOR, resolve)
+
+        cache.invalidate(LOCATOR)
+        cache.get(LOCATOR, resolve)
+
+        assert resolve.calls == 2
+        assert ElementCache.stats["SearchPage"] == {"hits": 0, "misses": 2, "stale": 1}
+        assert ElementCache.summary() == "SearchPage: 0 hits, 2 misses, 1 stale"
+
+    def test_uncached_lookups(self, monkeypatch):
+        """
+        Non-tuple locators, and every locator when the cache is disabled, are always resolved.
+        """
+        cache = ElementCache(ElementCache.track_navigation(FakeDriver()), "SearchPage")
+        resolve = Resolver()
+        cache.get("input", resolve)
+        cache.get("input", resolve)
+        monkeypatch.setattr(config, "ELEMENT_CACHE", False)
+        cache.get(LOCATOR, resolve)
+        cache.get(LOCATOR, resolve)
+
+        assert resolve.calls == 4
+        assert not ElementCache.stats
+
+    def test_context_view_shares_navigation_epoch(self, monkeypatch):
+        """
+        Navigations marked on a browser context view and navigations of the shared
+        driver both invalidate the cache of the view.
+        """
+        driver = ElementCache.track_navigation(FakeDriver())
+        monkeypatch.setattr(ContextDriver, "_active_handle", "page")
+        view = ContextDriver(driver, "context", "page")
+        cache = ElementCache(view, "SearchPage")
+        resolve = Resolver()
+        cache.get(LOCATOR, resolve)
+
+        ElementCache.mark_navigation(view)
+        cache.get(LOCATOR, resolve)
+        driver.command_executor.execute("get", {})
+        cache.get(LOCATOR, resolve)
+
+        assert "navigation_epoch" not in vars(view)
+        assert resolve.calls == 3
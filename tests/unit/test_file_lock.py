@@ -0,0 +1,54 @@
+"""
+Module test the inter-process file lock.
+"""
+import threading
+import time
+
+import pytest
+
+from utilities.file_lock import FileLock
+
+
+class TestFileLock:
+    """
+    Test class for acquiring, releasing and timing out on the file lock.
+    """
+
+    def test_lock_is_exclusive(self, tmp_path):
+        """
+        A held lock times out other holders and is free again once released.
+        """
+        path = str(tmp_path / "locks" / "chrome.lock")
+        with FileLock(path):
+            with pytest.raises(TimeoutError):
+                FileLock(path, timeout=0.2).acquire()
+        with FileLock(path, timeout=0.2):
+            pass
+
+    def test_waiter_acquires_after_release(self, tmp_path):
+        """
+        A waiting holder gets the lock as soon as it is released.
+        """
+        path = str(tmp_path / "chrome.lock")
+        holder = FileLock(path)
+        holder.acquire()
+        acquired = threading.Event()
+
+        def wait_for_lock():
+            with FileLock(path, timeout=5):
+                acquired.set()
+
+        waiter = threading.Thread(target=wait_for_lock)
+        waiter.start()
+        time.sleep(0.3)
+        assert not acquired.is_set()
+        holder.release()
+        waiter.join(timeout=5)
+
+        assert acquired.is_set()
+
+    def test_release_without_acquire(self, tmp_path):
+        """
+        Releasing a lock that is not held does nothing.
+        """
+        FileLock(str(tmp_path / "chrome.lock")).release()
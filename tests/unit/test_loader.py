@@ -0,0 +1,92 @@
+"""
+Module test configuration layering.
+"""
+import json
+import types
+
+import pytest
+
+from config import loader
+from plugins.layered_config import command_line_settings
+
+
+@pytest.fixture
+def settings() -> types.ModuleType:
+    """
+    Fixture providing a configuration module with a few defaults.
+    """
+    module = types.ModuleType("settings")
+    module.BROWSER = "chrome"
+    module.BROWSER_OPTIONS = []
+    module.POOL_SIZE = 1
+    return module
+
+
+class TestLoader:
+    """
+    Test class for the file, environment and command-line layers of the configuration.
+    """
+
+    def test_parse_value_falls_back_to_text(self):
+        """
+        Values are parsed as JSON, or kept as text when they are not valid JSON.
+        """
+        assert loader.parse_value("3") == 3
+        assert loader.parse_value('["--headless"]') == ["--headless"]
+        assert loader.parse_value("false") is False
+        assert loader.parse_value("firefox") == "firefox"
+
+    def test_environment_overrides_the_file(self, settings, tmp_path):
+        """
+        The environment layer is applied after the configuration file.
+        """
+        config_file = tmp_path / "settings.json"
+        config_file.write_text(json.dumps({"BROWSER": "edge", "POOL_SIZE": 2}))
+        environ = {loader.CONFIG_FILE_VARIABLE: str(config_file), "WAP_BROWSER": "firefox",
+                   "PATH": "/usr/bin"}
+
+        loader.load(settings, environ)
+
+        assert settings.BROWSER == "firefox"
+        assert settings.POOL_SIZE == 2
+        assert settings.BROWSER_OPTIONS == []
+
+    def test_missing_file_is_ignored(self, settings, tmp_path):
+        """
+        A configuration file that does not exist leaves the defaults.
+        """
+        loader.load(settings, {loader.CONFIG_FILE_VARIABLE: str(tmp_path / "missing.json")})
+
+        assert settings.BROWSER == "chrome"
+
+    def test_command_line_overrides(self, settings):
+        """
+        `--setting` overrides are found among other pytest arguments and applied in order.
+        """
+        args = ["-n", "4", "--setting", "browser=firefox", "tests",
+                "--setting=BROWSER_OPTIONS=[\"--headless\"]", "--setting", "BROWSER=edge"]
+
+        loader.apply(settings, loader.cli_overrides(command_line_settings(args)))
+
+        assert settings.BROWSER == "edge"
+        assert settings.BROWSER_OPTIONS == ["--headless"]
+
+    def test_invalid_overrides_fail_fast(self, settings):
+        """
+        Overrides without a value or of an unknown setting raise a ValueError.
+        """
+        with pytest.raises(ValueError):
+            loader.cli_overrides(["BROWSER"])
+        with pytest.raises(ValueError):
+            loader.apply(settings, {"BROWSR": "firefox"})
+
+    def test_export_round_trips_through_the_environment(self, settings):
+        """
+        Exported overrides are read back unchanged by the environment layer.
+        """
+        environ = {}
+        overrides = {"BROWSER": "firefox", "BROWSER_OPTIONS": ["--headless"], "POOL_SIZE": 3}
+
+        loader.export(overrides, environ)
+
+        assert loader.env_overrides(environ) == overrides
@@ -0,0 +1,103 @@
+"""
+Module test the structured log query tool.
+"""
+import gzip
+import json
+
+import pytest
+
+from utilities.log_query import LogQuery
+
+
+def write_records(path, records, compress=False, partial_line=False) -> None:
+    """
+    Writes log records as JSON lines, optionally gzip-compressed like a rotated part.
+    """
+    text = "".join(json.dumps(record) + "\n" for record in records)
+    if partial_line:
+        text += '{"ts": 9'
+    if compress:
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            file.write(text)
+    else:
+        path.write_text(text, encoding="utf-8")
+
+
+@pytest.fixture
+def logs(tmp_path):
+    """
+    Fixture providing the logs of two workers, one of them with a rotated part.
+    """
+    write_records(tmp_path / "log_file.gw0.jsonl.1.gz", [
+        {"ts": 1.0, "level": "INFO", "worker": "gw0", "test": "test_a", "message": "start"},
+        {"ts": 3.0, "level": "DEBUG", "worker": "gw0", "test": "test_a",
+         "method": "SearchPage.search", "locator": ["css selector", "input"],
+         "duration_ms": 120.0, "failed": False},
+    ], compress=True)
+    write_records(tmp_path / "log_file.gw0.jsonl", [
+        {"ts": 5.0, "level": "DEBUG", "worker": "gw0", "test": "test_b",
+         "method": "SearchPage.search", "locator": ["css selector", "input"],
+         "duration_ms": 80.0, "failed": True},
+    ], partial_line=True)
+    write_records(tmp_path / "log_file.gw1.jsonl", [
+        {"ts": 2.0, "level": "ERROR", "worker": "gw1", "test": "test_c", "message": "boom"},
+        {"ts": 4.0, "level": "DEBUG", "worker": "gw1", "test": "test_c",
+         "method": "HomePage.click_on_search", "locator": None, "duration_ms": 300.0},
+    ])
+    return tmp_path
+
+
+class TestLogQuery:
+    """
+    Test class for merging, filtering and summarizing the per-worker logs.
+    """
+
+    def test_shards_order_rotated_parts_oldest_first(self, logs):
+        """
+        Each worker file is one shard, its compressed rotated parts before the live file.
+        """
+        shards = LogQuery([str(logs)]).shards()
+
+        assert sorted(shards) == [str(logs / "log_file.gw0.jsonl"),
+                                  str(logs / "log_file.gw1.jsonl")]
+        assert shards[str(logs / "log_file.gw0.jsonl")] == [
+            str(logs / "log_file.gw0.jsonl.1.gz"), str(logs / "log_file.gw0.jsonl")]
+
+    def test_records_are_merged_in_time_order(self, logs):
+        """
+        The shards are merged on their timestamps and partial lines are skipped.
+        """
+        assert [record["ts"] for record in LogQuery([str(logs)]).records()] == [
+            1.0, 2.0, 3.0, 4.0, 5.0]
+
+    def test_filters(self, logs):
+        """
+        Records are filtered on test, locator, worker and level.
+        """
+        def timestamps(**filters):
+            return [record["ts"] for record in LogQuery([str(logs)], **filters).records()]
+
+        assert timestamps(test="test_a") == [1.0, 3.0]
+        assert timestamps(locator="input") == [3.0, 5.0]
+        assert timestamps(worker="gw1") == [2.0, 4.0]
+        assert timestamps(level="error") == [2.0]
+
+    def test_slowest_page_actions(self, logs):
+        """
+        Only page actions are ranked, slowest first.
+        """
+        slowest = LogQuery([str(logs)]).slowest(top=2)
+
+        assert [record["duration_ms"] for record in slowest] == [300.0, 120.0]
+
+    def test_summary_aggregates_by_method_and_locator(self, logs):
+        """
+        Page actions are aggregated by method and locator, by decreasing total time.
+        """
+        summary = LogQuery([str(logs)]).summary()
+
+        assert [(row["method"], row["locator"]) for row in summary] == [
+            ("HomePage.click_on_search", ""), ("SearchPage.search", "css selector input")]
+        search = summary[1]
+        assert (search["count"], search["total_ms"], search["mean_ms"], search["max_ms"],
+                search["failed"]) == (2, 200.0, 100.0, 120.0, 1)
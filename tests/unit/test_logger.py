@@ -0,0 +1,107 @@
+"""
+Module test the queued, structured Logger.
+"""
+import gzip
+import json
+
+import pytest
+
+from config import config
+from utilities import utils
+from utilities.logger import Logger
+
+
+class Rendered:
+    """
+    A log argument counting how often it is formatted.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __str__(self) -> str:
+        self.calls += 1
+        return "rendered"
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    """
+    Fixture giving the test its own queue handler, writing to a temporary directory.
+    """
+    monkeypatch.setattr(utils, "get_root_path", lambda: str(tmp_path))
+    monkeypatch.setattr(config, "LOG_LEVEL", "INFO")
+    monkeypatch.setattr(config, "LOG_NAME", "unit.log")
+    monkeypatch.setattr(Logger, "_queue_handler", None)
+    monkeypatch.setattr(Logger, "_listener", None)
+    yield tmp_path / "logs"
+    if Logger._listener is not None:
+        Logger._listener.stop()
+        for handler in Logger._listener.handlers:
+            handler.close()
+
+
+def read_records(log_dir) -> list:
+    """
+    Flushes the queued records and reads the JSON lines of the current worker.
+    """
+    Logger.flush()
+    path = log_dir / f"unit.{utils.get_worker_id()}.jsonl"
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestLogger:
+    """
+    Test class for the shared queue handler, lazy formatting and the JSON-lines file.
+    """
+
+    def test_loggers_share_one_queue_handler(self, log_dir):
+        """
+        Every Logger of the process writes through the same queue handler.
+        """
+        first, second = Logger("tests.unit.first"), Logger("tests.unit.second")
+
+        assert first.logger.handlers[-1] is second.logger.handlers[-1] is Logger._queue_handler
+
+    def test_disabled_level_is_not_formatted(self, log_dir):
+        """
+        Arguments of a record below the configured level are never formatted.
+        """
+        logger = Logger("tests.unit.lazy")
+        argument = Rendered()
+
+        logger.debug("Value %s", argument)
+        Logger.flush()
+        assert argument.calls == 0
+
+        logger.info("Value %s", argument)
+        assert [record["message"] for record in read_records(log_dir)] == ["Value rendered"]
+
+    def test_records_are_json_lines_with_fields(self, log_dir):
+        """
+        Records carry the worker, test, calling method and structured fields.
+        """
+        Logger("tests.unit.fields").info("Clicked %s", "search", locator=("css selector", "a"),
+                                         duration_ms=12.5)
+
+        record = read_records(log_dir)[-1]
+
+        assert record["message"] == "Clicked search"
+        assert (record["level"], record["logger"]) == ("INFO", "tests.unit.fields")
+        assert record["worker"] == utils.get_worker_id()
+        assert record["method"] == "test_records_are_json_lines_with_fields"
+        assert (record["locator"], record["duration_ms"]) == (["css selector", "a"], 12.5)
+
+    def test_rotated_parts_are_compressed(self, log_dir, monkeypatch):
+        """
+        A full log file is rotated into a gzip-compressed part.
+        """
+        monkeypatch.setattr(config, "LOG_MAX_BYTES", 1024)
+        logger = Logger("tests.unit.rotation")
+        for index in range(50):
+            logger.info("Record %s", index)
+        Logger.flush()
+
+        with gzip.open(log_dir / f"unit.{utils.get_worker_id()}.jsonl.1.gz", "rt",
+                       encoding="utf-8") as part:
+            assert json.loads(part.readline())["message"].startswith("Record")
@@ -0,0 +1,84 @@
+"""
+Module test the request blocking counters.
+"""
+import json
+
+import pytest
+
+from config import config
+from drivers.request_blocker import RequestBlocker
+
+
+class FakeDriver:
+    """
+    A driver stand-in serving a performance log and a Resource Timing byte count.
+    """
+
+    def __init__(self, events: list) -> None:
+        self.entries = [{"message": json.dumps({"message": {"method": method, "params": params}})}
+                        for method, params in events]
+
+    def get_log(self, log_type: str) -> list:
+        entries, self.entries = self.entries, []
+        return entries
+
+    def execute_script(self, script: str) -> int:
+        return 4096
+
+
+def sent(request_id: str, url: str, resource_type: str) -> tuple:
+    """
+    Builds a `Network.requestWillBeSent` event.
+    """
+    return "Network.requestWillBeSent", {"requestId": request_id, "type": resource_type,
+                                         "request": {"url": url}}
+
+
+class TestRequestBlocker:
+    """
+    Test class for counting blocked requests and transferred and saved bytes.
+    """
+
+    @pytest.fixture(autouse=True)
+    def profile(self, monkeypatch):
+        """
+        Fixture defining a profile blocking ads and images.
+        """
+        monkeypatch.setitem(config.BLOCKING_PROFILES, "unit", ["*://ads.*", "*.png"])
+
+    def test_counts_from_the_performance_log(self, monkeypatch):
+        """
+        Blocked requests are counted per pattern and their bytes estimated per type.
+        """
+        monkeypatch.setattr(config, "BLOCKING_STATS", True)
+        driver = FakeDriver([
+            sent("1", "https://example.com/app.js", "Script"),
+            ("Network.loadingFinished", {"requestId": "1", "encodedDataLength": 1000}),
+            sent("2", "https://example.com/a.png", "Image"),
+            ("Network.loadingFinished", {"requestId": "2", "encodedDataLength": 300}),
+            sent("3", "https://example.com/b.png", "Image"),
+            ("Network.loadingFailed", {"requestId": "3", "type": "Image",
+                                       "blockedReason": "inspector"}),
+            sent("4", "https://ads.example.com/ad", "XHR"),
+            ("Network.loadingFailed", {"requestId": "4", "type": "XHR",
+                                       "blockedReason": "inspector"}),
+        ])
+
+        stats = RequestBlocker(driver, "unit").collect()
+
+        assert (stats["blocked_requests"], stats["blocked_by_pattern"]) == (
+            2, {"*.png": 1, "*://ads.*": 1})
+        assert (stats["transferred_requests"], stats["transferred_bytes"]) == (2, 1300)
+        assert stats["saved_bytes_estimate"] == 300 + 650
+
+    def test_blocked_counters_are_unknown_without_stats(self, monkeypatch):
+        """
+        Without the performance log only the Resource Timing bytes are reported.
+        """
+        monkeypatch.setattr(config, "BLOCKING_STATS", False)
+
+        stats = RequestBlocker(FakeDriver([]), "unit").collect()
+
+        assert stats["transferred_bytes"] == 4096
+        assert stats["blocked_requests"] is None
+        assert stats["saved_bytes_estimate"] is None
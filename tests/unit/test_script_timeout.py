@@ -0,0 +1,60 @@
+"""
+Module test raising and restoring the script timeout of a driver.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from utilities import utils
+
+
+class FakeDriver:
+    """
+    A driver stand-in counting the timeout commands it receives.
+    """
+
+    def __init__(self, script: float) -> None:
+        self.reads = 0
+        self.sets = []
+        self._script = script
+
+    @property
+    def timeouts(self) -> SimpleNamespace:
+        self.reads += 1
+        return SimpleNamespace(script=self._script)
+
+    def set_script_timeout(self, seconds: float) -> None:
+        self.sets.append(seconds)
+        self._script = seconds
+
+
+class TestScriptTimeout:
+    """
+    Test class for the script timeout of in-page waits.
+    """
+
+    def test_long_enough_timeout_is_kept(self):
+        """
+        A timeout already long enough is read once and never changed.
+        """
+        driver = FakeDriver(script=30)
+
+        for _ in range(3):
+            with utils.script_timeout(driver, 11):
+                pass
+
+        assert (driver.reads, driver.sets) == (1, [])
+
+    def test_short_timeout_is_raised_and_restored(self):
+        """
+        A shorter timeout is raised for the block and restored, even when it fails.
+        """
+        driver = FakeDriver(script=5)
+
+        with pytest.raises(RuntimeError):
+            with utils.script_timeout(driver, 11):
+                raise RuntimeError("wait failed")
+        with utils.script_timeout(driver, 11):
+            pass
+
+        assert (driver.reads, driver.sets) == (1, [11, 5, 11, 5])
@@ -0,0 +1,118 @@
+"""
+Module test the resume point and the summary of the search sweep.
+"""
+import json
+
+import pytest
+
+from utilities import utils
+from utilities.search_sweep import SearchSweep
+
+
+def result(index: int, query: str, latency_ms: float = None, result_count: int = 1,
+           error: str = None) -> dict:
+    """
+    Builds the recorded result of one query.
+    """
+    return {"index": index, "query": query, "result_count": result_count,
+            "latency_ms": latency_ms, "error": error}
+
+
+def write_results(path, results, tail: str = "") -> None:
+    """
+    Writes a shard file, optionally ending with a partial line.
+    """
+    path.write_text("".join(json.dumps(entry) + "\n" for entry in results) + tail,
+                    encoding="utf-8")
+
+
+@pytest.fixture
+def sweep(tmp_path, monkeypatch):
+    """
+    Fixture providing a two-shard sweep whose results go to a temporary directory.
+    """
+    monkeypatch.setattr(utils, "get_root_path", lambda: str(tmp_path))
+    (tmp_path / "sweep").mkdir()
+    return SearchSweep(str(tmp_path / "catalog.csv"), shards=2, results_dir="sweep")
+
+
+class TestSearchSweep:
+    """
+    Test class for resuming shards and summarizing their results.
+    """
+
+    def test_queries_stream_catalog(self, sweep, tmp_path):
+        """
+        The catalog is read with its line numbers, skipping empty queries.
+        """
+        (tmp_path / "catalog.csv").write_text("title\nchess\n\n  \nminecraft \n",
+                                              encoding="utf-8")
+
+        assert list(sweep.queries()) == [(0, "chess"), (2, "minecraft")]
+
+    def test_resume_point_without_results(self, tmp_path):
+        """
+        A shard without a results file starts from the beginning.
+        """
+        assert SearchSweep._resume_point(str(tmp_path / "missing.jsonl")) == -1
+
+    def test_resume_point_is_last_index(self, tmp_path):
+        """
+        A shard resumes after the catalog line of its last result.
+        """
+        path = tmp_path / "shard-0-of-2.jsonl"
+        write_results(path, [result(0, "chess"), result(2, "minecraft")])
+
+        assert SearchSweep._resume_point(str(path)) == 2
+
+    def test_resume_point_truncates_partial_line(self, tmp_path):
+        """
+        A partial last line left by an interruption is cut off the file.
+        """
+        path = tmp_path / "shard-0-of-2.jsonl"
+        write_results(path, [result(0, "chess"), result(2, "minecraft")],
+                      tail='{"index": 4, "que')
+
+        assert SearchSweep._resume_point(str(path)) == 2
+        assert path.read_text(encoding="utf-8").endswith('"error": null}\n')
+
+    def test_retry_failed_rewrites_results(self, sweep, tmp_path, monkeypatch):
+        """
+        Failed queries are searched again and replaced in place, in catalog order.
+        """
+        path = tmp_path / "sweep" / "shard-0-of-2.jsonl"
+        write_results(path, [result(0, "chess", 10.0), result(2, "minecraft", error="Timeout"),
+                             result(4, "fortnite", 30.0)])
+        searched = []
+
+        def search(pool, query):
+            searched.append(query)
+            return {"query": query, "result_count": 3, "latency_ms": 20.0, "error": None}
+
+        monkeypatch.setattr(sweep, "search", search)
+
+        assert sweep._retry_failed(None, str(path)) == 1
+        assert searched == ["minecraft"]
+        results = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [(entry["index"], entry["error"]) for entry in results] == [
+            (0, None), (2, None), (4, None)]
+        assert results[1]["latency_ms"] == 20.0
+        assert not (tmp_path / "sweep" / "shard-0-of-2.jsonl.tmp").exists()
+
+    def test_summarize(self, sweep, tmp_path):
+        """
+        The results of every shard are summarized and written to summary.json.
+        """
+        write_results(tmp_path / "sweep" / "shard-0-of-2.jsonl", [
+            result(0, "chess", 100.0), result(2, "minecraft", result_count=0, latency_ms=300.0)])
+        write_results(tmp_path / "sweep" / "shard-1-of-2.jsonl", [
+            result(1, "fortnite", 200.0), result(3, "valorant", error="Timeout")])
+
+        summary = sweep.summarize()
+
+        assert (summary["queries"], summary["errors"], summary["no_results"]) == (4, 1, 1)
+        assert (summary["mean_latency_ms"], summary["max_latency_ms"]) == (200.0, 300.0)
+        assert [entry["query"] for entry in summary["slowest"]] == [
+            "minecraft", "fortnite", "chess"]
+        assert json.loads((tmp_path / "sweep" / "summary.json").read_text(
+            encoding="utf-8")) == summary
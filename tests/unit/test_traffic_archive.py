@@ -0,0 +1,69 @@
+"""
+Module test the record/replay traffic archive.
+"""
+from utilities.replay_proxy import TrafficArchive
+
+GRAPHQL_URL = "https://gql.twitch.tv/gql"
+
+
+class TestTrafficArchive:
+    """
+    Test class for matching requests against the recorded exchanges.
+    """
+
+    def test_query_order_and_ignored_params_do_not_change_the_key(self):
+        """
+        Query parameters are sorted and cache busters are dropped.
+        """
+        key = TrafficArchive.request_key("GET", "https://m.twitch.tv/search?term=sc2&type=all")
+
+        assert TrafficArchive.request_key(
+            "GET", "https://m.twitch.tv/search?type=all&_=123&term=sc2&nonce=x") == key
+
+    def test_method_path_and_params_change_the_key(self):
+        """
+        Requests differing in method, path or a relevant parameter do not match.
+        """
+        key = TrafficArchive.request_key("GET", "https://m.twitch.tv/search?term=sc2")
+
+        assert TrafficArchive.request_key("POST", "https://m.twitch.tv/search?term=sc2") != key
+        assert TrafficArchive.request_key("GET", "https://m.twitch.tv/directory?term=sc2") != key
+        assert TrafficArchive.request_key("GET", "https://m.twitch.tv/search?term=lol") != key
+
+    def test_json_bodies_match_on_canonical_content(self):
+        """
+        JSON bodies match regardless of key order and of the ignored keys, recursively.
+        """
+        key = TrafficArchive.request_key(
+            "POST", GRAPHQL_URL, b'{"operationName": "Search", "variables": {"q": "sc2"}}')
+
+        assert TrafficArchive.request_key(
+            "POST", GRAPHQL_URL,
+            b'{"variables": {"q": "sc2", "nonce": "1"}, "operationName": "Search",'
+            b' "extensions": {"hash": "abc"}}') == key
+        assert TrafficArchive.request_key(
+            "POST", GRAPHQL_URL, b'{"operationName": "Search", "variables": {"q": "lol"}}') != key
+
+    def test_non_json_bodies_match_on_their_bytes(self):
+        """
+        Bodies that are not JSON are hashed as they are.
+        """
+        key = TrafficArchive.request_key("POST", GRAPHQL_URL, b"a=1&b=2")
+
+        assert TrafficArchive.request_key("POST", GRAPHQL_URL, b"a=1&b=2") == key
+        assert TrafficArchive.request_key("POST", GRAPHQL_URL, b"b=2&a=1") != key
+
+    def test_recorded_exchanges_are_replayed_in_order(self, tmp_path):
+        """
+        Repeated requests get the recorded responses in order, the last one repeated.
+        """
+        recorder = TrafficArchive(str(tmp_path))
+        for body in (b"first", b"second"):
+            recorder.record("GET", "https://m.twitch.tv/?_=1", b"", 200, [], body)
+
+        archive = TrafficArchive(str(tmp_path))
+        archive.load()
+        served = [archive.read_body(archive.find("GET", "https://m.twitch.tv/?_=2", b""))
+                  for _ in range(3)]
+
+        assert served == [b"first", b"second", b"second"]
@@ -0,0 +1,119 @@
+"""
+Module providing a navigation-aware element handle cache.
+"""
+from typing import Any, Callable, Dict
+
+from config import config
+from utilities.logger import Logger
+
+NAVIGATION_COMMANDS = {"get", "goBack", "goForward", "refresh", "switchToWindow", "close",
+                       "newWindow", "switchToFrame", "switchToParentFrame"}
+
+
+class ElementCache:
+    """
+    A per-page cache of resolved WebElements keyed by locator.
+
+    Every driver carries a `navigation_epoch` counter, bumped by the command executor on
+    navigation commands and by page actions that may change the URL (clicks, pressing a
+    key). The cache is emptied whenever the epoch moved, so checking its validity never
+    costs a WebDriver round-trip. Stale elements are handled by the caller, which
+    invalidates the locator and re-resolves it once.
+
+    Attributes:
+        driver: An instance of the Selenium WebDriver.
+        owner (str): The name of the page object owning the cache, used for the counters.
+    """
+    logger = Logger(__name__)
+    stats: Dict[str, Dict[str, int]] = {}
+
+    def __init__(self, driver: Any, owner: str) -> None:
+        self.driver = driver
+        self.owner = owner
+        self._elements: Dict[tuple, Any] = {}
+        self._epoch = getattr(driver, "navigation_epoch", 0)
+
+    @staticmethod
+    def track_navigation(driver: Any) -> Any:
+        """
+        Wraps the command executor of the driver so navigation commands bump
+        `driver.navigation_epoch`.
+
+        Args:
+            driver (WebDriver): The driver to track.
+
+        Returns:
+            WebDriver: The same driver.
+        """
+        execute = driver.command_executor.execute
+        driver.navigation_epoch = 0
+
+        def execute_and_track(command: str, params: Dict = None) -> Any:
+            if command in NAVIGATION_COMMANDS:
+                driver.navigation_epoch += 1
+            return execute(command, params)
+
+        driver.command_executor.execute = execute_and_track
+        return driver
+
+    @staticmethod
+    def mark_navigation(driver: Any) -> None:
+        """
+        Records that an action may have changed the URL, invalidating every page cache
+        of the driver.
+
+        Args:
+            driver (WebDriver): The driver the action was performed with.
+        """
+        driver.navigation_epoch = getattr(driver, "navigation_epoch", 0) + 1
+
+    def get(self, locator: Any, resolve: Callable[[], Any]) -> Any:
+        """
+        Returns the cached element for a locator, resolving and caching it on a miss.
+
+        Args:
+            locator: The locator of the element.
+            resolve (Callable): Resolves the element when it is not cached.
+
+        Returns:
+            WebElement: The cached or freshly resolved element.
+        """
+        if not config.ELEMENT_CACHE or not isinstance(locator, tuple):
+            return resolve()
+        epoch = getattr(self.driver, "navigation_epoch", 0)
+        if epoch != self._epoch:
+            self._elements.clear()
+            self._epoch = epoch
+
+        counters = self.stats.setdefault(self.owner, {"hits": 0, "misses": 0, "stale": 0})
+        element = self._elements.get(locator)
+        if element is not None:
+            counters["hits"] += 1
+            return element
+        counters["misses"] += 1
+        element = resolve()
+        self._elements[locator] = element
+        return element
+
+    def invalidate(self, locator: Any) -> None:
+        """
+        Drops a locator whose element went stale.
+
+        Args:
+            locator: The locator of the stale element.
+        """
+        self._elements.pop(locator, None)
+        counters = self.stats.setdefault(self.owner, {"hits": 0, "misses": 0, "stale": 0})
+        counters["stale"] += 1
+        self.logger.debug("Stale element dropped from cache: %s", locator)
+
+    @classmethod
+    def summary(cls) -> str:
+        """
+        Formats the hit and miss counters of every page object.
+
+        Returns:
+            str: One line per page object with its hits, misses and stale elements.
+        """
+        return "; ".join(f"{owner}: {c['hits']} hits, {c['misses']} misses, {c['stale']} stale"
+                         for owner, c in sorted(cls.stats.items()))
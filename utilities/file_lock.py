@@ -0,0 +1,77 @@
+"""
+Module providing an inter-process file lock.
+"""
+import os
+import time
+
+from utilities.logger import Logger
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """
+    An exclusive lock held on a file, shared by every process of the machine
+    (e.g. all pytest-xdist workers).
+
+    Usage:
+        with FileLock("data/profiles/chrome.lock"):
+            ...
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, path: str, timeout: float = 300) -> None:
+        self.path = path
+        self.timeout = timeout
+        self._file = None
+
+    def acquire(self) -> None:
+        """
+        Blocks until the lock is acquired.
+
+        Raises:
+            TimeoutError: If the lock could not be acquired within the timeout.
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = open(self.path, "a+", encoding="utf-8")  # pylint: disable=consider-using-with
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                if fcntl:
+                    fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_NBLCK, 1)
+                self.logger.debug("Acquired lock: %s", self.path)
+                return
+            except OSError as e:
+                if time.monotonic() >= deadline:
+                    self._file.close()
+                    self._file = None
+                    raise TimeoutError(f"Could not acquire lock: {self.path}") from e
+                time.sleep(0.1)
+
+    def release(self) -> None:
+        """
+        Releases the lock.
+        """
+        if self._file is None:
+            return
+        if fcntl:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        else:
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._file.close()
+        self._file = None
+        self.logger.debug("Released lock: %s", self.path)
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
@@ -0,0 +1,189 @@
+"""
+Module merging, filtering and summarizing the structured per-worker logs.
+"""
+import argparse
+import glob
+import gzip
+import heapq
+import json
+import os
+import re
+import sys
+from typing import Any, Dict, IO, Iterator, List, Tuple
+
+from utilities.logger import Logger
+
+ROTATED_PART = re.compile(r"\.(\d+)\.gz$")
+
+
+class LogQuery:
+    """
+    Streams the JSON-lines logs written by every worker, including their compressed
+    rotated parts, as one time-ordered sequence of records.
+
+    Each worker file (a shard) is read part by part, oldest first, and the shards are
+    merged on their timestamps with `heapq.merge`, so only one line per shard is held in
+    memory whatever the size of the logs. The summaries keep one entry per distinct
+    action, or the `top` slowest records.
+
+    Usage:
+        python -m utilities.log_query merge logs --test test_search
+        python -m utilities.log_query slowest logs --top 20 --locator search
+        python -m utilities.log_query summary logs/log_file.gw0.jsonl
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, paths: List[str], test: str = None, locator: str = None,
+                 worker: str = None, level: str = None) -> None:
+        self.paths = paths
+        self.test = test
+        self.locator = locator
+        self.worker = worker
+        self.level = level
+
+    def shards(self) -> Dict[str, List[str]]:
+        """
+        Groups the log files found in `paths` (files or directories) by worker file.
+
+        Returns:
+            dict: The parts of each shard, oldest first.
+        """
+        files = []
+        for path in self.paths:
+            if os.path.isdir(path):
+                files += glob.glob(f"{path}/*.jsonl") + glob.glob(f"{path}/*.jsonl.*.gz")
+            else:
+                files.append(path)
+        shards: Dict[str, List[str]] = {}
+        for file in files:
+            shards.setdefault(ROTATED_PART.sub("", file), []).append(file)
+        for parts in shards.values():
+            # The highest rotation number is the oldest part, the unnumbered file the newest.
+            parts.sort(key=lambda part: -int(ROTATED_PART.search(part).group(1))
+                       if ROTATED_PART.search(part) else 0)
+        return shards
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the records matching the filters of every shard in time order.
+
+        Returns:
+            Iterator[dict]: The matching records.
+        """
+        streams = [self._read_shard(parts) for parts in self.shards().values()]
+        return heapq.merge(*streams, key=lambda record: record.get("ts", 0))
+
+    def slowest(self, top: int = 20) -> List[Dict[str, Any]]:
+        """
+        Returns the slowest page actions.
+
+        Args:
+            top (int): The number of actions to return.
+
+        Returns:
+            list: The `top` records with the longest `duration_ms`, slowest first.
+        """
+        return heapq.nlargest(top, (record for record in self.records()
+                                    if record.get("duration_ms") is not None),
+                              key=lambda record: record["duration_ms"])
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Aggregates the page actions by method and locator.
+
+        Returns:
+            list: The count, total, mean and maximum duration (in ms) of each action,
+            by decreasing total duration.
+        """
+        actions: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for record in self.records():
+            if record.get("duration_ms") is None:
+                continue
+            key = (record.get("method"), self._locator_text(record))
+            action = actions.setdefault(key, {"method": key[0], "locator": key[1], "count": 0,
+                                              "total_ms": 0.0, "max_ms": 0.0, "failed": 0})
+            action["count"] += 1
+            action["total_ms"] += record["duration_ms"]
+            action["max_ms"] = max(action["max_ms"], record["duration_ms"])
+            action["failed"] += bool(record.get("failed"))
+        for action in actions.values():
+            action["mean_ms"] = action["total_ms"] / action["count"]
+        return sorted(actions.values(), key=lambda action: action["total_ms"], reverse=True)
+
+    def _read_shard(self, parts: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the matching records of the parts of one shard, skipping partial lines.
+        """
+        for part in parts:
+            with self._open(part) as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        self.logger.debug("Skipping malformed log line in %s", part)
+                        continue
+                    if self._matches(record):
+                        yield record
+
+    def _matches(self, record: Dict[str, Any]) -> bool:
+        """
+        Checks a record against the test, locator, worker and level filters.
+        """
+        if self.test and self.test not in (record.get("test") or ""):
+            return False
+        if self.locator and self.locator not in self._locator_text(record):
+            return False
+        if self.worker and record.get("worker") != self.worker:
+            return False
+        return not self.level or record.get("level") == self.level.upper()
+
+    @staticmethod
+    def _locator_text(record: Dict[str, Any]) -> str:
+        """
+        Returns the locator of a record as "<by> <value>", or "" without locator.
+        """
+        locator = record.get("locator")
+        if isinstance(locator, list):
+            return " ".join(str(part) for part in locator)
+        return str(locator) if locator else ""
+
+    @staticmethod
+    def _open(path: str) -> IO[str]:
+        """
+        Opens a log part for reading, decompressing rotated parts.
+        """
+        if path.endswith(".gz"):
+            return gzip.open(path, "rt", encoding="utf-8")
+        return open(path, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merge, filter and summarize the worker logs.")
+    parser.add_argument("command", choices=["merge", "slowest", "summary"])
+    parser.add_argument("paths", nargs="*", default=["logs"],
+                        help="Log files or directories. Default is logs/.")
+    parser.add_argument("--test", help="Keep records whose test id contains this text.")
+    parser.add_argument("--locator", help="Keep records whose locator contains this text.")
+    parser.add_argument("--worker", help="Keep records of this worker (e.g. gw0).")
+    parser.add_argument("--level", help="Keep records of this level (e.g. ERROR).")
+    parser.add_argument("--top", type=int, default=20, help="Number of slowest actions.")
+    args = parser.parse_args()
+    query = LogQuery(args.paths, args.test, args.locator, args.worker, args.level)
+    try:
+        if args.command == "merge":
+            for merged in query.records():
+                sys.stdout.write(json.dumps(merged) + "\n")
+        elif args.command == "slowest":
+            for slow in query.slowest(args.top):
+                print(f"{slow['duration_ms']:>10.1f} ms  {slow.get('worker', ''):<7}"
+                      f"{slow.get('method', '')}  {LogQuery._locator_text(slow)}  "
+                      f"{slow.get('test', '')}")
+        else:
+            print(f"{'count':>7}{'total ms':>12}{'mean ms':>10}{'max ms':>10}"
+                  f"{'failed':>8}  action")
+            for row in query.summary():
+                print(f"{row['count']:>7}{row['total_ms']:>12.1f}{row['mean_ms']:>10.1f}"
+                      f"{row['max_ms']:>10.1f}{row['failed']:>8}  {row['method']}  "
+                      f"{row['locator']}")
+    except BrokenPipeError:
+        sys.exit(0)
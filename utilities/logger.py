@@ -1,68 +1,226 @@
 """
 Module of Logger class.
 """
+import atexit
+import gzip
+import json
 import logging
+import os
+import queue
+import shutil
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Set
 
 from config import config
 from utilities import utils
 
+
+class LogContextFilter(logging.Filter):
+    """
+    Stamps each record with the pytest-xdist worker and the node id of the running test.
+
+    It runs on the logging thread, before the record is queued, so the test is the one
+    that was running when the record was created.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.worker = utils.get_worker_id()
+        record.test = utils.get_test_id()
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats a record as one JSON object per line: time, level, logger, worker, test,
+    the calling method (or the `method` field), the message and the structured fields
+    passed to the Logger call (e.g. `locator`, `duration_ms`).
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = dict(getattr(record, "fields", {}))
+        entry = {"ts": round(record.created, 6), "level": record.levelname,
+                 "logger": record.name, "worker": getattr(record, "worker", None),
+                 "test": getattr(record, "test", None),
+                 "method": fields.pop("method", record.funcName),
+                 "message": record.getMessage(), **fields}
+        return json.dumps(entry, default=str)
+
+
 class Logger:
     """
     A simple logging class that configures and provides various logging levels.
+
+    All Logger instances of a process share a single QueueHandler. Records are put
+    on an in-memory queue and written to the log file by a background thread, so
+    logging never blocks on disk I/O. Messages use lazy %-style formatting
+    (e.g. `logger.info("Clicked %s", locator)`) and are not formatted at all when
+    the level is disabled.
+
+    Each worker writes its own file, `logs/<LOG_NAME stem>.<worker>.jsonl`, with one JSON
+    record per line (see `JsonLinesFormatter`), or `.log` with human-formatted lines when
+    `config.LOG_FORMAT` is "text". Keyword arguments of a call are kept as structured
+    fields (e.g. `logger.debug("Clicked %s", locator, locator=locator, duration_ms=12.5)`).
+    A file is rotated at `config.LOG_MAX_BYTES` and its `config.LOG_BACKUP_COUNT` previous
+    parts are kept gzip-compressed. Use utilities/log_query.py to merge and query them.
+
+    The file is only opened when the first record is written, and `reconfigure` applies
+    settings changed after the first Logger was created (e.g. by `--setting`).
     """
+    _queue_handler: QueueHandler = None
+    _listener: QueueListener = None
+    _lock = threading.Lock()
+    _names: Set[str] = set()
 
     def __init__(self, name: str) -> None:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(config.LOG_LEVEL)
+        Logger._names.add(name)
 
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handler = self._get_queue_handler()
+        if handler not in self.logger.handlers:
+            self.logger.addHandler(handler)
 
-        file_handler = logging.FileHandler(f"{utils.get_root_path()}/logs/{config.LOG_NAME}")
-        file_handler.setFormatter(formatter)
+    @classmethod
+    def _get_queue_handler(cls) -> QueueHandler:
+        """
+        Returns the process-wide queue handler, installing the file handler and
+        starting the background writer thread on first use.
+
+        Returns:
+            QueueHandler: The handler shared by every Logger of the process.
+        """
+        with cls._lock:
+            if cls._queue_handler is None:
+                file_handler = cls._create_file_handler()
+                log_queue = queue.SimpleQueue()
+                cls._queue_handler = QueueHandler(log_queue)
+                cls._queue_handler.addFilter(LogContextFilter())
+                cls._listener = QueueListener(
+                    log_queue, file_handler, respect_handler_level=True)
+                cls._listener.start()
+                atexit.register(cls.flush)
+            return cls._queue_handler
+
+    @staticmethod
+    def _create_file_handler() -> RotatingFileHandler:
+        """
+        Creates the size-rotated file handler of the current worker, whose rotated parts
+        are gzip-compressed.
+
+        Returns:
+            RotatingFileHandler: The handler writing the worker's log file.
+        """
+        log_dir = f"{utils.get_root_path()}/logs"
+        os.makedirs(log_dir, exist_ok=True)
+        stem = os.path.splitext(config.LOG_NAME)[0]
+        extension = "jsonl" if config.LOG_FORMAT == "json" else "log"
+        file_handler = RotatingFileHandler(
+            f"{log_dir}/{stem}.{utils.get_worker_id()}.{extension}",
+            maxBytes=config.LOG_MAX_BYTES, backupCount=config.LOG_BACKUP_COUNT,
+            encoding="utf-8", delay=True)
+        file_handler.namer = lambda name: f"{name}.gz"
+        file_handler.rotator = Logger._compress
+        if config.LOG_FORMAT == "json":
+            file_handler.setFormatter(JsonLinesFormatter())
+        else:
+            file_handler.setFormatter(logging.Formatter(
+                '%(asctime)s - %(worker)s - %(test)s - %(name)s - %(levelname)s - %(message)s'))
+        return file_handler
+
+    @staticmethod
+    def _compress(source: str, destination: str) -> None:
+        """
+        Rotates a full log file into a gzip-compressed part.
+        """
+        with open(source, "rb") as plain, gzip.open(destination, "wb") as compressed:
+            shutil.copyfileobj(plain, compressed)
+        os.remove(source)
 
-        self.logger.addHandler(file_handler)
+    @classmethod
+    def reconfigure(cls) -> None:
+        """
+        Applies the current `LOG_LEVEL`, `LOG_NAME`, `LOG_FORMAT` and rotation settings to
+        the Loggers already created. Records queued so far go to the previous file.
+        """
+        with cls._lock:
+            for name in cls._names:
+                logging.getLogger(name).setLevel(config.LOG_LEVEL)
+            if cls._listener is None:
+                return
+            cls._listener.stop()
+            for handler in cls._listener.handlers:
+                handler.close()
+            cls._listener.handlers = (cls._create_file_handler(),)
+            cls._listener.start()
+
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Writes every queued record to the log file and flushes it.
 
-    def debug(self, message: str) -> None:
+        The background writer is stopped, which drains the queue, and restarted so
+        logging can continue afterwards.
+        """
+        with cls._lock:
+            if cls._listener is None:
+                return
+            cls._listener.stop()
+            for handler in cls._listener.handlers:
+                handler.flush()
+            cls._listener.start()
+
+    def debug(self, message: str, *args: Any, **fields: Any) -> None:
         """
         Logs a message with level DEBUG.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, optionally with %-style placeholders.
+            *args: The values for the placeholders, formatted only if the level is enabled.
+            **fields: Structured fields of the record (e.g. `locator`, `duration_ms`).
         """
-        self.logger.debug(message)
+        self.logger.debug(message, *args, extra={"fields": fields}, stacklevel=2)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any, **fields: Any) -> None:
         """
         Logs a message with level INFO.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, optionally with %-style placeholders.
+            *args: The values for the placeholders, formatted only if the level is enabled.
+            **fields: Structured fields of the record (e.g. `locator`, `duration_ms`).
         """
-        self.logger.info(message)
+        self.logger.info(message, *args, extra={"fields": fields}, stacklevel=2)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any, **fields: Any) -> None:
         """
         Logs a message with level WARNING.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, optionally with %-style placeholders.
+            *args: The values for the placeholders, formatted only if the level is enabled.
+            **fields: Structured fields of the record (e.g. `locator`, `duration_ms`).
         """
-        self.logger.warning(message)
+        self.logger.warning(message, *args, extra={"fields": fields}, stacklevel=2)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any, **fields: Any) -> None:
         """
         Logs a message with level ERROR.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, optionally with %-style placeholders.
+            *args: The values for the placeholders, formatted only if the level is enabled.
+            **fields: Structured fields of the record (e.g. `locator`, `duration_ms`).
         """
-        self.logger.error(message)
+        self.logger.error(message, *args, extra={"fields": fields}, stacklevel=2)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args: Any, **fields: Any) -> None:
         """
         Logs a message with level CRITICAL.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, optionally with %-style placeholders.
+            *args: The values for the placeholders, formatted only if the level is enabled.
+            **fields: Structured fields of the record (e.g. `locator`, `duration_ms`).
         """
-        self.logger.critical(message)
+        self.logger.critical(message, *args, extra={"fields": fields}, stacklevel=2)
@@ -0,0 +1,174 @@
+"""
+Module running the test suite over a browser x device matrix.
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+from config import config
+from utilities import utils
+from utilities.logger import Logger
+
+POLL_INTERVAL = 0.5
+
+
+class MatrixRunner:
+    """
+    Runs the suite once per browser x device combination, concurrently, and merges the
+    Allure results of every combination into one report.
+
+    Each combination is a separate pytest process whose settings are passed through the
+    `WAP_` environment layer (see config/loader.py), so `BrowserFactory`, the driver pool
+    and the `browser` fixture see the browser, options and device of their combination.
+    At most `max_parallel` combinations run at once, and at most `caps[browser]` of the
+    same browser.
+
+    Usage:
+        exit_code = MatrixRunner(["chrome", "firefox"], ["desktop", "Pixel 7"]).run(["-n", "2"])
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, browsers: List[str], devices: List[str],
+                 max_parallel: int = config.MATRIX_MAX_PARALLEL,
+                 caps: Dict[str, int] = None) -> None:
+        self.browsers = browsers
+        self.devices = devices
+        self.max_parallel = max_parallel
+        self.caps = caps if caps is not None else config.MATRIX_BROWSER_CAPS
+        self.root = utils.get_root_path()
+        self.results_dir = f"{self.root}/{config.MATRIX_REPORT_DIR}"
+
+    def combinations(self) -> List[Dict[str, Any]]:
+        """
+        Expands the browsers and devices into combinations. Emulated devices are skipped
+        on browsers that do not support emulation.
+
+        Returns:
+            list: The "name", "browser", "device" and "options" of each combination.
+        """
+        combinations = []
+        base_options = [option for option in config.BROWSER_OPTIONS
+                        if option != "mobileEmulation"]
+        for browser in self.browsers:
+            for device in self.devices:
+                if device == "desktop":
+                    options = base_options
+                elif browser in config.MATRIX_EMULATION_BROWSERS:
+                    options = base_options + ["mobileEmulation"]
+                else:
+                    self.logger.info("Skipping %s on %s: no device emulation", device, browser)
+                    continue
+                name = re.sub(r"[^A-Za-z0-9]+", "_", f"{browser}-{device}").strip("_")
+                combinations.append({"name": name, "browser": browser, "device": device,
+                                     "options": options})
+        return combinations
+
+    def run(self, pytest_args: List[str] = None) -> int:
+        """
+        Runs every combination and merges their results.
+
+        Args:
+            pytest_args (List[str]): Extra arguments passed to every pytest run.
+
+        Returns:
+            int: 0 if every combination passed, otherwise the first non-zero exit code.
+        """
+        pending = self.combinations()
+        running: Dict[str, Dict[str, Any]] = {}
+        finished: List[Dict[str, Any]] = []
+        shutil.rmtree(f"{self.results_dir}/matrix", ignore_errors=True)
+
+        while pending or running:
+            for combination in list(pending):
+                if len(running) >= self.max_parallel:
+                    break
+                if self._running_count(running, combination["browser"]) < self.caps.get(
+                        combination["browser"], self.max_parallel):
+                    pending.remove(combination)
+                    running[combination["name"]] = self._start(combination, pytest_args or [])
+            for name, state in list(running.items()):
+                exit_code = state["process"].poll()
+                if exit_code is not None:
+                    state["log"].close()
+                    finished.append({**state["combination"], "exit_code": exit_code,
+                                     "duration": time.perf_counter() - state["start"]})
+                    self.logger.info("Combination %s finished with exit code %s",
+                                     name, exit_code)
+                    del running[name]
+            time.sleep(POLL_INTERVAL)
+
+        self.merge(finished)
+        return next((result["exit_code"] for result in finished if result["exit_code"]), 0)
+
+    def merge(self, finished: List[Dict[str, Any]]) -> None:
+        """
+        Copies the Allure results of every combination into `config.MATRIX_REPORT_DIR`
+        and writes a summary of the combinations next to them.
+
+        Args:
+            finished (list): The finished combinations with their exit code and duration.
+        """
+        os.makedirs(self.results_dir, exist_ok=True)
+        for path in glob.glob(f"{self.results_dir}/matrix/*/*"):
+            shutil.copy2(path, self.results_dir)
+        summary_file = f"{self.results_dir}/matrix-summary.json"
+        with open(summary_file, "w", encoding="utf-8") as file:
+            json.dump(finished, file, indent=2)
+        for result in finished:
+            status = "passed" if result["exit_code"] == 0 else f"exit code {result['exit_code']}"
+            self.logger.info("%-32s%8.1fs  %s", result["name"], result["duration"], status)
+        self.logger.info("Merged results of %s combinations into %s",
+                         len(finished), self.results_dir)
+
+    def _start(self, combination: Dict[str, Any], pytest_args: List[str]) -> Dict[str, Any]:
+        """
+        Starts the pytest process of a combination.
+        """
+        name = combination["name"]
+        env = dict(os.environ)
+        env.update({
+            "WAP_BROWSER": combination["browser"],
+            "WAP_BROWSER_OPTIONS": json.dumps(combination["options"]),
+            "WAP_MATRIX_COMBINATION": name,
+            "WAP_LOG_NAME": f"{name}.log",
+            "WAP_TRACE_DIR": f"{config.TRACE_DIR}/{name}",
+        })
+        if combination["device"] != "desktop":
+            env["WAP_DEVICE_NAME"] = combination["device"]
+        log_dir = f"{self.root}/logs/matrix"
+        os.makedirs(log_dir, exist_ok=True)
+        log = open(f"{log_dir}/{name}.out", "w", encoding="utf-8")  # pylint: disable=consider-using-with
+        command = [sys.executable, "-m", "pytest",
+                   f"--alluredir={self.results_dir}/matrix/{name}", *pytest_args]
+        self.logger.info("Starting combination %s: %s", name, " ".join(command))
+        process = subprocess.Popen(command, cwd=self.root, env=env, stdout=log,
+                                   stderr=subprocess.STDOUT)
+        return {"combination": combination, "process": process, "log": log,
+                "start": time.perf_counter()}
+
+    @staticmethod
+    def _running_count(running: Dict[str, Dict[str, Any]], browser: str) -> int:
+        """
+        Returns the number of running combinations of a browser.
+        """
+        return sum(1 for state in running.values() if state["combination"]["browser"] == browser)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run the suite over a browser x device matrix.",
+        epilog="Arguments after -- are passed to every pytest run.")
+    parser.add_argument("--browsers", nargs="+", default=config.MATRIX_BROWSERS)
+    parser.add_argument("--devices", nargs="+", default=config.MATRIX_DEVICES)
+    parser.add_argument("--max-parallel", type=int, default=config.MATRIX_MAX_PARALLEL)
+    args, extra = parser.parse_known_args()
+    if extra[:1] == ["--"]:
+        extra = extra[1:]
+    sys.exit(MatrixRunner(args.browsers, args.devices, args.max_parallel).run(extra))
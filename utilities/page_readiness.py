@@ -0,0 +1,125 @@
+"""
+Module providing event-driven page readiness detection.
+"""
+import time
+from typing import Any
+
+from config import config
+from utilities import utils
+from utilities.logger import Logger
+
+# Installed once per document, at its start where the driver supports it (see
+# `PageReadiness.attach`). Counts pending fetch/XHR requests and records the time of the
+# last network or DOM structure change so quiescence can be detected in-page.
+INSTRUMENT_SCRIPT = """
+if (!window.__wapReadiness) {
+    var state = {pending: 0, lastActivity: performance.now()};
+    var touch = function () { state.lastActivity = performance.now(); };
+    var done = function () { state.pending = Math.max(0, state.pending - 1); touch(); };
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            state.pending++; touch();
+            return originalFetch.apply(this, arguments).then(
+                function (r) { done(); return r; },
+                function (e) { done(); throw e; });
+        };
+    }
+
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.pending++; touch();
+        this.addEventListener('loadend', done, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+
+    // Only nodes being added or removed count as DOM activity: attribute and text
+    // changes never stop on pages with players, timers or animated counters.
+    // The document itself is observed, since its root element may not exist yet.
+    new MutationObserver(touch).observe(document, {childList: true, subtree: true});
+
+    window.__wapReadiness = state;
+}
+"""
+
+# Resolves as soon as the document is complete, no request is pending and neither
+# the network nor the DOM changed during the quiet window, or when the ceiling is hit.
+WAIT_SCRIPT = """
+var quietMs = arguments[0], ceilingMs = arguments[1], callback = arguments[arguments.length - 1];
+var start = performance.now();
+var check = function () {
+    var state = window.__wapReadiness;
+    var now = performance.now();
+    var settled = document.readyState === 'complete' && state.pending === 0
+        && now - state.lastActivity >= quietMs;
+    if (settled || now - start >= ceilingMs) {
+        callback({settled: settled, elapsed: now - start, pending: state.pending});
+    } else {
+        setTimeout(check, 50);
+    }
+};
+check();
+"""
+
+
+class PageReadiness:
+    """
+    A readiness engine that waits for network idle and DOM quiescence from inside
+    the page instead of sleeping a fixed amount of time.
+
+    Chromium drivers install the instrumentation at the start of every document (see
+    `attach`). Other drivers, e.g. Firefox or remote sessions, install it with the first
+    wait of each document, so fetch/XHR requests already in flight then are not counted.
+
+    Attributes:
+        driver: An instance of the Selenium WebDriver.
+        quiet_window (int): Milliseconds without network or DOM activity that
+                            count as a stable page.
+        timeout (float): The ceiling, in seconds, for a single wait.
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, driver: Any, quiet_window: int = config.PAGE_QUIET_WINDOW,
+                 timeout: float = config.PAGE_READY_TIMEOUT) -> None:
+        self.driver = driver
+        self.quiet_window = quiet_window
+        self.timeout = timeout
+
+    @staticmethod
+    def attach(driver: Any) -> Any:
+        """
+        Installs the instrumentation at the start of every new document of a Chromium
+        driver, so requests started before the first wait are counted too.
+
+        Args:
+            driver (WebDriver): The driver to instrument.
+
+        Returns:
+            WebDriver: The same driver.
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                                   {"source": INSTRUMENT_SCRIPT})
+        return driver
+
+    def wait_until_stable(self) -> float:
+        """
+        Waits until the page is stable or the ceiling is reached.
+
+        Returns:
+            float: The time, in seconds, the wait actually took.
+        """
+        start = time.perf_counter()
+        # Installing is a no-op once the document is instrumented.
+        with utils.script_timeout(self.driver, self.timeout + 1):
+            result = self.driver.execute_async_script(
+                INSTRUMENT_SCRIPT + WAIT_SCRIPT, self.quiet_window, self.timeout * 1000)
+        elapsed = time.perf_counter() - start
+        if result["settled"]:
+            self.logger.info("Page stable after %.3fs", elapsed)
+        else:
+            self.logger.warning(
+                "Page not stable after %.3fs ceiling "
+                "(%s requests pending)", elapsed, result['pending'])
+        return elapsed
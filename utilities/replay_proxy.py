@@ -0,0 +1,378 @@
+"""
+Module providing an offline record/replay stand-in for the application under test.
+"""
+import glob
+import hashlib
+import http.client
+import json
+import os
+import ssl
+import subprocess
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from config import config
+from utilities import utils
+from utilities.logger import Logger
+
+HOP_BY_HOP_HEADERS = {"connection", "keep-alive", "proxy-connection", "proxy-authorization",
+                      "transfer-encoding", "te", "trailer", "upgrade", "content-length"}
+
+
+class TrafficArchive:
+    """
+    An on-disk archive of HTTP exchanges.
+
+    Each worker appends its exchanges to its own `entries-<worker>.jsonl` shard and
+    response bodies are stored once per content hash under `bodies/`, so several
+    workers can record into the same archive without locking.
+
+    Attributes:
+        path (str): The directory of the archive.
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._loose_entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._served: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def request_key(method: str, url: str, body: bytes = b"") -> str:
+        """
+        Builds the key an exchange is matched on.
+
+        Query parameters are sorted and those listed in `config.REPLAY_IGNORED_QUERY_PARAMS`
+        are dropped. Request bodies (e.g. GraphQL calls) are matched on a hash of their
+        canonical JSON without the keys in `config.REPLAY_IGNORED_BODY_KEYS`.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The absolute request URL.
+            body (bytes): The request body.
+
+        Returns:
+            str: The matching key of the request.
+        """
+        parts = urlsplit(url)
+        query = sorted((name, value) for name, value in parse_qsl(parts.query, True)
+                       if name not in config.REPLAY_IGNORED_QUERY_PARAMS)
+        key = f"{method} {parts.netloc}{parts.path}?{urlencode(query)}"
+        if body:
+            try:
+                payload = TrafficArchive._strip_keys(json.loads(body))
+                body = json.dumps(payload, sort_keys=True).encode()
+            except ValueError:
+                pass
+            key += f" {hashlib.sha1(body).hexdigest()}"
+        return key
+
+    @staticmethod
+    def loose_key(method: str, url: str) -> str:
+        """
+        Builds the fallback key used when no exchange matches exactly.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The absolute request URL.
+
+        Returns:
+            str: The method, host and path of the request.
+        """
+        parts = urlsplit(url)
+        return f"{method} {parts.netloc}{parts.path}"
+
+    @staticmethod
+    def _strip_keys(payload: Any) -> Any:
+        """
+        Removes the ignored keys from a JSON payload, recursively.
+        """
+        if isinstance(payload, dict):
+            return {key: TrafficArchive._strip_keys(value) for key, value in payload.items()
+                    if key not in config.REPLAY_IGNORED_BODY_KEYS}
+        if isinstance(payload, list):
+            return [TrafficArchive._strip_keys(item) for item in payload]
+        return payload
+
+    def load(self) -> None:
+        """
+        Loads the index of every shard of the archive. Bodies stay on disk until served.
+        """
+        for shard in glob.glob(f"{self.path}/entries-*.jsonl"):
+            with open(shard, encoding="utf-8") as file:
+                for line in file:
+                    entry = json.loads(line)
+                    self._entries.setdefault(entry["key"], []).append(entry)
+                    self._loose_entries.setdefault(entry["loose_key"], []).append(entry)
+        self.logger.info("Loaded %s recorded requests from: %s", len(self._entries), self.path)
+
+    def find(self, method: str, url: str, body: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Finds the recorded exchange for a request. Repeated requests are answered with
+        the recorded responses in order, the last one being repeated.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The absolute request URL.
+            body (bytes): The request body.
+
+        Returns:
+            dict: The recorded entry, or None if the request was never recorded.
+        """
+        key = self.request_key(method, url, body)
+        entries = self._entries.get(key)
+        if not entries and config.REPLAY_LOOSE_MATCH:
+            key = self.loose_key(method, url)
+            entries = self._loose_entries.get(key)
+        if not entries:
+            return None
+        with self._lock:
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+        return entries[min(index, len(entries) - 1)]
+
+    def read_body(self, entry: Dict[str, Any]) -> bytes:
+        """
+        Reads the body of a recorded response.
+
+        Args:
+            entry (dict): The recorded entry.
+
+        Returns:
+            bytes: The raw response body.
+        """
+        with open(f"{self.path}/bodies/{entry['body']}", "rb") as file:
+            return file.read()
+
+    def record(self, method: str, url: str, body: bytes, status: int,
+               headers: List[tuple], response_body: bytes) -> None:
+        """
+        Appends an exchange to the shard of the current worker.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The absolute request URL.
+            body (bytes): The request body.
+            status (int): The response status code.
+            headers (list): The response headers as (name, value) pairs.
+            response_body (bytes): The raw response body.
+        """
+        digest = hashlib.sha1(response_body).hexdigest()
+        body_path = f"{self.path}/bodies/{digest}"
+        if not os.path.exists(body_path):
+            os.makedirs(f"{self.path}/bodies", exist_ok=True)
+            tmp_path = f"{body_path}.{os.getpid()}.{threading.get_ident()}"
+            with open(tmp_path, "wb") as file:
+                file.write(response_body)
+            os.replace(tmp_path, body_path)
+
+        entry = {"key": self.request_key(method, url, body),
+                 "loose_key": self.loose_key(method, url),
+                 "url": url, "status": status, "headers": headers, "body": digest}
+        worker = utils.get_worker_id()
+        with self._lock, open(f"{self.path}/entries-{worker}.jsonl", "a",
+                              encoding="utf-8") as file:
+            file.write(json.dumps(entry) + "\n")
+
+
+class ReplayProxyHandler(BaseHTTPRequestHandler):
+    """
+    An HTTP(S) proxy request handler that records exchanges with the live site or
+    replays them from the archive.
+
+    HTTPS is intercepted by terminating the CONNECT tunnel with a local self-signed
+    certificate, which the browsers are configured to accept.
+    """
+    protocol_version = "HTTP/1.1"
+    tunnel_host: str = None
+
+    def do_CONNECT(self) -> None:  # pylint: disable=invalid-name
+        """
+        Terminates a CONNECT tunnel locally and keeps reading requests from it.
+        """
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        self.tunnel_host = self.path
+        self.connection = self.server.ssl_context.wrap_socket(self.connection, server_side=True)
+        self.rfile = self.connection.makefile("rb", self.rbufsize)
+        self.wfile = self.connection.makefile("wb", 0)
+        self.close_connection = False
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """
+        Handles every HTTP method by recording or replaying the exchange.
+        """
+        url = self._absolute_url()
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+
+        if self.headers.get("Upgrade"):
+            self._respond(501, [], b"")
+            return
+        if self.server.mode == "record":
+            self._forward(url, body)
+        else:
+            self._replay(url, body)
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = do_OPTIONS = do_GET
+
+    def _absolute_url(self) -> str:
+        """
+        Returns the absolute URL of the current request, whether it came through a
+        tunnel or as a plain proxy request.
+        """
+        if self.tunnel_host:
+            host = self.tunnel_host[:-4] if self.tunnel_host.endswith(":443") else self.tunnel_host
+            return f"https://{host}{self.path}"
+        return self.path
+
+    def _forward(self, url: str, body: bytes) -> None:
+        """
+        Sends the request to the live site, records the exchange and relays the response.
+        """
+        parts = urlsplit(url)
+        connection_class = (http.client.HTTPSConnection if parts.scheme == "https"
+                            else http.client.HTTPConnection)
+        connection = connection_class(parts.netloc, timeout=config.EXPLICIT_WAIT)
+        headers = {name: value for name, value in self.headers.items()
+                   if name.lower() not in HOP_BY_HOP_HEADERS}
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+        try:
+            connection.request(self.command, path, body=body or None, headers=headers)
+            response = connection.getresponse()
+            response_body = response.read()
+            response_headers = [(name, value) for name, value in response.getheaders()
+                                if name.lower() not in HOP_BY_HOP_HEADERS]
+            self.server.archive.record(self.command, url, body, response.status,
+                                       response_headers, response_body)
+            self._respond(response.status, response_headers, response_body)
+        except OSError as e:
+            self.server.logger.warning("Upstream request failed for %s: %s", url, e)
+            self._respond(502, [], b"")
+        finally:
+            connection.close()
+
+    def _replay(self, url: str, body: bytes) -> None:
+        """
+        Answers the request from the archive, without any network access.
+        """
+        entry = self.server.archive.find(self.command, url, body)
+        if entry is None:
+            self.server.logger.warning("No recorded response for: %s %s", self.command, url)
+            self._respond(404, [], b"")
+            return
+        self._respond(entry["status"], entry["headers"], self.server.archive.read_body(entry))
+
+    def _respond(self, status: int, headers: List[tuple], body: bytes) -> None:
+        """
+        Writes a response with an explicit Content-Length so the connection can be reused.
+        """
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        """
+        Routes the access log of the server to the framework logger.
+        """
+        self.server.logger.debug(format, *args)
+
+
+class ReplayProxy(ThreadingHTTPServer):
+    """
+    A local multi-threaded proxy the browsers are pointed at when `config.NETWORK_MODE`
+    is "record" or "replay".
+
+    In "record" mode every exchange with the live site is captured into the archive at
+    `config.ARCHIVE_PATH`. In "replay" mode requests are answered from that archive
+    only, so the suite runs deterministically without network access.
+
+    Usage:
+        proxy = ReplayProxy.start("replay")
+        ...
+        proxy.stop()
+    """
+    logger = Logger(__name__)
+    daemon_threads = True
+    active: "ReplayProxy" = None
+
+    def __init__(self, mode: str, archive: TrafficArchive) -> None:
+        super().__init__(("127.0.0.1", 0), ReplayProxyHandler)
+        self.mode = mode
+        self.archive = archive
+        self.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self._load_certificate(self.ssl_context)
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @classmethod
+    def start(cls, mode: str, archive_path: str = None) -> "ReplayProxy":
+        """
+        Starts the proxy on a free local port and makes it the active proxy.
+
+        Args:
+            mode (str): "record" or "replay".
+            archive_path (str): The archive directory, relative to the project root.
+                                Default is `config.ARCHIVE_PATH`.
+
+        Returns:
+            ReplayProxy: The running proxy.
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Invalid network mode: {mode}")
+        archive = TrafficArchive(f"{utils.get_root_path()}/{archive_path or config.ARCHIVE_PATH}")
+        os.makedirs(archive.path, exist_ok=True)
+        if mode == "replay":
+            archive.load()
+        proxy = cls(mode, archive)
+        proxy._thread.start()
+        cls.active = proxy
+        cls.logger.info("Proxy started in %s mode on: %s", mode, proxy.address)
+        return proxy
+
+    @property
+    def address(self) -> str:
+        """
+        Returns the "host:port" the proxy listens on.
+        """
+        host, port = self.server_address[:2]
+        return f"{host}:{port}"
+
+    def stop(self) -> None:
+        """
+        Stops the proxy and clears it as the active proxy.
+        """
+        self.shutdown()
+        self.server_close()
+        if ReplayProxy.active is self:
+            ReplayProxy.active = None
+        self.logger.info("Proxy stopped.")
+
+    @staticmethod
+    def _load_certificate(ssl_context: ssl.SSLContext) -> None:
+        """
+        Creates the self-signed certificate used to terminate HTTPS tunnels and loads it
+        into the SSL context. The browsers ignore certificate errors while the proxy is
+        active, so a single throwaway certificate serves every host. The files are only
+        needed while loading, so they are removed right away.
+
+        Args:
+            ssl_context (ssl.SSLContext): The server context of the proxy.
+        """
+        with tempfile.TemporaryDirectory(prefix="wap-replay-") as cert_dir:
+            cert_file, key_file = f"{cert_dir}/proxy.crt", f"{cert_dir}/proxy.key"
+            subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+                            "-keyout", key_file, "-out", cert_file, "-days", "1",
+                            "-subj", "/CN=wap-testing replay proxy"],
+                           check=True, capture_output=True)
+            ssl_context.load_cert_chain(cert_file, key_file)
@@ -0,0 +1,112 @@
+"""
+Module providing an asynchronous screenshot pipeline.
+"""
+import base64
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from config import config
+from utilities.logger import Logger
+
+
+class ScreenshotWriter:
+    """
+    Captures screenshots in memory on the test thread and decodes and writes them
+    on a background thread pool.
+
+    At most `config.SCREENSHOT_QUEUE_SIZE` screenshots wait to be written; further
+    captures block until a slot frees up, which keeps memory bounded.
+
+    Usage:
+        handle = ScreenshotWriter.capture(driver, "data/screenshots/page.png")
+        assert handle.result()
+    """
+    logger = Logger(__name__)
+    _executor: ThreadPoolExecutor = None
+    _slots = threading.BoundedSemaphore(config.SCREENSHOT_QUEUE_SIZE)
+    _lock = threading.Lock()
+
+    @classmethod
+    def capture(cls, driver: Any, file_path: str, image_format: str = "png",
+                quality: Optional[int] = None, clip: Optional[Dict[str, float]] = None) -> Future:
+        """
+        Grabs a screenshot in memory and schedules it to be written to disk.
+
+        On Chrome and Edge the screenshot is taken through DevTools, which supports the
+        "png", "jpeg" and "webp" formats, a quality and a clip region. Other browsers
+        always produce a full-page PNG.
+
+        Args:
+            driver (WebDriver): The driver to take the screenshot with.
+            file_path (str): The path where the screenshot will be saved.
+            image_format (str): "png", "jpeg" or "webp". Default is "png".
+            quality (int): The compression quality (0-100) for "jpeg" and "webp".
+            clip (dict): Optional region with the keys "x", "y", "width" and "height".
+
+        Returns:
+            Future: Resolves to True once the file is written, or False on failure.
+        """
+        data = cls._grab(driver, image_format, quality, clip)
+        cls._slots.acquire()
+        try:
+            future = cls._get_executor().submit(cls._write, data, file_path)
+        except Exception:
+            cls._slots.release()
+            raise
+        future.add_done_callback(lambda _: cls._slots.release())
+        return future
+
+    @classmethod
+    def _grab(cls, driver: Any, image_format: str, quality: Optional[int],
+              clip: Optional[Dict[str, float]]) -> str:
+        """
+        Grabs the screenshot as base64 text, without decoding it.
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            params = {"format": image_format}
+            if quality is not None and image_format != "png":
+                params["quality"] = quality
+            if clip:
+                params["clip"] = {"scale": 1, **clip}
+            return driver.execute_cdp_cmd("Page.captureScreenshot", params)["data"]
+        if image_format != "png" or clip:
+            cls.logger.warning("Format and clip options need DevTools, taking a full PNG.")
+        return driver.get_screenshot_as_base64()
+
+    @classmethod
+    def _write(cls, data: str, file_path: str) -> bool:
+        """
+        Decodes a screenshot and writes it to disk. Runs on the background pool.
+        """
+        try:
+            os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+            with open(file_path, "wb") as file:
+                file.write(base64.b64decode(data))
+            cls.logger.info("Screenshot saved to: %s", file_path)
+            return True
+        except OSError as e:
+            cls.logger.warning("Failed to save screenshot to %s: %s", file_path, e)
+            return False
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """
+        Returns the background pool, creating it on first use.
+        """
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=config.SCREENSHOT_WORKERS, thread_name_prefix="screenshot")
+            return cls._executor
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Waits for every pending screenshot to be written and stops the background pool.
+        """
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=True)
+                cls._executor = None
@@ -0,0 +1,170 @@
+"""
+Module providing waits evaluated inside the browser.
+"""
+import time
+from typing import Any, Optional, Tuple
+
+from selenium.common.exceptions import (JavascriptException, StaleElementReferenceException,
+                                        TimeoutException)
+from selenium.webdriver.common.by import By
+
+from config import config
+from utilities import utils
+from utilities.logger import Logger
+
+# Evaluates a condition in-page and re-checks it on every DOM mutation and animation
+# frame, resolving the moment it becomes true, or with null once the timeout expires.
+CONDITION_SCRIPT = """
+var kind = arguments[0], selector = arguments[1], condition = arguments[2],
+    timeoutMs = arguments[3], callback = arguments[arguments.length - 1];
+
+var query = function () {
+    if (kind === 'css') {
+        return Array.prototype.slice.call(document.querySelectorAll(selector));
+    }
+    var found = document.evaluate(selector, document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < found.snapshotLength; i++) { nodes.push(found.snapshotItem(i)); }
+    return nodes;
+};
+var isVisible = function (el) {
+    var style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') {
+        return false;
+    }
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+};
+var evaluate = function () {
+    var nodes = query();
+    switch (condition) {
+        case 'present': return nodes.length ? nodes[0] : null;
+        case 'visible': return nodes.find(isVisible) || null;
+        case 'all_visible': return nodes.length && nodes.every(isVisible) ? nodes : null;
+        case 'clickable':
+            return nodes.find(function (el) { return isVisible(el) && !el.disabled; }) || null;
+        case 'invisible': return nodes.every(function (el) { return !isVisible(el); }) || null;
+    }
+    return null;
+};
+
+var finished = false, observer = null, timer = null;
+var finish = function (value) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    clearTimeout(timer);
+    callback(value);
+};
+var check = function () {
+    if (finished) { return; }
+    var value = evaluate();
+    if (value) { finish(value); } else { requestAnimationFrame(check); }
+};
+
+observer = new MutationObserver(check);
+observer.observe(document.documentElement,
+    {childList: true, subtree: true, attributes: true, characterData: true});
+timer = setTimeout(function () { finish(null); }, timeoutMs);
+check();
+"""
+
+
+class ScriptWait:
+    """
+    A wait backend that sends one `execute_async_script` per condition and lets the
+    browser resolve it, instead of polling the driver from the client.
+
+    Supported conditions are "present", "visible", "all_visible", "clickable" and
+    "invisible". Like the Selenium expected conditions they hold for the first matching
+    element that satisfies them, not only for the first match, and "all_visible" only
+    holds once every match (at least one) is visible.
+
+    When a navigation unloads the document while the script runs, or the element found
+    goes stale before it is returned, the wait is sent again for the remaining time.
+
+    Attributes:
+        driver: An instance of the Selenium WebDriver.
+        timeout (float): The time, in seconds, to wait for a condition.
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, driver: Any, timeout: float = config.EXPLICIT_WAIT) -> None:
+        self.driver = driver
+        self.timeout = timeout
+
+    @staticmethod
+    def to_selector(locator: tuple) -> Optional[Tuple[str, str]]:
+        """
+        Translates a Selenium locator into a CSS selector or an XPath expression.
+
+        Args:
+            locator (tuple): A tuple representing the locator strategy and value
+            (e.g., (By.ID, 'element_id')).
+
+        Returns:
+            tuple: A ("css" | "xpath", expression) pair, or None if the locator
+            strategy cannot be evaluated in-page.
+        """
+        if not isinstance(locator, tuple) or len(locator) != 2:
+            return None
+        by, value = locator
+        selectors = {
+            By.CSS_SELECTOR: ("css", value),
+            By.XPATH: ("xpath", value),
+            By.ID: ("css", f'[id="{value}"]'),
+            By.NAME: ("css", f'[name="{value}"]'),
+            By.CLASS_NAME: ("css", f".{value}"),
+            By.TAG_NAME: ("css", value),
+            By.LINK_TEXT: ("xpath", f'//a[normalize-space(.)="{value}"]'),
+        }
+        return selectors.get(by)
+
+    def supports(self, locator: Any) -> bool:
+        """
+        Checks whether the locator can be evaluated by this backend.
+
+        Args:
+            locator: The locator to check.
+
+        Returns:
+            bool: True if the locator can be evaluated in-page, otherwise False.
+        """
+        return self.to_selector(locator) is not None
+
+    def until(self, condition: str, locator: tuple) -> Any:
+        """
+        Waits in the browser until the condition holds for the given locator.
+
+        Args:
+            condition (str): The condition name (e.g. "visible", "clickable").
+            locator (tuple): A tuple representing the locator strategy and value
+            (e.g., (By.ID, 'element_id')).
+
+        Returns:
+            The WebElement (or list of WebElements) satisfying the condition, or
+            True for the "invisible" condition.
+
+        Raises:
+            TimeoutException: If the condition did not become true within the timeout.
+        """
+        kind, selector = self.to_selector(locator)
+        deadline = time.monotonic() + self.timeout
+        with utils.script_timeout(self.driver, self.timeout + 1):
+            while True:
+                remaining = max(0.0, deadline - time.monotonic())
+                try:
+                    result = self.driver.execute_async_script(
+                        CONDITION_SCRIPT, kind, selector, condition, remaining * 1000)
+                    break
+                except (JavascriptException, StaleElementReferenceException) as e:
+                    interrupted = isinstance(e, StaleElementReferenceException) or (
+                        "unload" in str(e))
+                    if not interrupted or remaining <= 0:
+                        raise
+                    self.logger.debug("Retrying wait for %s interrupted by: %s", locator, e)
+        if not result:
+            raise TimeoutException(
+                f"Condition '{condition}' not met for {locator} after {self.timeout}s")
+        return result
@@ -0,0 +1,285 @@
+"""
+Module running a data-driven search sweep over the game catalog.
+"""
+import argparse
+import contextlib
+import csv
+import heapq
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict, Iterator, Tuple
+
+from config import config
+from drivers.driver_pool import DriverPool
+from drivers.session_governor import SessionGovernor
+from pages.home_page import HomePage
+from pages.search_page import SearchPage
+from utilities import utils
+from utilities.logger import Logger
+from utilities.web_vitals import WebVitals
+
+TAIL_BYTES = 65536
+SLOWEST_QUERIES = 20
+
+
+class SearchSweep:
+    """
+    Searches every title of a catalog (CSV with a header row, or JSON lines) and records
+    the result count, latency and top channels of each query.
+
+    The catalog is split into `shards` by line number and each shard runs in its own
+    process with one warm session from its `DriverPool`, reset between queries. Neither
+    the catalog nor the results are ever held in memory: the catalog is streamed line by
+    line and each result is appended and flushed to `<results_dir>/shard-<i>-of-<n>.jsonl`
+    as soon as the query finished. Queries are handled in catalog order, so an
+    interrupted shard resumes after the last result of its file; a run with a different
+    number of shards starts over. Failed queries are recorded with their error and
+    searched again when the sweep runs with `retry_errors`.
+
+    Usage:
+        python -m utilities.search_sweep data/catalog.csv --shards 4
+    """
+    logger = Logger(__name__)
+
+    def __init__(self, catalog: str = config.SWEEP_CATALOG, shards: int = config.SWEEP_SHARDS,
+                 results_dir: str = config.SWEEP_RESULTS_DIR, retry_errors: bool = False) -> None:
+        self.catalog = catalog
+        self.shards = shards
+        self.retry_errors = retry_errors
+        self.root = utils.get_root_path()
+        self.results_dir = f"{self.root}/{results_dir}"
+
+    def queries(self) -> Iterator[Tuple[int, str]]:
+        """
+        Streams the queries of the catalog.
+
+        Returns:
+            Iterator[Tuple[int, str]]: The line number (from 0, without the CSV header)
+            and the `config.SWEEP_QUERY_FIELD` value of every entry.
+        """
+        with open(self.catalog, encoding="utf-8", newline="") as file:
+            if self.catalog.endswith(".csv"):
+                rows = csv.DictReader(file)
+            else:
+                rows = (json.loads(line) for line in file if line.strip())
+            for index, row in enumerate(rows):
+                query = (row.get(config.SWEEP_QUERY_FIELD) or "").strip()
+                if query:
+                    yield index, query
+
+    def run(self) -> int:
+        """
+        Runs every shard in its own process and summarizes their results.
+
+        Returns:
+            int: 0 if every shard finished, otherwise the first non-zero exit code.
+        """
+        os.makedirs(self.results_dir, exist_ok=True)
+        with contextlib.ExitStack() as stack:
+            processes = []
+            for shard in range(self.shards):
+                command = [sys.executable, "-m", "utilities.search_sweep", self.catalog,
+                           "--shards", str(self.shards), "--shard", str(shard),
+                           "--results-dir", os.path.relpath(self.results_dir, self.root)]
+                if self.retry_errors:
+                    command.append("--retry-errors")
+                self.logger.info("Starting sweep shard %s: %s", shard, " ".join(command))
+                processes.append(stack.enter_context(subprocess.Popen(command, cwd=self.root)))
+            try:
+                exit_codes = [process.wait() for process in processes]
+            except KeyboardInterrupt:
+                self.logger.warning("Sweep interrupted, stopping the shards")
+                for process in processes:
+                    process.terminate()
+                raise
+        summary = self.summarize()
+        self.logger.info("Sweep summary:\n%s", json.dumps(summary, indent=2))
+        return next((code for code in exit_codes if code), 0)
+
+    def run_shard(self, shard: int) -> None:
+        """
+        Searches the queries of one shard with a single warm session, resuming after the
+        last query already recorded. The process is named "sweep<shard>" in its logs,
+        driver pool and artifacts.
+
+        Args:
+            shard (int): The index of the shard, from 0 to `shards` - 1.
+        """
+        utils.set_worker_id(f"sweep{shard}")
+        Logger.reconfigure()
+        results_file = f"{self.results_dir}/shard-{shard}-of-{self.shards}.jsonl"
+        os.makedirs(self.results_dir, exist_ok=True)
+        resume_after = self._resume_point(results_file)
+        if resume_after >= 0:
+            self.logger.info("Resuming shard %s after catalog line %s", shard, resume_after)
+        pool = DriverPool.for_worker()
+        done = 0
+        try:
+            if self.retry_errors and resume_after >= 0:
+                done += self._retry_failed(pool, results_file)
+            with open(results_file, "a", encoding="utf-8") as results:
+                for index, query in self.queries():
+                    if index % self.shards != shard or index <= resume_after:
+                        continue
+                    result = self.search(pool, query)
+                    results.write(json.dumps({"index": index, **result}) + "\n")
+                    results.flush()
+                    done += 1
+        finally:
+            pool.close()
+            self.logger.info("Shard %s searched %s queries", shard, done)
+
+    def search(self, pool: DriverPool, query: str) -> Dict[str, Any]:
+        """
+        Searches one query on a pooled session.
+
+        Args:
+            pool (DriverPool): The pool of the shard.
+            query (str): The text to search for.
+
+        Returns:
+            dict: The query, the number of channels on the first result page, the latency
+            (in ms) from submitting the search to stable results, the first
+            `config.SWEEP_TOP_CHANNELS` channels, the budget violations and any error.
+        """
+        result = {"query": query, "time": time.time(), "worker": utils.get_worker_id(),
+                  "result_count": None, "latency_ms": None, "top_channels": [], "error": None}
+        driver = pool.acquire()
+        for instrument in ("command_tracer", "request_blocker", "diagnostics"):
+            if getattr(driver, instrument, None):
+                getattr(driver, instrument).reset()
+        failed = False
+        try:
+            HomePage(driver).click_on_search()
+            search_page = SearchPage(driver)
+            start = time.perf_counter()
+            search_page.search(query)
+            search_page.click_on_menu(config.SWEEP_MENU_OPTION)
+            search_page.wait_for_page_to_load()
+            records = search_page.read_elements(search_page.streamers, ["text"])
+            result["latency_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            result["result_count"] = len(records)
+            result["top_channels"] = [record["text"].split("\n")[0]
+                                      for record in records[:config.SWEEP_TOP_CHANNELS]]
+        except Exception as e:
+            failed = True
+            result["error"] = repr(e)
+            self.logger.warning("Search for '%s' failed: %s", query, e)
+        finally:
+            pool.release(driver, failed=failed)
+            # Drained per query, so the class-level lists do not grow with the catalog.
+            result["budget_violations"] = WebVitals.take_violations()
+            SessionGovernor.take_decisions()
+        return result
+
+    def _retry_failed(self, pool: DriverPool, results_file: str) -> int:
+        """
+        Searches the failed queries of a shard file again, rewriting the file in catalog
+        order with the new results. The file is replaced only once every failed query
+        was retried, so an interruption leaves it unchanged.
+
+        Returns:
+            int: The number of queries searched again.
+        """
+        retried = 0
+        tmp_file = f"{results_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as results:
+            for result in self._read(results_file):
+                if result["error"] is not None:
+                    result = {"index": result["index"], **self.search(pool, result["query"])}
+                    retried += 1
+                results.write(json.dumps(result) + "\n")
+        os.replace(tmp_file, results_file)
+        self.logger.info("Retried %s failed queries of: %s", retried, results_file)
+        return retried
+
+    def summarize(self) -> Dict[str, Any]:
+        """
+        Streams the results of every shard into a summary, written to `summary.json`
+        next to them.
+
+        Returns:
+            dict: The number of queries, errors and queries without results, the mean
+            and maximum latency and the slowest queries.
+        """
+        summary = {"queries": 0, "errors": 0, "no_results": 0, "mean_latency_ms": None,
+                   "max_latency_ms": None, "slowest": []}
+        total_latency, timed, slowest = 0.0, 0, []
+        for shard in range(self.shards):
+            path = f"{self.results_dir}/shard-{shard}-of-{self.shards}.jsonl"
+            if not os.path.exists(path):
+                continue
+            for result in self._read(path):
+                summary["queries"] += 1
+                summary["errors"] += result["error"] is not None
+                summary["no_results"] += result["result_count"] == 0
+                if result["latency_ms"] is not None:
+                    total_latency += result["latency_ms"]
+                    timed += 1
+                    entry = (result["latency_ms"], result["query"])
+                    if len(slowest) < SLOWEST_QUERIES:
+                        heapq.heappush(slowest, entry)
+                    else:
+                        heapq.heappushpop(slowest, entry)
+        if timed:
+            summary["mean_latency_ms"] = round(total_latency / timed, 1)
+            summary["max_latency_ms"] = max(slowest)[0]
+        summary["slowest"] = [{"query": query, "latency_ms": latency}
+                              for latency, query in sorted(slowest, reverse=True)]
+        with open(f"{self.results_dir}/summary.json", "w", encoding="utf-8") as file:
+            json.dump(summary, file, indent=2)
+        return summary
+
+    @staticmethod
+    def _resume_point(path: str) -> int:
+        """
+        Returns the catalog line of the last result of a shard file, reading only its
+        tail. A partial last line, left by an interruption, is cut off first.
+
+        Returns:
+            int: The line number, or -1 if the shard has no results yet.
+        """
+        if not os.path.exists(path):
+            return -1
+        with open(path, "rb+") as file:
+            size = file.seek(0, os.SEEK_END)
+            file.seek(max(0, size - TAIL_BYTES))
+            tail = file.read()
+            if tail and not tail.endswith(b"\n"):
+                file.truncate(size - len(tail) + tail.rfind(b"\n") + 1)
+                tail = tail[:tail.rfind(b"\n") + 1]
+        for line in reversed(tail.splitlines()):
+            try:
+                return json.loads(line)["index"]
+            except (ValueError, KeyError):
+                continue
+        return -1
+
+    @staticmethod
+    def _read(path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Streams the results of a shard file.
+        """
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search every title of a catalog.")
+    parser.add_argument("catalog", nargs="?", default=config.SWEEP_CATALOG,
+                        help="CSV file with a header row, or JSON-lines file.")
+    parser.add_argument("--shards", type=int, default=config.SWEEP_SHARDS)
+    parser.add_argument("--shard", type=int, help="Run only this shard in this process.")
+    parser.add_argument("--results-dir", default=config.SWEEP_RESULTS_DIR)
+    parser.add_argument("--retry-errors", action="store_true",
+                        help="Search the queries that failed in a previous run again.")
+    args = parser.parse_args()
+    sweep = SearchSweep(args.catalog, args.shards, args.results_dir, args.retry_errors)
+    if args.shard is None:
+        sys.exit(sweep.run())
+    sweep.run_shard(args.shard)
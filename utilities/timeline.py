@@ -0,0 +1,251 @@
+"""
+Module providing a combined browser trace and page-object span timeline.
+"""
+import collections
+import functools
+import gzip
+import inspect
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from config import config
+from utilities import utils
+from utilities.logger import Logger
+
+CLOCK_SYNC_MARK = "wap-clock-sync"
+
+
+class Timeline:
+    """
+    Records the page-object method calls of a test as spans and merges them with the
+    Chromium DevTools trace of its browser into one Trace Event Format file, which opens
+    in chrome://tracing or https://ui.perfetto.dev.
+
+    The browser trace is recorded by the driver itself (the `traceCategories` of its
+    performance logging preferences, see `DriverPool.for_worker(traced=True)`) and read
+    from the performance log when the test ends. Spans are timed with the monotonic
+    clock and shifted onto the browser's clock using a `performance.mark` placed while
+    tracing, so client-side waits and browser work share one time axis.
+
+    Both buffers are bounded: at most `config.TIMELINE_MAX_SPANS` spans and
+    `config.TIMELINE_MAX_EVENTS` trace events (the most recent ones) are kept.
+    """
+    logger = Logger(__name__)
+    active = False
+    spans: collections.deque = collections.deque(maxlen=config.TIMELINE_MAX_SPANS)
+    _actions = threading.local()
+
+    @classmethod
+    def current_action(cls) -> Optional[str]:
+        """
+        Returns the innermost page-object method running on the current thread.
+
+        Returns:
+            str: The "Class.method" of the page action, or None outside page objects.
+        """
+        stack = getattr(cls._actions, "stack", None)
+        return stack[-1] if stack else None
+
+    @classmethod
+    def traced(cls, method: Callable) -> Callable:
+        """
+        Wraps a page-object method so each call is logged as a structured page action
+        (method, locator and duration) and, while a timeline is active, recorded as a span.
+
+        Calling a generator method only creates the generator, so for those each resume
+        of the generator is recorded as a span instead, and the action is logged with
+        the time spent inside the generator once it is exhausted or closed.
+
+        Args:
+            method (Callable): The method to wrap.
+
+        Returns:
+            Callable: The wrapped method.
+        """
+        if inspect.isgeneratorfunction(method):
+            return cls._traced_generator(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            name = f"{type(self).__name__}.{method.__name__}"
+            stack = cls._actions.__dict__.setdefault("stack", [])
+            stack.append(name)
+            start = time.monotonic()
+            error = None
+            try:
+                return method(self, *args, **kwargs)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                duration = time.monotonic() - start
+                stack.pop()
+                cls._record_span(name, start, duration, error)
+                cls._log_action(name, args, duration, error)
+        return wrapper
+
+    @classmethod
+    def _traced_generator(cls, method: Callable) -> Callable:
+        """
+        Wraps a page-object generator method, timing the work done in each resume.
+        """
+        @functools.wraps(method)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            name = f"{type(self).__name__}.{method.__name__}"
+            stack = cls._actions.__dict__.setdefault("stack", [])
+            generator = method(self, *args, **kwargs)
+            total = 0.0
+            error = None
+            try:
+                while True:
+                    stack.append(name)
+                    start = time.monotonic()
+                    try:
+                        item = next(generator)
+                    except StopIteration as stop:
+                        return stop.value
+                    except Exception as e:
+                        error = e
+                        raise
+                    finally:
+                        duration = time.monotonic() - start
+                        total += duration
+                        stack.pop()
+                        cls._record_span(name, start, duration, error)
+                    yield item
+            finally:
+                generator.close()
+                cls._log_action(name, args, total, error)
+        return wrapper
+
+    @classmethod
+    def _record_span(cls, name: str, start: float, duration: float,
+                     error: Optional[Exception]) -> None:
+        """
+        Records a span of a page action while a timeline is active.
+        """
+        if cls.active:
+            cls.spans.append((name, start, duration, threading.get_ident(),
+                              repr(error) if error else None))
+
+    @classmethod
+    def _log_action(cls, name: str, args: tuple, duration: float,
+                    error: Optional[Exception]) -> None:
+        """
+        Logs a page action with its locator and duration as structured fields.
+        """
+        cls.logger.debug("Page action %s took %.1f ms", name, duration * 1e3,
+                         method=name,
+                         locator=next((arg for arg in args if isinstance(arg, tuple)), None),
+                         duration_ms=round(duration * 1e3, 3), failed=error is not None)
+
+    @classmethod
+    def trace_methods(cls, page_class: type) -> None:
+        """
+        Wraps the public methods defined by a page-object class with `traced`.
+
+        Args:
+            page_class (type): The page-object class.
+        """
+        for name, member in list(vars(page_class).items()):
+            if not name.startswith("_") and inspect.isfunction(member):
+                setattr(page_class, name, cls.traced(member))
+
+    @classmethod
+    def start(cls) -> None:
+        """
+        Starts recording the spans of a test.
+        """
+        cls.spans.clear()
+        cls.active = True
+
+    @classmethod
+    def stop(cls, driver: Any) -> str:
+        """
+        Stops recording, collects the browser trace and writes the merged timeline to
+        `data/timelines`.
+
+        Args:
+            driver (WebDriver): The traced driver of the test.
+
+        Returns:
+            str: The path of the gzipped timeline file.
+        """
+        cls.active = False
+        sync_start = time.monotonic()
+        try:
+            driver.execute_script(f"performance.mark('{CLOCK_SYNC_MARK}');")
+        except Exception as e:
+            cls.logger.warning("Could not place the clock sync mark: %s", e)
+        sync_time = (sync_start + time.monotonic()) / 2
+        trace_events = cls._trace_events(driver)
+
+        sync_event = next((event for event in trace_events
+                           if event.get("name") == CLOCK_SYNC_MARK), None)
+        # Without a sync mark the clocks are assumed equal, which holds for a local
+        # Chromium on Linux (both use CLOCK_MONOTONIC).
+        offset_us = sync_event["ts"] - sync_time * 1e6 if sync_event else 0.0
+        pid = os.getpid()
+        events = trace_events + [
+            {"name": "process_name", "ph": "M", "pid": pid,
+             "args": {"name": f"pytest {utils.get_worker_id()}"}},
+        ] + [
+            {"name": name, "cat": "wap.page", "ph": "X", "pid": pid, "tid": tid,
+             "ts": start * 1e6 + offset_us, "dur": duration * 1e6,
+             "args": {"error": error} if error else {}}
+            for name, start, duration, tid, error in cls.spans
+        ]
+
+        file_path = utils.get_artifact_path("timelines", "timeline.json.gz")
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with gzip.open(file_path, "wt", encoding="utf-8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms",
+                       "metadata": {"test": utils.get_test_id(),
+                                    "clock_synced": sync_event is not None,
+                                    "categories": config.TIMELINE_CATEGORIES}}, file)
+        cls.logger.info("Timeline with %s trace events and %s spans written to: %s",
+                        len(trace_events), len(cls.spans), file_path)
+        return file_path
+
+    @classmethod
+    def is_requested(cls, node: Any) -> bool:
+        """
+        Checks whether a test must be traced, i.e. it has the `trace` marker or
+        `config.TIMELINE_TRACING` is "always".
+
+        Args:
+            node (pytest.Item): The test.
+
+        Returns:
+            bool: True if the test is traced.
+        """
+        if config.TIMELINE_TRACING == "always":
+            return True
+        return config.TIMELINE_TRACING == "marker" and node.get_closest_marker("trace") is not None
+
+    @staticmethod
+    def _trace_events(driver: Any) -> List[Dict[str, Any]]:
+        """
+        Drains the performance log, keeping its trace events. The other entries are left
+        in `driver.performance_backlog` for the request blocker.
+        """
+        try:
+            entries = driver.get_log("performance")
+        except Exception as e:
+            Timeline.logger.warning("The driver has no performance log to trace: %s", e)
+            return []
+        events, backlog = [], []
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            if message["method"] == "Tracing.dataCollected":
+                events.append(message["params"])
+            elif message["method"] == "Tracing.bufferUsage":
+                if message["params"].get("percentFull", 0) >= 1:
+                    Timeline.logger.warning("The browser trace buffer is full, events were lost")
+            else:
+                backlog.append(entry)
+        driver.performance_backlog = getattr(driver, "performance_backlog", []) + backlog
+        return events[-config.TIMELINE_MAX_EVENTS:]
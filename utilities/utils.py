@@ -1,7 +1,13 @@
 """
 Module of all utilities for the project.
 """
+import contextlib
 import os
+from typing import Any, Iterator
+
+from config import config
+
+_worker_id = None
 
 
 def get_root_path() -> str:
@@ -15,3 +21,83 @@ def get_root_path() -> str:
     root_path = os.path.dirname(dir_path)
 
     return root_path
+
+
+def get_worker_id() -> str:
+    """
+    Get the pytest-xdist worker id of the current process.
+
+    Returns:
+        str: The id set with `set_worker_id`, otherwise the worker id (e.g. "gw0"), or
+        "master" when xdist is not used.
+    """
+    return _worker_id or os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def set_worker_id(worker_id: str) -> None:
+    """
+    Names the current process for its logs, pools and artifacts when it runs outside
+    pytest-xdist (e.g. a shard of the search sweep).
+
+    Args:
+        worker_id (str): The id of the process (e.g. "sweep0").
+    """
+    global _worker_id  # pylint: disable=global-statement
+    _worker_id = worker_id
+
+
+def get_test_id() -> str:
+    """
+    Get the pytest node id of the test currently running in this process.
+
+    Returns:
+        str: The node id (e.g. "tests/test_a.py::TestA::test_b"), or "session"
+        outside of a test.
+    """
+    current = os.environ.get("PYTEST_CURRENT_TEST", "session")
+    return current.rsplit(" ", 1)[0]
+
+
+def get_artifact_path(folder: str, file_name: str) -> str:
+    """
+    Get a path under the data directory that is unique per matrix combination, worker
+    and test, so parallel runs never write the same file.
+
+    Args:
+        folder (str): The folder under `data/` (e.g. "screenshots").
+        file_name (str): The base file name (e.g. "streamer.png").
+
+    Returns:
+        str: The path `data/<folder>/[<combination>-]<worker>-<test>-<file_name>` under
+        the project root.
+    """
+    test_id = "".join(char if char.isalnum() else "_" for char in get_test_id())
+    prefix = f"{config.MATRIX_COMBINATION}-" if config.MATRIX_COMBINATION else ""
+    return f"{get_root_path()}/data/{folder}/{prefix}{get_worker_id()}-{test_id}-{file_name}"
+
+
+@contextlib.contextmanager
+def script_timeout(driver: Any, seconds: float) -> Iterator[None]:
+    """
+    Raises the script timeout of a driver to at least `seconds` while the block runs and
+    restores it afterwards, so pooled sessions keep their timeout for later tests.
+
+    The timeout of the session is read once and cached on the driver as
+    `script_timeout`, so a block normally costs no WebDriver round-trip at all.
+
+    Args:
+        driver (WebDriver): The driver running the scripts.
+        seconds (float): The minimum script timeout, in seconds, the block needs.
+    """
+    previous = getattr(driver, "script_timeout", None)
+    if previous is None:
+        previous = driver.timeouts.script
+        driver.script_timeout = previous
+    if previous >= seconds:
+        yield
+        return
+    driver.set_script_timeout(seconds)
+    try:
+        yield
+    finally:
+        driver.set_script_timeout(previous)
@@ -0,0 +1,129 @@
+"""
+Module providing in-page web performance metrics and per-page budgets.
+"""
+import json
+import os
+import time
+from typing import Any, Dict, List
+
+from config import config
+from utilities import utils
+from utilities.logger import Logger
+
+# Installs buffered PerformanceObservers once per document (buffered entries include
+# everything since navigation start, so installing late loses nothing) and returns a
+# snapshot of every metric in the same call. Observers only receive their entries in a
+# later task, so pending ones, including the buffered entries of observers installed in
+# this call, are taken from them synchronously first.
+COLLECT_SCRIPT = """
+if (!window.__wapVitals) {
+    var state = {fcp: null, lcp: null, longTasks: 0, longTaskMs: 0, cls: 0, observers: []};
+    var observe = function (type, callback) {
+        try {
+            var observer = new PerformanceObserver(function (list) {
+                list.getEntries().forEach(callback);
+            });
+            observer.observe({type: type, buffered: true});
+            state.observers.push({observer: observer, callback: callback});
+        } catch (e) {}
+    };
+    observe('paint', function (e) {
+        if (e.name === 'first-contentful-paint') { state.fcp = e.startTime; }
+    });
+    observe('largest-contentful-paint', function (e) { state.lcp = e.startTime; });
+    observe('longtask', function (e) { state.longTasks++; state.longTaskMs += e.duration; });
+    observe('layout-shift', function (e) { if (!e.hadRecentInput) { state.cls += e.value; } });
+    window.__wapVitals = state;
+}
+var state = window.__wapVitals;
+state.observers.forEach(function (o) { o.observer.takeRecords().forEach(o.callback); });
+var nav = performance.getEntriesByType('navigation')[0] || {};
+var resources = performance.getEntriesByType('resource');
+var bytes = resources.reduce(function (total, e) { return total + (e.transferSize || 0); },
+                             nav.transferSize || 0);
+return {
+    url: location.href,
+    ttfb_ms: nav.responseStart || null,
+    dom_content_loaded_ms: nav.domContentLoadedEventEnd || null,
+    load_ms: nav.loadEventEnd || null,
+    fcp_ms: state.fcp,
+    lcp_ms: state.lcp,
+    long_tasks: state.longTasks,
+    long_task_ms: state.longTaskMs,
+    cls: state.cls,
+    resources: resources.length,
+    transferred_bytes: bytes
+};
+"""
+
+
+class WebVitals:
+    """
+    Collects Navigation Timing, paint timings (FCP, LCP), long tasks, layout shifts and
+    transferred bytes of the current document in a single script call, appends them to
+    the `config.PERFORMANCE_HISTORY` time series and checks them against a budget.
+
+    Budget violations are kept in `violations` rather than raised, so the whole flow is
+    measured; once the test finished they fail it, or are only added to its report when
+    `config.PERFORMANCE_BUDGETS` is disabled (see tests/conftest.py).
+
+    Attributes:
+        driver: An instance of the Selenium WebDriver.
+    """
+    logger = Logger(__name__)
+    violations: List[str] = []
+
+    def __init__(self, driver: Any) -> None:
+        self.driver = driver
+
+    def collect(self, page: str, action: str, budget: Dict[str, float] = None) -> Dict[str, Any]:
+        """
+        Reads the metrics of the current document and records them.
+
+        Args:
+            page (str): The name of the page object.
+            action (str): The action after which the metrics are read (e.g. "load").
+            budget (dict): Optional maximum value of each metric.
+
+        Returns:
+            dict: The metrics. Timings are milliseconds since navigation start and are
+            None when the browser does not support them.
+        """
+        metrics = self.driver.execute_script(COLLECT_SCRIPT)
+        record = {"time": time.time(), "test": utils.get_test_id(),
+                  "worker": utils.get_worker_id(), "browser": config.BROWSER,
+                  "combination": config.MATRIX_COMBINATION, "page": page, "action": action,
+                  "metrics": metrics}
+        self._append(record)
+        self.logger.info("Performance of %s after %s: LCP %s ms, CLS %.3f, %s bytes",
+                         page, action, metrics["lcp_ms"], metrics["cls"],
+                         metrics["transferred_bytes"])
+        for name, limit in (budget or {}).items():
+            value = metrics.get(name)
+            if value is not None and value > limit:
+                violation = f"{page} after {action}: {name} {value:.3f} exceeds budget {limit}"
+                self.logger.warning("Performance budget exceeded: %s", violation)
+                self.violations.append(violation)
+        return metrics
+
+    @classmethod
+    def take_violations(cls) -> List[str]:
+        """
+        Returns the budget violations recorded since the last call and forgets them.
+
+        Returns:
+            List[str]: A description of every violation.
+        """
+        violations, cls.violations = cls.violations, []
+        return violations
+
+    @staticmethod
+    def _append(record: Dict[str, Any]) -> None:
+        """
+        Appends a record to the time series. Each record is a single short write to a
+        file opened in append mode, so concurrent workers never interleave lines.
+        """
+        path = f"{utils.get_root_path()}/{config.PERFORMANCE_HISTORY}"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")